@@ -0,0 +1,133 @@
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+class AlgorithmSelector:
+    """
+    Elección del algoritmo de ordenamiento a partir de un perfil de los datos.
+    
+    El perfil se calcula sobre la clave ya codificada por SortKeys (enteros
+    densos no negativos), así que cuesta una o dos pasadas vectorizadas y sirve
+    igual para una o varias columnas. Los umbrales salen de las mediciones de
+    benchmark.py: sobre claves codificadas, "Columnar (NumPy)" gana a todos los
+    algoritmos por registros desde unas pocas decenas de filas.
+    """
+    
+    # Hasta esta cantidad de filas la inserción no paga la preparación de NumPy
+    SMALL_INPUT = 16
+    # Si la clave codificada es menor que esto entra en 16 bits y NumPy usa radix sort
+    RADIX_RANGE = 1 << 16
+    # Proporción mínima de pares consecutivos en orden para considerar los datos casi ordenados
+    PRESORTED = 0.99
+    # Proporción de claves repetidas a partir de la cual el paralelo reparte mal las particiones
+    HEAVY_DUPLICATES = 0.5
+    # Claves que se muestrean para estimar la proporción de repetidas
+    SAMPLE_SIZE = 10000
+    
+    @staticmethod
+    def profile(keys, data=None, columns=()):
+        """
+        Describe los datos a ordenar.
+        
+        Args:
+            keys (numpy.ndarray): Clave codificada con SortKeys.encode.
+            data (pandas.DataFrame, optional): Dataset, para informar el tipo y los nulos.
+            columns (iterable): Columnas de la clave, de mayor a menor prioridad.
+            
+        Returns:
+            dict: rows, dtype (de la primera columna), has_nulls, runs (tramos
+            ascendentes), presortedness (proporción de pares consecutivos en orden),
+            duplicate_ratio (estimada con una muestra) y key_range (máxima clave + 1).
+        """
+        columns = list(columns)
+        rows = len(keys)
+        descents = int(np.count_nonzero(keys[1:] < keys[:-1])) if rows > 1 else 0
+        
+        sample = keys
+        if rows > AlgorithmSelector.SAMPLE_SIZE:
+            # Muestra reproducible y sin reemplazo, para no contar como repetida una misma fila
+            sample = keys[np.random.default_rng(0).choice(rows, AlgorithmSelector.SAMPLE_SIZE, replace=False)]
+        duplicate_ratio = 1 - len(np.unique(sample)) / len(sample) if len(sample) else 0.0
+        
+        has_nulls = None
+        dtype = None
+        if data is not None and columns:
+            dtype = str(data[columns[0]].dtype)
+            has_nulls = any(data[column].hasnans for column in columns)
+            
+        return {
+            "rows": rows,
+            "dtype": dtype,
+            "has_nulls": has_nulls,
+            "runs": descents + 1 if rows else 0,
+            "presortedness": 1 - descents / (rows - 1) if rows > 1 else 1.0,
+            "duplicate_ratio": round(duplicate_ratio, 4),
+            "key_range": int(keys.max()) + 1 if rows else 0
+        }
+        
+    @staticmethod
+    def choose(profile, parallel_workers=1, parallel_min_size=500000):
+        """
+        Elige el algoritmo más rápido para un perfil.
+        
+        Args:
+            profile (dict): Perfil calculado con profile.
+            parallel_workers (int): Procesos disponibles para el ordenamiento en paralelo.
+            parallel_min_size (int): Filas mínimas para que el paralelo no ordene en serie.
+            
+        Returns:
+            tuple: (nombre del algoritmo, lista de motivos de la elección).
+        """
+        rows = profile["rows"]
+        reasons = []
+        if profile["has_nulls"]:
+            reasons.append("los nulos ya están ubicados en la clave codificada: no cambian la elección")
+            
+        if rows <= AlgorithmSelector.SMALL_INPUT:
+            reasons.append(f"{rows} filas: la inserción no tiene costo de preparación y es tan rápida como NumPy")
+            return "Inserción", reasons
+            
+        if profile["key_range"] <= AlgorithmSelector.RADIX_RANGE:
+            reasons.append(f"claves codificadas entre 0 y {profile['key_range'] - 1}: se ordenan como enteros de 8 o 16 bits "
+                           "con el radix sort de NumPy, en tiempo lineal")
+            return "Columnar (NumPy)", reasons
+            
+        if profile["presortedness"] >= AlgorithmSelector.PRESORTED:
+            reasons.append(f"datos casi ordenados ({profile['runs']} tramos ascendentes): el ordenamiento estable "
+                           "de NumPy aprovecha los tramos existentes")
+            return "Columnar (NumPy)", reasons
+            
+        if parallel_workers < 2:
+            reasons.append("un solo núcleo disponible: el paralelo ordenaría en serie")
+        elif rows < parallel_min_size:
+            reasons.append(f"{rows} filas: menos que las {parallel_min_size} que amortizan repartir el trabajo entre procesos")
+        elif profile["duplicate_ratio"] >= AlgorithmSelector.HEAVY_DUPLICATES:
+            reasons.append(f"{profile['duplicate_ratio']:.0%} de claves repetidas: las particiones del paralelo quedarían desbalanceadas")
+        else:
+            reasons.append(f"{rows} filas desordenadas y {parallel_workers} núcleos: se ordenan por partes en paralelo")
+            return "Paralelo (multinúcleo)", reasons
+            
+        reasons.append("ordenamiento vectorizado de NumPy: el más rápido en serie sobre claves enteras")
+        return "Columnar (NumPy)", reasons
+        
+    @staticmethod
+    def narrow(keys, profile):
+        """
+        Reduce la clave al entero sin signo más chico que la contiene.
+        
+        Con claves de 8 o 16 bits el ordenamiento estable de NumPy usa radix sort,
+        varias veces más rápido que el timsort de las claves int64.
+        
+        Args:
+            keys (numpy.ndarray): Clave codificada (enteros no negativos).
+            profile (dict): Perfil calculado con profile.
+            
+        Returns:
+            numpy.ndarray: Clave reducida, o la misma si no entra en 16 bits.
+        """
+        key_range = profile["key_range"]
+        if key_range <= 1 << 8:
+            return keys.astype(np.uint8)
+        if key_range <= AlgorithmSelector.RADIX_RANGE:
+            return keys.astype(np.uint16)
+        return keys
@@ -1,22 +1,50 @@
-import requests
-import pandas as pd
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from lazy_imports import lazy_import
+from instrumentation import Instrumentation, NULL_RECORD
+from dataset_compactor import DatasetCompactor
+from json_stream import JSONArrayParser, ColumnBuffers
+
+requests = lazy_import("requests")
+pd = lazy_import("pandas")
 
 class APIHandler:
     """
     Clase para manejar el consumo de una API y obtener un dataset.
     """
     
-    def __init__(self, api_url=None, api_key=None):
+    def __init__(self, api_url=None, api_key=None, cache=None, instrumentation=None, compactor=None):
         """
         Inicializa el manejador de API con una URL opcional y una API key opcional.
         
         Args:
             api_url (str, optional): URL de la API a consumir. Si no se proporciona, se usará una API por defecto.
             api_key (str, optional): Clave API para la autenticación.
+            cache (ResponseCache, optional): Caché en disco para las respuestas de la API.
+            instrumentation (Instrumentation, optional): Registro de tiempos por etapa.
+                Por defecto, uno desactivado.
+            compactor (DatasetCompactor, optional): Compactación de los datos descargados.
+                Por defecto, la estándar; asignar None al atributo la desactiva.
         """
         self.api_url = api_url if api_url else "https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page=100&page=1"
         self.api_key = api_key
         self.data = None
+        self.cache = cache
+        self.instrumentation = instrumentation or Instrumentation()
+        self.compactor = compactor or DatasetCompactor()
+        
+        # Parámetros de red compartidos por todas las peticiones
+        self.timeout = 30
+        self.max_retries = 5
+        self.backoff_factor = 1.0
+        self.max_workers = 4
+        self.stream_chunk_size = 64 * 1024
+        self._session = None
+        self._session_lock = threading.Lock()
         
     def set_api_url(self, url):
         """
@@ -36,33 +64,111 @@ class APIHandler:
         """
         self.api_key = api_key
         
-    def fetch_data(self):
+    def set_cache(self, cache):
+        """
+        Establece la caché de respuestas a utilizar.
+        
+        Args:
+            cache (ResponseCache): Caché en disco, o None para desactivarla.
+        """
+        self.cache = cache
+        
+    def fetch_data(self, progress=None, revalidate=False):
         """
         Realiza la petición a la API y obtiene los datos.
         
+        Args:
+            progress (callable, optional): Recibe (fracción, mensaje) en cada etapa;
+                puede cancelar la descarga lanzando una excepción.
+            revalidate (bool): True para consultar siempre a la API aunque la caché esté
+                vigente (se envían igualmente ETag/Last-Modified para recibir 304).
+        
         Returns:
             pandas.DataFrame: DataFrame con los datos obtenidos de la API, o None si hay error.
         """
+        with self.instrumentation.operation("fetch", url=self.api_url) as record:
+            df = self._fetch_data(progress, record, revalidate)
+            record.set("rows", len(df) if df is not None else 0)
+        return df
+        
+    def _fetch_data(self, progress, record, revalidate=False):
+        """
+        Realiza la petición a la API registrando la duración de cada etapa.
+        
+        Args:
+            progress (callable, optional): Recibe (fracción, mensaje) en cada etapa.
+            record (OperationRecord): Medición de la descarga.
+            revalidate (bool): True para ignorar la vigencia de la caché.
+            
+        Returns:
+            pandas.DataFrame: DataFrame con los datos obtenidos, o None si hay error.
+        """
         try:
-            # Configurar headers con la API key si está disponible
-            headers = {}
-            if self.api_key:
-                headers['Authorization'] = f'Bearer {self.api_key}'
-                # Algunas APIs utilizan otros formatos de autenticación
-                # headers['X-API-Key'] = self.api_key
-            
-            response = requests.get(self.api_url, headers=headers)
-            response.raise_for_status()  # Verifica si la petición fue exitosa
-            data = response.json()
-            
-            # Convertir a DataFrame de pandas para mejor manejo
-            df = pd.DataFrame(data)
-            
-            # Verificar que el dataset contiene al menos dos variables numéricas
-            numeric_columns = df.select_dtypes(include=['number']).columns
-            if len(numeric_columns) < 2:
-                print("El dataset debe contener al menos dos variables numéricas.")
-                return None
+            headers = self._build_headers()
+            
+            # Consultar la caché antes de ir a la red
+            cache_key = None
+            entry = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(self.api_url, headers.get('Authorization', ''))
+                with record.phase("cache"):
+                    entry = self.cache.get(cache_key)
+                    df = None
+                    if entry is not None and entry.is_fresh() and not revalidate:
+                        df = entry.load_data()
+                        if df is None:
+                            # Entrada dañada (la caché ya la eliminó): pedir los datos completos
+                            entry = None
+                if df is not None:
+                    record.set("source", "cache")
+                    self.data = df
+                    return df
+                if entry is not None:
+                    headers.update(entry.validation_headers())
+                    
+            if progress is not None:
+                progress(0, "Descargando datos")
+            with record.phase("network"):
+                response = self._get(self.api_url, headers, stream=True)
+                
+            # 304: los datos no cambiaron, se reutiliza el dataset guardado sin parsear
+            if response.status_code == 304 and entry is not None:
+                with record.phase("cache"):
+                    df = entry.load_data()
+                if df is not None:
+                    response.close()
+                    record.set("source", "not_modified")
+                    self.cache.touch(cache_key)
+                    self.data = df
+                    return df
+                # El dataset guardado se perdió: repetir la petición sin revalidación
+                response.close()
+                with record.phase("network"):
+                    response = self._get(self.api_url, self._build_headers(), stream=True)
+                    
+            record.set("source", "network")
+            with response:
+                buffers = self._read_stream(response, record, progress)
+                
+            # Validar con los tipos detectados durante la lectura, antes de armar el DataFrame
+            with record.phase("validate"):
+                if not self._validate_columns(buffers.numeric_columns()):
+                    return None
+                    
+            if progress is not None:
+                progress(0.95, "Procesando respuesta")
+            with record.phase("dataframe"):
+                df = buffers.to_dataframe()
+            del buffers
+            df = self._compact(df, record)
+            
+            if self.cache is not None:
+                with record.phase("cache_store"):
+                    self.cache.put(
+                        cache_key, df, url=self.api_url,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
             
             self.data = df
             return df
@@ -70,6 +176,332 @@ class APIHandler:
         except requests.exceptions.RequestException as e:
             print(f"Error al consumir la API: {e}")
             return None
+        except ValueError as e:
+            print(f"La respuesta de la API no es un JSON válido: {e}")
+            return None
+            
+    def _read_stream(self, response, record, progress):
+        """
+        Lee el cuerpo de la respuesta a medida que llega y carga cada registro en columnas.
+        
+        Nunca se guarda el cuerpo completo ni la lista de registros: cada fragmento
+        se analiza apenas llega y sus registros se agregan a las columnas tipadas.
+        
+        Args:
+            response (requests.Response): Respuesta pedida con stream=True.
+            record (OperationRecord): Medición de la descarga.
+            progress (callable, optional): Recibe (fracción, mensaje) por cada fragmento.
+            
+        Returns:
+            ColumnBuffers: Columnas con todos los registros.
+            
+        Raises:
+            ValueError: Si el cuerpo no es un arreglo JSON de objetos válido.
+        """
+        parser = JSONArrayParser()
+        buffers = ColumnBuffers()
+        total = int(response.headers.get("Content-Length") or 0)
+        received = 0
+        
+        chunks = response.iter_content(chunk_size=self.stream_chunk_size)
+        while True:
+            with record.phase("network"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            received += len(chunk)
+            
+            with record.phase("json"):
+                buffers.extend(parser.feed(chunk))
+                
+            if progress is not None:
+                # Content-Length cuenta los bytes comprimidos, igual que raw.tell()
+                fraction = min(response.raw.tell() / total, 1.0) * 0.9 if total else None
+                progress(fraction, f"Descargando datos ({received // 1024} KB, {buffers.rows} registros)")
+                
+        with record.phase("json"):
+            parser.close()
+        record.set("bytes", received)
+        return buffers
+        
+    def fetch_all_pages(self, per_page=250, max_pages=None, max_workers=None, progress=None):
+        """
+        Obtiene todas las páginas de la API de forma concurrente y las une en un único dataset.
+        
+        Las páginas se piden en ventanas de tantas páginas como hilos haya, sobre una
+        sesión HTTP compartida, y sus registros se agregan en orden de página a
+        columnas tipadas. La descarga termina en la primera página vacía o más corta
+        que la primera (la API puede limitar per_page por su cuenta).
+        
+        Args:
+            per_page (int): Cantidad de registros por página.
+            max_pages (int, optional): Límite de páginas a descargar. Sin límite por defecto.
+            max_workers (int, optional): Cantidad de hilos concurrentes. Por defecto self.max_workers.
+            progress (callable, optional): Recibe (fracción, mensaje) por cada página descargada;
+                puede cancelar la descarga lanzando una excepción.
+            
+        Returns:
+            pandas.DataFrame: DataFrame con los datos de todas las páginas, o None si hay error.
+        """
+        with self.instrumentation.operation("fetch_all_pages", url=self.api_url, per_page=per_page) as record:
+            df = self._fetch_all_pages(per_page, max_pages, max_workers, progress, record)
+            record.set("rows", len(df) if df is not None else 0)
+        return df
+        
+    def _fetch_all_pages(self, per_page, max_pages, max_workers, progress, record):
+        """
+        Descarga todas las páginas registrando la duración de cada etapa.
+        
+        Las etapas "network" y "json" se miden en cada hilo y se suman, por lo que
+        pueden superar el tiempo total de la descarga.
+        
+        Args:
+            per_page (int): Cantidad de registros por página.
+            max_pages (int): Límite de páginas a descargar, o None.
+            max_workers (int): Cantidad de hilos concurrentes, o None.
+            progress (callable, optional): Recibe (fracción, mensaje) por cada página descargada.
+            record (OperationRecord): Medición de la descarga.
+            
+        Returns:
+            pandas.DataFrame: DataFrame con los datos de todas las páginas, o None si hay error.
+        """
+        max_workers = max_workers or self.max_workers
+        headers = self._build_headers()
+        
+        buffers = ColumnBuffers()
+        # Registros por página que sirve realmente la API: el largo de la primera página
+        page_size = None
+        finished = False
+        page = 1
+        pages_done = 0
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while not finished and (max_pages is None or page <= max_pages):
+                    last_page = page + max_workers - 1
+                    if max_pages is not None:
+                        last_page = min(last_page, max_pages)
+                        
+                    futures = {
+                        executor.submit(self._fetch_page, number, per_page, headers, record): number
+                        for number in range(page, last_page + 1)
+                    }
+                    
+                    # Las páginas llegan en cualquier orden pero se agregan en orden
+                    completed = {}
+                    for future in as_completed(futures):
+                        number = futures[future]
+                        completed[number] = future.result()
+                        pages_done += 1
+                        if progress is not None:
+                            fraction = pages_done / max_pages if max_pages else None
+                            progress(fraction, f"Página {number} descargada ({pages_done} en total)")
+                            
+                    for number in range(page, last_page + 1):
+                        records = completed[number]
+                        if page_size is None:
+                            page_size = len(records)
+                        with record.phase("columns"):
+                            buffers.extend(records)
+                        # La primera página vacía o incompleta marca el final del dataset
+                        if not records or len(records) < page_size:
+                            finished = True
+                            break
+                            
+                    page = last_page + 1
+                    
+        except requests.exceptions.RequestException as e:
+            print(f"Error al consumir la API: {e}")
+            return None
+        except ValueError as e:
+            print(f"La respuesta de la API no es un JSON válido: {e}")
+            return None
+            
+        record.set("pages", pages_done)
+        with record.phase("dataframe"):
+            df = buffers.to_dataframe()
+        del buffers
+        df = self._compact(df, record)
+            
+        with record.phase("validate"):
+            if not self._validate(df):
+                return None
+            
+        self.data = df
+        return df
+        
+    def _fetch_page(self, page, per_page, headers, record=NULL_RECORD):
+        """
+        Descarga una página de resultados.
+        
+        Args:
+            page (int): Número de página (desde 1).
+            per_page (int): Cantidad de registros por página.
+            headers (dict): Headers de la petición.
+            record (OperationRecord, optional): Medición donde sumar red y parseo.
+            
+        Returns:
+            list: Registros de la página.
+            
+        Raises:
+            ValueError: Si la página no es un arreglo JSON (por ejemplo, un objeto de error).
+        """
+        with record.phase("network"):
+            response = self._get(self._page_url(page, per_page), headers)
+        with record.phase("json"):
+            records = response.json()
+        if not isinstance(records, list):
+            raise ValueError(f"La página {page} no es un arreglo JSON.")
+        return records
+        
+    def _page_url(self, page, per_page):
+        """
+        Construye la URL de una página reemplazando los parámetros de paginación.
+        
+        Args:
+            page (int): Número de página.
+            per_page (int): Cantidad de registros por página.
+            
+        Returns:
+            str: URL de la página.
+        """
+        parts = urlsplit(self.api_url)
+        query = dict(parse_qsl(parts.query))
+        query["per_page"] = per_page
+        query["page"] = page
+        return urlunsplit(parts._replace(query=urlencode(query)))
+        
+    def _build_headers(self):
+        """
+        Construye los headers de la petición.
+        
+        Returns:
+            dict: Headers con la API key si está disponible.
+        """
+        headers = {}
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+            # Algunas APIs utilizan otros formatos de autenticación
+            # headers['X-API-Key'] = self.api_key
+        return headers
+        
+    def _get_session(self):
+        """
+        Obtiene la sesión HTTP compartida, creándola si es necesario.
+        
+        Returns:
+            requests.Session: Sesión con keep-alive y pool de conexiones.
+        """
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+            
+    def _get(self, url, headers, **kwargs):
+        """
+        Realiza una petición GET reintentando las respuestas 429 según Retry-After.
+        
+        Args:
+            url (str): URL a consultar.
+            headers (dict): Headers de la petición.
+            **kwargs: Argumentos adicionales para requests.Session.get.
+            
+        Returns:
+            requests.Response: Respuesta exitosa.
+            
+        Raises:
+            requests.exceptions.RequestException: Si la petición falla o se agotan los reintentos.
+        """
+        session = self._get_session()
+        
+        for attempt in range(self.max_retries + 1):
+            response = session.get(url, headers=headers, timeout=self.timeout, **kwargs)
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            # Liberar la conexión (las respuestas en streaming no leen el cuerpo)
+            response.close()
+            time.sleep(self._retry_delay(response, attempt))
+            
+        response.raise_for_status()  # Verifica si la petición fue exitosa
+        return response
+        
+    def _retry_delay(self, response, attempt):
+        """
+        Calcula la espera antes de reintentar una respuesta 429.
+        
+        Args:
+            response (requests.Response): Respuesta con límite de tasa.
+            attempt (int): Número de intento (desde 0).
+            
+        Returns:
+            float: Segundos de espera.
+        """
+        backoff = self.backoff_factor * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After")
+        
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    pass
+                    
+        return backoff
+        
+    def _compact(self, df, record):
+        """
+        Compacta el dataset descargado y registra su memoria antes y después.
+        
+        Args:
+            df (pandas.DataFrame): Dataset tal como lo construyó pandas.
+            record (OperationRecord): Medición de la descarga.
+            
+        Returns:
+            pandas.DataFrame: Dataset compactado (o el original si no hay compactador).
+        """
+        if self.compactor is None:
+            return df
+        with record.phase("compact"):
+            df = self.compactor.compact(df)
+        report = self.compactor.last_report
+        before, after = DatasetCompactor.totals(report)
+        record.set("memory_before", before)
+        record.set("memory_after", after)
+        record.set("memory", report)
+        return df
+        
+    def _validate(self, df):
+        """
+        Verifica que el dataset contiene al menos dos variables numéricas.
+        
+        Args:
+            df (pandas.DataFrame): Dataset a verificar.
+            
+        Returns:
+            bool: True si el dataset es válido.
+        """
+        return self._validate_columns(df.select_dtypes(include=['number']).columns)
+        
+    def _validate_columns(self, numeric_columns):
+        """
+        Verifica que haya al menos dos columnas numéricas.
+        
+        Args:
+            numeric_columns (list): Nombres de las columnas numéricas.
+            
+        Returns:
+            bool: True si el dataset es válido.
+        """
+        if len(numeric_columns) < 2:
+            print("El dataset debe contener al menos dos variables numéricas.")
+            return False
+        return True
             
     def get_numeric_columns(self):
         """
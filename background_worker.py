@@ -0,0 +1,233 @@
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class TaskCancelled(Exception):
+    """
+    Excepción lanzada dentro de una tarea cuando se solicita su cancelación.
+    """
+    
+class TaskContext:
+    """
+    Contexto que recibe cada tarea para informar su progreso y detectar cancelaciones.
+    """
+    
+    def __init__(self, worker, channel, task_id, progress_interval=0.05):
+        """
+        Inicializa el contexto de una tarea.
+        
+        Args:
+            worker (BackgroundWorker): Ejecutor al que pertenece la tarea.
+            channel (str): Canal de la tarea (por ejemplo "fetch" o "sort").
+            task_id (int): Identificador único de la tarea.
+            progress_interval (float): Segundos mínimos entre dos reportes de progreso.
+        """
+        self.worker = worker
+        self.channel = channel
+        self.task_id = task_id
+        self.progress_interval = progress_interval
+        self._cancel_event = threading.Event()
+        self._last_report = 0.0
+        
+    def cancel(self):
+        """Solicita la cancelación de la tarea."""
+        self._cancel_event.set()
+        
+    def is_cancelled(self):
+        """
+        Indica si se solicitó la cancelación de la tarea.
+        
+        Returns:
+            bool: True si la tarea fue cancelada.
+        """
+        return self._cancel_event.is_set()
+        
+    def check_cancelled(self):
+        """
+        Interrumpe la tarea si se solicitó su cancelación.
+        
+        Raises:
+            TaskCancelled: Si la tarea fue cancelada.
+        """
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+            
+    def report_progress(self, fraction, message=""):
+        """
+        Informa el progreso de la tarea. También actúa como punto de cancelación.
+        
+        Los reportes se limitan a uno cada progress_interval segundos para no
+        saturar la cola de resultados desde bucles internos.
+        
+        Args:
+            fraction (float): Progreso entre 0 y 1, o None si no se conoce.
+            message (str): Descripción de la etapa actual.
+            
+        Raises:
+            TaskCancelled: Si la tarea fue cancelada.
+        """
+        self.check_cancelled()
+        
+        now = time.monotonic()
+        if now - self._last_report < self.progress_interval and fraction not in (0, 1):
+            return
+        self._last_report = now
+        self.worker._post(self, "progress", (fraction, message))
+        
+class BackgroundWorker:
+    """
+    Ejecuta tareas en hilos de fondo y entrega sus resultados en el hilo de Tk.
+    
+    Cada tarea pertenece a un canal: al enviar una tarea nueva a un canal se
+    cancela la anterior y solo se entrega el resultado de la más reciente, de modo
+    que los clics repetidos se combinan en una única actualización de la interfaz.
+    Los resultados se leen de una cola consultada periódicamente con root.after.
+    """
+    
+    def __init__(self, root, max_workers=2, poll_interval=50):
+        """
+        Inicializa el ejecutor de tareas.
+        
+        Args:
+            root (tk.Tk): Ventana principal donde se programan los callbacks.
+            max_workers (int): Cantidad de hilos de fondo.
+            poll_interval (int): Milisegundos entre consultas a la cola de resultados.
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._results = queue.Queue()
+        self._active = {}
+        self._callbacks = {}
+        self._next_id = 0
+        self._poll_job = None
+        
+    def submit(self, channel, func, on_success, on_error=None, on_progress=None, on_cancel=None):
+        """
+        Envía una tarea al fondo, reemplazando la tarea pendiente del mismo canal.
+        
+        Args:
+            channel (str): Canal de la tarea.
+            func (callable): Función a ejecutar; recibe el TaskContext de la tarea.
+            on_success (callable): Se llama en el hilo de Tk con el resultado.
+            on_error (callable, optional): Se llama en el hilo de Tk con la excepción.
+            on_progress (callable, optional): Se llama en el hilo de Tk con (fracción, mensaje).
+            on_cancel (callable, optional): Se llama en el hilo de Tk si la tarea se cancela.
+            
+        Returns:
+            TaskContext: Contexto de la tarea enviada.
+        """
+        self.cancel(channel)
+        
+        self._next_id += 1
+        context = TaskContext(self, channel, self._next_id)
+        self._active[channel] = context
+        self._callbacks[context.task_id] = (on_success, on_error, on_progress, on_cancel)
+        
+        self._executor.submit(self._run, context, func)
+        self._schedule_poll()
+        return context
+        
+    def cancel(self, channel=None):
+        """
+        Cancela la tarea activa de un canal, o de todos los canales.
+        
+        Args:
+            channel (str, optional): Canal a cancelar. Si es None se cancelan todos.
+        """
+        channels = [channel] if channel is not None else list(self._active)
+        for name in channels:
+            context = self._active.pop(name, None)
+            if context is None:
+                continue
+            context.cancel()
+            callbacks = self._callbacks.pop(context.task_id, None)
+            if callbacks and callbacks[3]:
+                callbacks[3]()
+                
+    def is_busy(self, channel=None):
+        """
+        Indica si hay tareas activas.
+        
+        Args:
+            channel (str, optional): Canal a consultar. Si es None se consideran todos.
+            
+        Returns:
+            bool: True si hay alguna tarea activa.
+        """
+        if channel is None:
+            return bool(self._active)
+        return channel in self._active
+        
+    def shutdown(self):
+        """Cancela las tareas activas y libera los hilos de fondo."""
+        self.cancel()
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+    def _run(self, context, func):
+        """
+        Ejecuta una tarea en un hilo de fondo y encola su resultado.
+        
+        Args:
+            context (TaskContext): Contexto de la tarea.
+            func (callable): Función a ejecutar.
+        """
+        try:
+            context.check_cancelled()
+            result = func(context)
+        except TaskCancelled:
+            return
+        except Exception as e:
+            self._post(context, "error", e)
+            return
+        self._post(context, "success", result)
+        
+    def _post(self, context, kind, payload):
+        """
+        Encola un evento de una tarea para entregarlo en el hilo de Tk.
+        
+        Args:
+            context (TaskContext): Contexto de la tarea.
+            kind (str): "progress", "success" o "error".
+            payload: Datos del evento.
+        """
+        self._results.put((context, kind, payload))
+        
+    def _schedule_poll(self):
+        """Programa la siguiente consulta de la cola si no hay una pendiente."""
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval, self._poll)
+            
+    def _poll(self):
+        """Entrega en el hilo de Tk los eventos de las tareas vigentes."""
+        self._poll_job = None
+        
+        while True:
+            try:
+                context, kind, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+                
+            # Descartar eventos de tareas canceladas o reemplazadas
+            if self._active.get(context.channel) is not context:
+                continue
+                
+            on_success, on_error, on_progress, _ = self._callbacks[context.task_id]
+            if kind == "progress":
+                if on_progress:
+                    on_progress(*payload)
+                continue
+                
+            del self._active[context.channel]
+            del self._callbacks[context.task_id]
+            if kind == "success":
+                on_success(payload)
+            elif on_error:
+                on_error(payload)
+                
+        if self._active:
+            self._schedule_poll()
@@ -0,0 +1,247 @@
+import os
+import sys
+import time
+from dataset_compactor import DatasetCompactor
+
+# Códigos de salida del modo por lotes
+EXIT_OK = 0
+EXIT_FETCH_ERROR = 1
+EXIT_USAGE_ERROR = 2
+EXIT_SORT_ERROR = 3
+EXIT_EXPORT_ERROR = 4
+
+class DataExporter:
+    """
+    Exporta un dataset por bloques a CSV, NDJSON o Parquet (columnar binario).
+    
+    Cada bloque se escribe apenas se recibe, de modo que nunca se arma en memoria
+    el archivo completo. Parquet requiere el paquete opcional pyarrow.
+    """
+    
+    FORMATS = ("csv", "ndjson", "parquet")
+    EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson", ".parquet": "parquet"}
+    
+    def __init__(self, path, file_format=None):
+        """
+        Inicializa el exportador.
+        
+        Args:
+            path (str): Archivo de salida, o "-" para la salida estándar.
+            file_format (str, optional): "csv", "ndjson" o "parquet". Por defecto se
+                deduce de la extensión (CSV para la salida estándar).
+                
+        Raises:
+            ValueError: Si el formato no es válido o no puede deducirse.
+        """
+        if file_format is None:
+            extension = os.path.splitext(path)[1].lower()
+            file_format = "csv" if path == "-" else self.EXTENSIONS.get(extension)
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Formato de salida no válido para '{path}': use {', '.join(self.FORMATS)}.")
+        if file_format == "parquet" and path == "-":
+            raise ValueError("El formato parquet requiere un archivo de salida.")
+        self.path = path
+        self.file_format = file_format
+        
+    def write(self, chunks):
+        """
+        Escribe los bloques en el archivo de salida.
+        
+        Args:
+            chunks (iterable): Bloques (pandas.DataFrame) en el orden de salida.
+            
+        Returns:
+            int: Cantidad de filas escritas.
+        """
+        if self.file_format == "parquet":
+            return self._write_parquet(chunks)
+            
+        if self.path == "-":
+            return self._write_text(chunks, sys.stdout)
+        with open(self.path, "w", encoding="utf-8", newline="") as file:
+            return self._write_text(chunks, file)
+            
+    def _write_text(self, chunks, file):
+        """
+        Escribe los bloques en formato de texto (CSV o NDJSON).
+        
+        Args:
+            chunks (iterable): Bloques a escribir.
+            file: Archivo de texto abierto.
+            
+        Returns:
+            int: Cantidad de filas escritas.
+        """
+        rows = 0
+        for chunk in chunks:
+            if self.file_format == "csv":
+                # El encabezado se escribe solo con el primer bloque
+                chunk.to_csv(file, index=False, header=rows == 0)
+            elif len(chunk):
+                lines = chunk.to_json(orient="records", lines=True, force_ascii=False)
+                # Según la versión, pandas termina o no la última línea con un salto
+                file.write(lines if lines.endswith("\n") else lines + "\n")
+            rows += len(chunk)
+        file.flush()
+        return rows
+        
+    def _write_parquet(self, chunks):
+        """
+        Escribe los bloques como grupos de filas de un archivo Parquet.
+        
+        Args:
+            chunks (iterable): Bloques a escribir.
+            
+        Returns:
+            int: Cantidad de filas escritas.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Se requiere el paquete pyarrow para exportar a parquet (pip install pyarrow).")
+            
+        rows = 0
+        writer = None
+        try:
+            for chunk in chunks:
+                # Las columnas de objetos (por ejemplo diccionarios) se guardan como texto
+                chunk = chunk.apply(lambda values: values.where(values.isna(), values.astype(str)) if values.dtype == object else values)
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(self.path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+        
+class BatchRunner:
+    """
+    Ejecuta el pipeline completo sin interfaz gráfica: descarga, ordenamiento y exportación.
+    
+    Reutiliza APIHandler y DataProcessor, mide el tiempo de cada etapa y devuelve
+    un código de salida distinto para cada tipo de error.
+    """
+    
+    def __init__(self, api_handler, data_processor, log=None, memory_report=False):
+        """
+        Inicializa el ejecutor por lotes.
+        
+        Args:
+            api_handler: Instancia de APIHandler para obtener datos.
+            data_processor: Instancia de DataProcessor para ordenar datos.
+            log (callable, optional): Recibe los mensajes de estado. Por defecto se
+                escriben en la salida de errores para no mezclarlos con los datos.
+            memory_report (bool): True para informar la memoria de cada columna
+                antes y después de compactar los datos descargados.
+        """
+        self.api_handler = api_handler
+        self.data_processor = data_processor
+        self.log = log or (lambda message: print(message, file=sys.stderr))
+        self.memory_report = memory_report
+        self.timings = {}
+        
+    def run(self, columns, algorithm_name, ascending=True, output="-", file_format=None,
+            chunk_rows=10000, all_pages=False, na_position="last"):
+        """
+        Descarga, ordena y exporta el dataset.
+        
+        Args:
+            columns (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            output (str): Archivo de salida, o "-" para la salida estándar.
+            file_format (str, optional): "csv", "ndjson" o "parquet".
+            chunk_rows (int): Filas por bloque de escritura.
+            all_pages (bool): True para descargar todas las páginas de la API.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            int: Código de salida (EXIT_OK o el del error).
+        """
+        self.timings = {}
+        started = time.perf_counter()
+        try:
+            return self._run(columns, algorithm_name, ascending, output, file_format, chunk_rows, all_pages, na_position)
+        finally:
+            self.timings["total"] = time.perf_counter() - started
+            self.report_timings()
+            self.data_processor.shutdown()
+            
+    def report_timings(self):
+        """Informa la duración de cada etapa."""
+        for stage, seconds in self.timings.items():
+            self.log(f"{stage:<8} {seconds * 1000:10.1f} ms")
+            
+    def report_memory(self):
+        """Informa la memoria de cada columna antes y después de la compactación."""
+        compactor = self.api_handler.compactor
+        if compactor is None or compactor.last_report is None:
+            self.log("Sin informe de memoria: compactación desactivada o datos leídos de la caché.")
+            return
+        DatasetCompactor.report(compactor.last_report, log=self.log)
+        
+    def _run(self, columns, algorithm_name, ascending, output, file_format, chunk_rows, all_pages, na_position):
+        """
+        Ejecuta las etapas del pipeline; los argumentos son los de run.
+        
+        Returns:
+            int: Código de salida.
+        """
+        if algorithm_name not in self.data_processor.get_available_algorithms():
+            self.log(f"Algoritmo desconocido: '{algorithm_name}'.")
+            return EXIT_USAGE_ERROR
+        if chunk_rows < 1:
+            self.log("La cantidad de filas por bloque debe ser positiva.")
+            return EXIT_USAGE_ERROR
+        try:
+            exporter = DataExporter(output, file_format)
+        except ValueError as e:
+            self.log(str(e))
+            return EXIT_USAGE_ERROR
+            
+        # 1. Descarga
+        stage_started = time.perf_counter()
+        data = self.api_handler.fetch_all_pages() if all_pages else self.api_handler.fetch_data()
+        self.timings["fetch"] = time.perf_counter() - stage_started
+        if data is None:
+            self.log("No se pudieron obtener los datos.")
+            return EXIT_FETCH_ERROR
+        self.log(f"Datos obtenidos: {len(data)} filas.")
+        if self.memory_report:
+            self.report_memory()
+        
+        if isinstance(columns, str):
+            columns = [columns]
+        missing = [column for column in columns if column not in data.columns]
+        if missing:
+            self.log(f"Columnas inexistentes: {', '.join(missing)}.")
+            return EXIT_USAGE_ERROR
+            
+        # 2. Ordenamiento: solo la permutación, las filas se toman por bloques al exportar
+        self.data_processor.set_data(data)
+        stage_started = time.perf_counter()
+        try:
+            with self.data_processor.instrumentation.operation("sort", True, algorithm=algorithm_name, columns=columns, rows=len(data)) as record:
+                permutation = self.data_processor.get_permutation(columns, algorithm_name, ascending, na_position=na_position, record=record)
+        except (ValueError, TypeError) as e:
+            self.log(f"Error al ordenar los datos: {e}")
+            return EXIT_SORT_ERROR
+        finally:
+            self.timings["sort"] = time.perf_counter() - stage_started
+            
+        # 3. Exportación por bloques
+        stage_started = time.perf_counter()
+        chunks = (data.take(permutation[start:start + chunk_rows]) for start in range(0, len(permutation), chunk_rows))
+        try:
+            rows = exporter.write(chunks)
+        except (OSError, ImportError, ValueError) as e:
+            self.log(f"Error al exportar los datos: {e}")
+            return EXIT_EXPORT_ERROR
+        finally:
+            self.timings["export"] = time.perf_counter() - stage_started
+            
+        self.log(f"Filas exportadas: {rows} ({exporter.file_format}).")
+        return EXIT_OK
@@ -0,0 +1,289 @@
+import argparse
+import csv
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from data_processor import DataProcessor
+
+# Algoritmos O(n²) que solo se miden hasta --max-quadratic-rows filas
+QUADRATIC_ALGORITHMS = {"Burbuja", "Selección", "Inserción"}
+
+DTYPES = ("int", "float", "nan")
+ORDERS = ("random", "sorted", "reversed", "nearly", "duplicates")
+RESULT_FIELDS = [
+    "algorithm", "stage", "rows", "dtype", "order", "width",
+    "seconds", "peak_bytes", "rows_per_second", "auto_choice", "auto_reasons"
+]
+
+def make_dataset(rows, dtype, order, width, seed=0):
+    """
+    Genera un dataset sintético para las mediciones.
+    
+    Args:
+        rows (int): Cantidad de filas.
+        dtype (str): "int", "float" o "nan" (float con un 10% de NaN).
+        order (str): "random", "sorted", "reversed", "nearly" (1% de elementos
+            desplazados) o "duplicates" (pocos valores distintos).
+        width (int): Cantidad total de columnas, incluida la columna clave.
+        seed (int): Semilla del generador aleatorio.
+        
+    Returns:
+        pandas.DataFrame: Dataset con la columna clave "key" y columnas de relleno.
+    """
+    rng = np.random.default_rng(seed)
+    
+    if order == "duplicates":
+        keys = rng.integers(0, 10, rows).astype(np.float64)
+    else:
+        keys = rng.random(rows) * 1e6
+        
+    if order in ("sorted", "nearly"):
+        keys.sort()
+    elif order == "reversed":
+        keys[::-1].sort()
+        
+    if order == "nearly" and rows > 1:
+        # Intercambiar un 1% de posiciones al azar
+        swaps = max(rows // 100, 1)
+        left = rng.integers(0, rows, swaps)
+        right = rng.integers(0, rows, swaps)
+        keys[left], keys[right] = keys[right], keys[left].copy()
+        
+    if dtype == "int":
+        keys = keys.astype(np.int64)
+    elif dtype == "nan":
+        keys[rng.random(rows) < 0.1] = np.nan
+        
+    data = {"key": keys}
+    for i in range(1, width):
+        data[f"col_{i}"] = rng.random(rows) if i % 2 else rng.integers(0, 1000, rows)
+    return pd.DataFrame(data)
+    
+def run_algorithm(processor, algorithm_name, sort_input, column, ascending=True):
+    """
+    Ejecuta solo el algoritmo de ordenamiento, con la entrada que recibe en sort_data.
+    
+    Args:
+        processor (DataProcessor): Procesador con el dataset y el registro de algoritmos.
+        algorithm_name (str): Nombre del algoritmo.
+        sort_input: Entrada construida con DataProcessor.build_sort_input.
+        column (str): Columna por la cual ordenar.
+        ascending (bool): Dirección del ordenamiento.
+        
+    Returns:
+        numpy.ndarray: Permutación resultante.
+    """
+    return processor.compute_permutation(column, algorithm_name, ascending, sort_input=sort_input)
+    
+def measure(func, repeat):
+    """
+    Mide el tiempo (mejor de varias ejecuciones) y el pico de memoria de una función.
+    
+    Args:
+        func (callable): Función sin argumentos a medir.
+        repeat (int): Cantidad de ejecuciones para el tiempo.
+        
+    Returns:
+        tuple: (segundos, bytes de pico de memoria).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        
+    # La memoria se mide en una ejecución aparte porque tracemalloc altera los tiempos
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+    
+def run_benchmarks(rows_list, dtypes=DTYPES, orders=ORDERS, widths=(1,), algorithms=None,
+                   repeat=3, max_quadratic_rows=2000, log=None):
+    """
+    Ejecuta todas las combinaciones de algoritmos y datasets sintéticos.
+    
+    Args:
+        rows_list (list): Cantidades de filas a medir.
+        dtypes (iterable): Tipos de la columna clave.
+        orders (iterable): Grados de orden previo.
+        widths (iterable): Cantidades de columnas del dataset.
+        algorithms (list, optional): Algoritmos a medir. Por defecto todos los registrados.
+        repeat (int): Ejecuciones por medición de tiempo.
+        max_quadratic_rows (int): Filas máximas para los algoritmos O(n²).
+        log (callable, optional): Recibe un mensaje por cada medición.
+        
+    Returns:
+        list: Resultados como diccionarios con las claves de RESULT_FIELDS.
+    """
+    # Sin caché de permutaciones: cada ejecución debe ordenar de nuevo
+    processor = DataProcessor(cache_max_bytes=0)
+    algorithms = algorithms or processor.get_available_algorithms()
+    results = []
+    
+    for rows in rows_list:
+        for dtype in dtypes:
+            for order in orders:
+                for width in widths:
+                    dataframe = make_dataset(rows, dtype, order, width)
+                    processor.set_data(dataframe)
+                    
+                    for name in algorithms:
+                        if name in QUADRATIC_ALGORITHMS and rows > max_quadratic_rows:
+                            continue
+                            
+                        sort_input = processor.build_sort_input("key", name)
+                        stages = {
+                            "algorithm": lambda: run_algorithm(processor, name, sort_input, "key"),
+                            "pipeline": lambda: processor.sort_data("key", name)
+                        }
+                        
+                        for stage, func in stages.items():
+                            seconds, peak = measure(func, repeat)
+                            result = {
+                                "algorithm": name,
+                                "stage": stage,
+                                "rows": rows,
+                                "dtype": dtype,
+                                "order": order,
+                                "width": width,
+                                "seconds": seconds,
+                                "peak_bytes": peak,
+                                "rows_per_second": rows / seconds if seconds > 0 else float("inf")
+                            }
+                            # Con "Auto", registrar qué algoritmo eligió y por qué, para contrastarlo con el resto
+                            decision = processor.last_auto_decision if name == "Auto" else None
+                            if decision is not None:
+                                result["auto_choice"] = decision["algorithm"]
+                                result["auto_reasons"] = "; ".join(decision["reasons"])
+                            results.append(result)
+                            if log:
+                                choice = f" -> {decision['algorithm']}" if decision is not None else ""
+                                log(f"{name:<18} {stage:<9} rows={rows:<8} dtype={dtype:<5} order={order:<10} "
+                                    f"width={width:<3} {seconds * 1000:10.2f} ms {peak / 1024:10.1f} KiB{choice}")
+                                    
+    processor.shutdown()
+    return results
+    
+def result_key(result):
+    """
+    Identifica una medición para compararla con la línea base.
+    
+    Args:
+        result (dict): Resultado de una medición.
+        
+    Returns:
+        tuple: Clave de la medición.
+    """
+    return tuple(result[field] for field in ("algorithm", "stage", "rows", "dtype", "order", "width"))
+    
+def compare_with_baseline(results, baseline, tolerance=0.25, min_seconds=0.001):
+    """
+    Compara los resultados con una línea base y detecta ralentizaciones.
+    
+    Args:
+        results (list): Resultados actuales.
+        baseline (list): Resultados de la línea base.
+        tolerance (float): Aumento relativo de tiempo tolerado (0.25 = 25%).
+        min_seconds (float): Las mediciones más rápidas que esto se ignoran por ruido.
+        
+    Returns:
+        list: Regresiones como diccionarios con la medición, el tiempo base y la razón.
+    """
+    reference = {result_key(result): result for result in baseline}
+    regressions = []
+    
+    for result in results:
+        base = reference.get(result_key(result))
+        if base is None or max(base["seconds"], result["seconds"]) < min_seconds:
+            continue
+        ratio = result["seconds"] / base["seconds"] if base["seconds"] > 0 else float("inf")
+        if ratio > 1 + tolerance:
+            regressions.append(dict(result, baseline_seconds=base["seconds"], ratio=ratio))
+    return regressions
+    
+def write_json(results, path):
+    """
+    Guarda los resultados en formato JSON.
+    
+    Args:
+        results (list): Resultados a guardar.
+        path (str): Ruta del archivo.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, ensure_ascii=False)
+        
+def write_csv(results, path):
+    """
+    Guarda los resultados en formato CSV.
+    
+    Args:
+        results (list): Resultados a guardar.
+        path (str): Ruta del archivo.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+        
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos de las mediciones.
+    
+    Args:
+        argv (list, optional): Argumentos de la línea de comandos.
+        
+    Returns:
+        int: Código de salida (1 si hay regresiones respecto de la línea base).
+    """
+    parser = argparse.ArgumentParser(description="Mide los algoritmos de ordenamiento y el pipeline de DataProcessor.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="Cantidades de filas")
+    parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=list(DTYPES), help="Tipos de la columna clave")
+    parser.add_argument("--orders", nargs="+", choices=ORDERS, default=list(ORDERS), help="Orden previo de los datos")
+    parser.add_argument("--widths", type=int, nargs="+", default=[1, 10], help="Cantidades de columnas")
+    parser.add_argument("--algorithms", nargs="+", help="Algoritmos a medir (por defecto todos)")
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones por medición")
+    parser.add_argument("--max-quadratic-rows", type=int, default=2000, help="Filas máximas para algoritmos O(n²)")
+    parser.add_argument("--json", help="Archivo JSON de resultados")
+    parser.add_argument("--csv", help="Archivo CSV de resultados")
+    parser.add_argument("--baseline", help="Línea base JSON con la cual comparar")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Ralentización relativa tolerada")
+    args = parser.parse_args(argv)
+    
+    results = run_benchmarks(
+        args.rows, args.dtypes, args.orders, args.widths, args.algorithms,
+        args.repeat, args.max_quadratic_rows, log=print
+    )
+    
+    if args.json:
+        write_json(results, args.json)
+    if args.csv:
+        write_csv(results, args.csv)
+        
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESIÓN {regression['algorithm']} {regression['stage']} rows={regression['rows']} "
+                  f"dtype={regression['dtype']} order={regression['order']} width={regression['width']}: "
+                  f"{regression['baseline_seconds'] * 1000:.2f} ms -> {regression['seconds'] * 1000:.2f} ms "
+                  f"(x{regression['ratio']:.2f})")
+        if regressions:
+            return 1
+        print("Sin regresiones respecto de la línea base.")
+    return 0
+    
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+import tkinter as tk
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+# matplotlib se importa al crear el primer gráfico
+mpl_figure = lazy_import("matplotlib.figure")
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg")
+
+class ChartView:
+    """
+    Gráfico de barras persistente para la visualización de datos.
+    
+    La figura y el canvas se crean una sola vez y las barras se actualizan en el
+    lugar (alturas y etiquetas). Las barras son artistas animados: cuando solo
+    cambian sus alturas se restaura el fondo guardado y se redibujan únicamente
+    las barras (blitting); ejes, títulos y etiquetas se redibujan solo si cambian.
+    La figura no se registra en pyplot, por lo que no se acumulan figuras abiertas.
+    """
+    
+    def __init__(self, parent, figsize=(10, 5)):
+        """
+        Inicializa la figura y el canvas del gráfico.
+        
+        Args:
+            parent: Widget contenedor del gráfico.
+            figsize (tuple): Tamaño de la figura en pulgadas.
+        """
+        self.figure = mpl_figure.Figure(figsize=figsize)
+        self.ax = self.figure.add_subplot()
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self._bars = []
+        self._labels = []
+        self._title = None
+        self._ylabel = None
+        self._background = None
+        self._closed = False
+        
+        # Guardar el fondo (sin barras) después de cada redibujado completo
+        self._draw_callback = self.canvas.mpl_connect("draw_event", self._on_draw)
+        
+    def update(self, labels, values, title="", ylabel=""):
+        """
+        Actualiza el gráfico con nuevas etiquetas y valores.
+        
+        Args:
+            labels (list): Etiquetas de las barras.
+            values (array-like): Alturas de las barras.
+            title (str): Título del gráfico.
+            ylabel (str): Etiqueta del eje Y.
+        """
+        if self._closed:
+            return
+            
+        values = np.asarray(values, dtype=np.float64)
+        labels = [str(label) for label in labels]
+        full_redraw = False
+        
+        # Recrear las barras solo si cambia su cantidad
+        if len(self._bars) != len(values):
+            for bar in self._bars:
+                bar.remove()
+            self._bars = list(self.ax.bar(range(len(values)), np.nan_to_num(values), animated=True))
+            self.ax.set_xticks(range(len(values)))
+            self._labels = None
+            full_redraw = True
+        else:
+            for bar, value in zip(self._bars, values):
+                bar.set_height(0.0 if np.isnan(value) else value)
+                
+        if labels != self._labels:
+            self.ax.set_xticklabels(labels, rotation=45, ha="right")
+            self._labels = labels
+            full_redraw = True
+            
+        if title != self._title or ylabel != self._ylabel:
+            self.ax.set_title(title)
+            self.ax.set_ylabel(ylabel)
+            self._title, self._ylabel = title, ylabel
+            full_redraw = True
+            
+        full_redraw = self._update_limits(values) or full_redraw
+        
+        if full_redraw:
+            self.ax.set_xlim(-0.5, max(len(values), 1) - 0.5)
+            self.figure.tight_layout()
+            self.canvas.draw()
+        else:
+            self._blit_bars()
+            
+    def clear(self):
+        """Elimina las barras y etiquetas del gráfico."""
+        if self._closed:
+            return
+        for bar in self._bars:
+            bar.remove()
+        self._bars = []
+        self._labels = []
+        self.ax.set_xticks([])
+        self.ax.set_title("")
+        self.ax.set_ylabel("")
+        self._title = self._ylabel = ""
+        self.canvas.draw()
+        
+    def close(self):
+        """Libera la figura y el canvas del gráfico."""
+        if self._closed:
+            return
+        self._closed = True
+        self.canvas.mpl_disconnect(self._draw_callback)
+        self._bars = []
+        self._background = None
+        self.figure.clear()
+        self.canvas.get_tk_widget().destroy()
+        
+    def _update_limits(self, values):
+        """
+        Ajusta el eje Y si los valores no entran o ocupan muy poco del rango actual.
+        
+        Args:
+            values (numpy.ndarray): Alturas de las barras.
+            
+        Returns:
+            bool: True si cambiaron los límites y hace falta un redibujado completo.
+        """
+        finite = values[np.isfinite(values)]
+        low = min(float(finite.min()), 0.0) if len(finite) else 0.0
+        high = max(float(finite.max()), 0.0) if len(finite) else 1.0
+        if high == low:
+            high = low + 1.0
+            
+        current_low, current_high = self.ax.get_ylim()
+        current_span = current_high - current_low
+        fits = current_low <= low and high <= current_high
+        # Mantener los límites mientras los datos ocupen al menos la mitad del rango
+        if fits and (high - low) >= 0.5 * current_span:
+            return False
+            
+        margin = 0.05 * (high - low)
+        self.ax.set_ylim(low - margin if low < 0 else low, high + margin)
+        return True
+        
+    def _on_draw(self, event):
+        """
+        Guarda el fondo después de un redibujado completo y dibuja las barras encima.
+        
+        Args:
+            event: Evento draw_event de matplotlib.
+        """
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_bars()
+        
+    def _draw_bars(self):
+        """Dibuja las barras animadas sobre el renderer actual."""
+        for bar in self._bars:
+            self.figure.draw_artist(bar)
+            
+    def _blit_bars(self):
+        """Redibuja solo las barras sobre el fondo guardado."""
+        if self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_bars()
+        self.canvas.blit(self.figure.bbox)
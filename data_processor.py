@@ -1,25 +1,71 @@
-import pandas as pd
+from lazy_imports import lazy_import
 from sorting_algorithms import SortingAlgorithms
+from permutation_cache import PermutationCache
+from sort_keys import SortKeys
+from external_sort import ExternalSorter
+from parallel_sort import ParallelSorter
+from instrumentation import Instrumentation, CountingKey, NULL_RECORD
+from incremental_sort import IncrementalSorter
+from sorted_index import IndexManager
+from algorithm_selector import AlgorithmSelector
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+# Claves internas de los registros que reciben los algoritmos (no pueden coincidir con una columna)
+_SORT_KEY = object()
+_POSITION = object()
 
 class DataProcessor:
     """
     Clase para procesar y ordenar datos obtenidos de una API.
     """
     
-    def __init__(self, data=None):
+    def __init__(self, data=None, cache_max_bytes=64 * 1024 * 1024, parallel_workers=None, parallel_min_size=500000,
+                 instrumentation=None):
         """
         Inicializa el procesador de datos con un dataset opcional.
         
         Args:
             data (pandas.DataFrame, optional): Dataset inicial a procesar.
+            cache_max_bytes (int): Memoria máxima de la caché de permutaciones.
+            parallel_workers (int, optional): Procesos del ordenamiento en paralelo.
+                Por defecto, los núcleos disponibles.
+            parallel_min_size (int): Filas mínimas para ordenar en paralelo; por
+                debajo se ordena en serie.
+            instrumentation (Instrumentation, optional): Registro de tiempos y contadores.
+                Por defecto, uno desactivado.
         """
         self.data = data
         self.sorted_data = None
+        self.sorted_permutation = None
+        self._sorted_ranks = None
+        self.indexes = IndexManager(data)
+        self.data_version = 0
+        self.permutation_cache = PermutationCache(cache_max_bytes)
+        self.derived_permutations = 0
+        self.parallel_sorter = ParallelSorter(parallel_workers, parallel_min_size)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.incremental_sorter = None
+        self.last_auto_decision = None
         self.sorting_algorithms = {
+            "Auto": self.auto_sort,
             "Burbuja": SortingAlgorithms.bubble_sort,
             "Selección": SortingAlgorithms.selection_sort,
-            "Inserción": SortingAlgorithms.insertion_sort
+            "Inserción": SortingAlgorithms.insertion_sort,
+            "Mezcla": SortingAlgorithms.merge_sort,
+            "Montículo": SortingAlgorithms.heap_sort,
+            "Introsort": SortingAlgorithms.intro_sort,
+            "Radix": SortingAlgorithms.radix_sort,
+            "Columnar (NumPy)": SortingAlgorithms.columnar_sort,
+            "Paralelo (multinúcleo)": self.parallel_sorter.sort
         }
+        # Algoritmos que trabajan sobre la columna clave y devuelven una permutación
+        self.columnar_algorithms = {"Auto", "Columnar (NumPy)", "Paralelo (multinúcleo)"}
+        # Algoritmos estables: todos producen la misma permutación y comparten caché
+        self.stable_algorithms = {"Auto", "Burbuja", "Inserción", "Mezcla", "Radix", "Columnar (NumPy)", "Paralelo (multinúcleo)"}
+        # Algoritmos basados en comparaciones: con contadores activos comparan claves que se cuentan
+        self.comparison_algorithms = {"Burbuja", "Selección", "Inserción", "Mezcla", "Montículo", "Introsort"}
         
     def set_data(self, data):
         """
@@ -30,6 +76,140 @@ class DataProcessor:
         """
         self.data = data
         self.sorted_data = None
+        self.sorted_permutation = None
+        self._sorted_ranks = None
+        self.indexes.reset(data)
+        
+        # Las permutaciones guardadas corresponden a la versión anterior
+        self.data_version += 1
+        self.permutation_cache.clear()
+        self.incremental_sorter = None
+        
+    def refresh_data(self, data, column, ascending=True, na_position="last", id_column="id"):
+        """
+        Reemplaza el dataset por una nueva instantánea manteniendo el orden actual.
+        
+        Equivale a plan_refresh seguido de apply_refresh.
+        
+        Args:
+            data (pandas.DataFrame): Nueva instantánea.
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            id_column (str): Columna que identifica cada fila entre instantáneas.
+            
+        Returns:
+            tuple: (dataset ordenado, cambios); ver plan_refresh.
+            
+        Raises:
+            ValueError: Si falta la columna identificadora o tiene valores repetidos.
+        """
+        return self.apply_refresh(self.plan_refresh(data, column, ascending, na_position, id_column))
+        
+    def plan_refresh(self, data, column, ascending=True, na_position="last", id_column="id"):
+        """
+        Calcula el orden de una nueva instantánea sin modificar el procesador.
+        
+        Las filas se emparejan por id con la instantánea anterior y solo las que
+        cambiaron de clave se reubican (ver IncrementalSorter), sobre una copia del
+        estado incremental. La primera vez, o si cambia el criterio de ordenamiento,
+        se ordena todo. Puede ejecutarse en segundo plano: el resultado se aplica
+        después con apply_refresh.
+        
+        Args:
+            data (pandas.DataFrame): Nueva instantánea.
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            id_column (str): Columna que identifica cada fila entre instantáneas.
+            
+        Returns:
+            dict: Actualización para apply_refresh. Sus cambios ("changes") son None
+            si se ordenó todo o un diccionario con los ids agregados, eliminados y
+            reubicados y las posiciones de la vista que cambiaron ("rows").
+            
+        Raises:
+            ValueError: Si falta la columna identificadora o tiene valores repetidos.
+        """
+        version = self.data_version
+        sorter = self.incremental_sorter
+        columns, directions = SortKeys.normalize(column, ascending)
+        
+        with self.instrumentation.operation("refresh", rows=len(data)) as record:
+            if sorter is None or sorter.spec != (columns, directions, na_position, id_column):
+                sorter = IncrementalSorter(columns, directions, na_position, id_column)
+                with record.phase("sort"):
+                    permutation = sorter.reset(data)
+                changes = None
+            else:
+                sorter = sorter.copy()
+                with record.phase("update"):
+                    permutation, changes = sorter.update(data)
+                record.set("changed_rows", len(changes["rows"]))
+            with record.phase("take"):
+                sorted_data = data.take(permutation)
+        return {"version": version, "data": data, "sorter": sorter, "permutation": permutation,
+                "sorted_data": sorted_data, "changes": changes}
+                
+    def plan_sort(self, data, column, algorithm_name, ascending=True, na_position="last"):
+        """
+        Ordena una nueva instantánea completa sin modificar el procesador.
+        
+        Se usa cuando las filas no se pueden emparejar por id; el resultado se
+        aplica con apply_refresh.
+        
+        Args:
+            data (pandas.DataFrame): Nueva instantánea.
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            dict: Actualización para apply_refresh, sin cambios incrementales; con
+            "Auto" incluye la decisión ("auto_decision").
+        """
+        version = self.data_version
+        columns, directions = SortKeys.normalize(column, ascending)
+        
+        with self.instrumentation.operation("sort", True, algorithm=algorithm_name, columns=column, rows=len(data)) as record:
+            with record.phase("encode"):
+                keys = SortKeys.encode(data, columns, directions, na_position)
+                sort_input = keys if algorithm_name in self.columnar_algorithms else self._key_records(keys)
+            permutation, decision = self._compute_permutation(columns, algorithm_name, sort_input=sort_input, record=record, data=data)
+            with record.phase("take"):
+                sorted_data = data.take(permutation)
+        return {"version": version, "data": data, "sorter": None, "permutation": permutation,
+                "sorted_data": sorted_data, "changes": None, "auto_decision": decision}
+                
+    def apply_refresh(self, plan):
+        """
+        Aplica una instantánea calculada con plan_refresh o plan_sort.
+        
+        Args:
+            plan (dict): Actualización calculada.
+            
+        Returns:
+            tuple: (dataset ordenado, cambios o None).
+            
+        Raises:
+            ValueError: Si el dataset cambió después de calcular la actualización.
+        """
+        if plan["version"] != self.data_version:
+            raise ValueError("La actualización se calculó sobre un dataset que ya fue reemplazado.")
+            
+        self.set_data(plan["data"])
+        if "auto_decision" in plan:
+            # Un ordenamiento completo reemplaza la decisión del anterior
+            self.last_auto_decision = plan["auto_decision"]
+        self.incremental_sorter = plan["sorter"]
+        self.sorted_data = plan["sorted_data"]
+        self.sorted_permutation = plan["permutation"]
+        return self.sorted_data, plan["changes"]
+        
+    def shutdown(self):
+        """Libera los procesos de trabajo del ordenamiento en paralelo."""
+        self.parallel_sorter.shutdown()
         
     def get_data(self):
         """
@@ -42,6 +222,41 @@ class DataProcessor:
             return self.sorted_data
         return self.data
         
+    def filter_data(self, conditions):
+        """
+        Obtiene las filas que cumplen un filtro usando los índices ordenados.
+        
+        Cada condición se resuelve con búsqueda binaria sobre el índice de su
+        columna (que se construye en la primera consulta), sin recorrer el dataset.
+        
+        Args:
+            conditions (str | list): Filtro escrito por el usuario o condiciones de IndexManager.parse.
+            
+        Returns:
+            pandas.DataFrame: Filas que cumplen el filtro, en el orden del último
+            ordenamiento o, si no lo hay, en el orden del dataset.
+            
+        Raises:
+            ValueError: Si el filtro no es válido o usa una columna no numérica.
+        """
+        if isinstance(conditions, str):
+            conditions = IndexManager.parse(conditions)
+            
+        with self.instrumentation.operation("filter", conditions=len(conditions)) as record:
+            with record.phase("query"):
+                positions = self.indexes.query(conditions)
+            if self.sorted_permutation is not None:
+                # Ubicar cada fila en el orden vigente a partir de la permutación inversa
+                with record.phase("order"):
+                    if self._sorted_ranks is None:
+                        ranks = np.empty(len(self.sorted_permutation), dtype=np.intp)
+                        ranks[self.sorted_permutation] = np.arange(len(self.sorted_permutation))
+                        self._sorted_ranks = ranks
+                    positions = positions[np.argsort(self._sorted_ranks[positions], kind="stable")]
+            record.set("rows", len(positions))
+            with record.phase("take"):
+                return self.data.take(positions)
+                
     def get_available_algorithms(self):
         """
         Obtiene la lista de algoritmos de ordenamiento disponibles.
@@ -51,14 +266,19 @@ class DataProcessor:
         """
         return list(self.sorting_algorithms.keys())
         
-    def sort_data(self, column, algorithm_name, ascending=True):
+    def sort_data(self, column, algorithm_name, ascending=True, progress=None, na_position="last"):
         """
-        Ordena el dataset según la columna y algoritmo especificados.
+        Ordena el dataset según la columna (o columnas) y algoritmo especificados.
         
         Args:
-            column (str): Nombre de la columna por la cual ordenar.
+            column (str | list): Columna o lista de columnas por las cuales ordenar,
+                de mayor a menor prioridad.
             algorithm_name (str): Nombre del algoritmo a utilizar.
-            ascending (bool): True para orden ascendente, False para descendente.
+            ascending (bool | list): True para orden ascendente, False para descendente;
+                puede indicarse una dirección por columna.
+            progress (callable, optional): Recibe (fracción, mensaje) durante el ordenamiento;
+                puede cancelarlo lanzando una excepción.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
             
         Returns:
             pandas.DataFrame: Dataset ordenado.
@@ -71,13 +291,370 @@ class DataProcessor:
             print(f"Algoritmo '{algorithm_name}' no disponible.")
             return self.data
             
-        # Convertir DataFrame a lista de diccionarios para los algoritmos de ordenamiento
-        records = self.data.to_dict('records')
+        self.last_auto_decision = None
+        with self.instrumentation.operation("sort", True, algorithm=algorithm_name, columns=column, rows=len(self.data)) as record:
+            permutation = self.get_permutation(column, algorithm_name, ascending, progress, na_position, record)
+            
+            # Aplicar la permutación con un único take, conservando tipos de datos e índice
+            if progress is not None:
+                progress(1, "Aplicando permutación")
+            with record.phase("take"):
+                self.sorted_data = self.data.take(permutation)
+            self.sorted_permutation = permutation
+            self._sorted_ranks = None
+        return self.sorted_data
+        
+    def get_permutation(self, column, algorithm_name, ascending=True, progress=None, na_position="last", record=NULL_RECORD):
+        """
+        Obtiene la permutación que ordena el dataset, usando la caché si es posible.
+        
+        Las permutaciones se guardan por (versión del dataset, columnas, estabilidad,
+        direcciones, ubicación de nulos). En ordenamientos por una sola columna, si
+        falta una dirección pero la opuesta está guardada, se deriva de ella en lugar
+        de volver a ordenar.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            progress (callable, optional): Recibe (fracción, mensaje) durante el ordenamiento.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            record (OperationRecord, optional): Medición donde registrar etapas y contadores.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante.
+        """
+        columns, directions = SortKeys.normalize(column, ascending)
+        stable = algorithm_name in self.stable_algorithms
+        key = (self.data_version, columns, stable, directions, na_position)
+        
+        permutation = self.permutation_cache.get(key)
+        if permutation is not None:
+            record.set("cache", "hit")
+            return permutation
+            
+        opposite = None
+        if len(columns) == 1:
+            opposite = self.permutation_cache.peek((self.data_version, columns, stable, (not directions[0],), na_position))
+        if opposite is not None:
+            with record.phase("derive"):
+                permutation = self._reverse_permutation(opposite, columns[0], stable, na_position)
+            self.derived_permutations += 1
+            record.set("cache", "derived")
+        else:
+            permutation = self.compute_permutation(columns, algorithm_name, directions, progress, na_position=na_position, record=record)
+            record.set("cache", "miss")
+            
+        self.permutation_cache.put(key, permutation)
+        return permutation
+        
+    def compute_permutation(self, column, algorithm_name, ascending=True, progress=None, sort_input=None, na_position="last",
+                            record=NULL_RECORD):
+        """
+        Ejecuta un algoritmo de ordenamiento y devuelve la permutación resultante, sin caché.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            progress (callable, optional): Recibe (fracción, mensaje) durante el ordenamiento.
+            sort_input (optional): Entrada ya construida con build_sort_input.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            record (OperationRecord, optional): Medición donde registrar etapas y contadores.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante. Con "Auto",
+            la decisión queda en last_auto_decision.
+        """
+        permutation, decision = self._compute_permutation(column, algorithm_name, ascending, progress, sort_input, na_position, record)
+        if decision is not None:
+            self.last_auto_decision = decision
+        return permutation
+        
+    def _compute_permutation(self, column, algorithm_name, ascending=True, progress=None, sort_input=None, na_position="last",
+                             record=NULL_RECORD, data=None):
+        """
+        Ejecuta un algoritmo de ordenamiento sin modificar el procesador.
         
-        # Aplicar el algoritmo de ordenamiento seleccionado
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            progress (callable, optional): Recibe (fracción, mensaje) durante el ordenamiento.
+            sort_input (optional): Entrada ya construida con build_sort_input.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            record (OperationRecord, optional): Medición donde registrar etapas y contadores.
+            data (pandas.DataFrame, optional): Dataset de la clave, para perfilar "Auto".
+                Por defecto el dataset actual.
+                
+        Returns:
+            tuple: (permutación, decisión de "Auto" o None con otro algoritmo).
+        """
+        if progress is not None:
+            progress(0, f"Ordenando con '{algorithm_name}'")
+        if sort_input is None:
+            with record.phase("encode"):
+                sort_input = self.build_sort_input(column, algorithm_name, ascending, na_position)
+                
+        # "Auto" se resuelve aquí para que el algoritmo elegido se mida y cuente como cualquier otro
+        decision = None
+        if algorithm_name == "Auto":
+            with record.phase("profile"):
+                algorithm_name, sort_input, decision = self.select_algorithm(sort_input, column, data)
+            record.set("auto_choice", algorithm_name)
+            record.set("auto_reasons", decision["reasons"])
+            record.set("auto_profile", decision["profile"])
         algorithm = self.sorting_algorithms[algorithm_name]
-        sorted_records = algorithm(records, column, ascending)
         
-        # Convertir de vuelta a DataFrame
-        self.sorted_data = pd.DataFrame(sorted_records)
-        return self.sorted_data
\ No newline at end of file
+        # La clave codificada ya incorpora direcciones y nulos: siempre se ordena ascendente
+        if algorithm_name in self.columnar_algorithms:
+            with record.phase("algorithm"):
+                return algorithm(sort_input, True), decision
+                
+        # Con contadores activos, cada comparación de claves se cuenta
+        counters = record.counters
+        if counters is not None and algorithm_name in self.comparison_algorithms:
+            with record.phase("encode"):
+                sort_input = [{_SORT_KEY: CountingKey(item[_SORT_KEY], counters), _POSITION: item[_POSITION]} for item in sort_input]
+            
+        # Los algoritmos por registros reciben registros mínimos: clave y posición original
+        algorithm_progress = None
+        if progress is not None:
+            algorithm_progress = lambda fraction: progress(fraction, f"Ordenando con '{algorithm_name}'")
+        with record.phase("algorithm"):
+            sorted_records = algorithm(sort_input, _SORT_KEY, True, progress=algorithm_progress, counters=counters)
+        with record.phase("extract"):
+            permutation = np.fromiter((item[_POSITION] for item in sorted_records), dtype=np.intp, count=len(sorted_records))
+        return permutation, decision
+            
+    def auto_sort(self, keys, ascending=True):
+        """
+        Ordenamiento "Auto": perfila la clave y la ordena con el algoritmo más rápido para ella.
+        
+        Args:
+            keys (numpy.ndarray): Clave codificada con SortKeys.encode.
+            ascending (bool): True para orden ascendente, False para descendente.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante (estable).
+        """
+        keys = np.asarray(keys)
+        if not ascending and len(keys):
+            # Invertir la clave entera conserva el orden original entre iguales
+            keys = keys.max() - keys
+        return self.compute_permutation(None, "Auto", sort_input=keys)
+        
+    def select_algorithm(self, keys, column=None, data=None):
+        """
+        Elige el algoritmo para "Auto" y prepara su entrada, sin modificar el procesador.
+        
+        Args:
+            keys (numpy.ndarray): Clave codificada con SortKeys.encode.
+            column (str | list, optional): Columnas de la clave, para perfilar sus tipos y nulos.
+            data (pandas.DataFrame, optional): Dataset de la clave. Por defecto el dataset actual.
+            
+        Returns:
+            tuple: (nombre del algoritmo elegido, entrada para ese algoritmo, decisión
+            con el algoritmo, sus motivos y el perfil de los datos).
+        """
+        if data is None:
+            data = self.data
+        columns = []
+        if column is not None and data is not None:
+            columns, _ = SortKeys.normalize(column)
+        profile = AlgorithmSelector.profile(keys, data if columns else None, columns)
+        algorithm_name, reasons = AlgorithmSelector.choose(profile, self.parallel_sorter.workers, self.parallel_sorter.min_size)
+        decision = {"algorithm": algorithm_name, "reasons": reasons, "profile": profile}
+        
+        if algorithm_name == "Columnar (NumPy)":
+            return algorithm_name, AlgorithmSelector.narrow(keys, profile), decision
+        if algorithm_name in self.columnar_algorithms:
+            return algorithm_name, keys, decision
+        return algorithm_name, self._key_records(keys), decision
+        
+    def build_sort_input(self, column, algorithm_name, ascending=True, na_position="last"):
+        """
+        Construye la entrada que recibe un algoritmo de ordenamiento.
+        
+        Las columnas se codifican en una única clave entera (ver SortKeys), de modo
+        que los algoritmos comparan enteros sin importar cuántas columnas haya ni si
+        contienen nulos.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            algorithm_name (str): Nombre del algoritmo a utilizar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            numpy.ndarray de claves para los algoritmos columnares, o lista de
+            registros {clave, posición} para el resto.
+        """
+        keys = SortKeys.encode(self.data, column, ascending, na_position)
+        if algorithm_name in self.columnar_algorithms:
+            return keys
+        return self._key_records(keys)
+        
+    @staticmethod
+    def _key_records(keys):
+        """
+        Construye los registros mínimos que reciben los algoritmos por registros.
+        
+        Args:
+            keys (numpy.ndarray): Clave codificada con SortKeys.encode.
+            
+        Returns:
+            list: Registros {clave, posición original}.
+        """
+        return [{_SORT_KEY: key, _POSITION: position} for position, key in enumerate(keys.tolist())]
+        
+    def top_k(self, column, k, ascending=True, na_position="last"):
+        """
+        Obtiene las k primeras filas del orden pedido sin ordenar todo el dataset.
+        
+        Se usa selección (np.argpartition, O(n)) sobre la clave y luego se ordenan
+        solo los k elegidos (O(k log k)). El resultado coincide con las k primeras
+        filas de un ordenamiento estable completo, incluido el desempate por posición.
+        Si la permutación completa ya está en la caché, se reutiliza.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            k (int): Cantidad de filas a obtener.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            pandas.DataFrame: Las k primeras filas, en orden, o None si no hay datos.
+        """
+        if self.data is None:
+            print("No hay datos para ordenar.")
+            return None
+            
+        columns, directions = SortKeys.normalize(column, ascending)
+        n = len(self.data)
+        k = max(min(int(k), n), 0)
+        
+        # Cualquier permutación estable guardada sirve para la vista previa
+        cached = self.permutation_cache.peek((self.data_version, columns, True, directions, na_position))
+        if cached is not None:
+            return self.data.take(cached[:k])
+            
+        keys = self._top_k_keys(columns, directions, na_position)
+        
+        if k == 0:
+            selected = np.empty(0, dtype=np.intp)
+        elif k < n:
+            # Selección: el k-ésimo valor separa los mejores del resto
+            threshold = keys[np.argpartition(keys, k - 1)[:k]].max()
+            better = np.flatnonzero(keys < threshold)
+            # Entre los empatados con el umbral, los de menor posición (estabilidad)
+            tied = np.flatnonzero(keys == threshold)[:k - len(better)]
+            selected = np.concatenate((better, tied))
+        else:
+            selected = np.arange(n)
+            
+        # Ordenar solo los k elegidos, desempatando por posición
+        selected = selected[np.lexsort((selected, keys[selected]))]
+        return self.data.take(selected)
+        
+    def external_sort(self, column, ascending=True, source=None, memory_budget=64 * 1024 * 1024, temp_dir=None, na_position="last"):
+        """
+        Ordena un dataset más grande que la memoria disponible.
+        
+        La entrada se ordena por tramos que respetan el presupuesto de memoria y se
+        combina en un archivo mapeado en memoria (ver ExternalSorter). El resultado
+        se recorre por bloques y debe cerrarse para eliminar los archivos temporales.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            source (pandas.DataFrame | iterable, optional): Dataset o iterable de bloques.
+                Por defecto el dataset actual.
+            memory_budget (int): Memoria aproximada disponible en bytes.
+            temp_dir (str, optional): Directorio base para los archivos temporales.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            ExternalSortResult: Resultado ordenado, o None si no hay datos.
+        """
+        if source is None:
+            source = self.data
+        if source is None:
+            print("No hay datos para ordenar.")
+            return None
+            
+        sorter = ExternalSorter(column, ascending, na_position, memory_budget, temp_dir)
+        return sorter.sort(source)
+        
+    def get_cache_stats(self):
+        """
+        Obtiene las estadísticas de la caché de permutaciones.
+        
+        Returns:
+            dict: Aciertos, fallos, descartes, entradas, bytes ocupados y permutaciones
+            derivadas de la dirección opuesta.
+        """
+        stats = self.permutation_cache.stats()
+        stats["derived"] = self.derived_permutations
+        return stats
+        
+    def _top_k_keys(self, columns, directions, na_position):
+        """
+        Construye la clave numérica para la selección de top-k.
+        
+        Para una sola columna de punto flotante se usan los bits de los valores como
+        enteros sin signo que conservan el orden (invertidos si el orden es
+        descendente y con los nulos en un extremo), evitando el costo de calcular
+        rangos. En otro caso, incluidas las columnas enteras (que no entran exactas
+        en float64 por encima de 2**53), se usa la clave codificada de SortKeys.
+        
+        Args:
+            columns (tuple): Columnas por las cuales ordenar.
+            directions (tuple): Dirección de cada columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            numpy.ndarray: Claves cuyo orden ascendente es el orden pedido.
+        """
+        if len(columns) == 1:
+            series = self.data[columns[0]]
+            if pd.api.types.is_float_dtype(series):
+                keys, missing = SortingAlgorithms.float_keys(series.to_numpy(dtype=np.float64, na_value=np.nan))
+                if not directions[0]:
+                    keys = ~keys
+                # Ningún valor real queda en los extremos: los infinitos no empatan con los nulos
+                keys[missing] = np.iinfo(np.uint64).max if na_position == "last" else 0
+                return keys
+                
+        return SortKeys.encode(self.data, columns, directions, na_position)
+        
+    def _reverse_permutation(self, permutation, column, stable, na_position="last"):
+        """
+        Deriva la permutación en la dirección opuesta a partir de una ya calculada.
+        
+        Los nulos conservan su ubicación. En modo estable, los elementos iguales
+        conservan su orden original en lugar de quedar invertidos.
+        
+        Args:
+            permutation (numpy.ndarray): Permutación en la dirección opuesta.
+            column (str): Columna por la que se ordenó.
+            stable (bool): True si la permutación debe ser estable.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            numpy.ndarray: Permutación en la dirección pedida.
+        """
+        keys = self.data[column].to_numpy()[permutation]
+        missing = np.asarray(pd.isna(keys), dtype=bool)
+        
+        reversed_valid = permutation[~missing][::-1]
+        if stable and len(reversed_valid) > 1:
+            # Numerar los grupos de claves iguales y reordenar cada grupo por posición
+            reversed_keys = keys[~missing][::-1]
+            boundaries = np.concatenate(([False], reversed_keys[1:] != reversed_keys[:-1]))
+            groups = np.cumsum(boundaries)
+            reversed_valid = reversed_valid[np.lexsort((reversed_valid, groups))]
+            
+        if na_position == "first":
+            return np.concatenate((permutation[missing], reversed_valid))
+        return np.concatenate((reversed_valid, permutation[missing]))
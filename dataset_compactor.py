@@ -0,0 +1,211 @@
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class DatasetCompactor:
+    """
+    Reduce la memoria que ocupa un dataset obtenido de la API.
+    
+    pandas construye el DataFrame directamente desde el JSON: los números quedan
+    en int64/float64, los textos y los campos anidados (por ejemplo "roi") como
+    objetos de Python. La compactación separa cada campo anidado en su propia
+    columna, reduce los tipos numéricos solo cuando no se pierde ningún valor y
+    sin cambiar de entero a punto flotante o al revés (así una misma columna tiene
+    el mismo tipo en todas las instantáneas), convierte en categorías los textos
+    que se repiten y, si se pide, elimina columnas.
+    """
+    
+    def __init__(self, drop_columns=(), flatten=True, category_ratio=0.5):
+        """
+        Inicializa el compactador.
+        
+        Args:
+            drop_columns (iterable): Columnas a eliminar (por ejemplo "image"). Ninguna por defecto.
+            flatten (bool): True para separar los campos anidados en columnas.
+            category_ratio (float): Máxima proporción de valores distintos para
+                convertir una columna de texto en categórica.
+        """
+        self.drop_columns = set(drop_columns)
+        self.flatten = flatten
+        self.category_ratio = category_ratio
+        self.last_report = None
+        
+    def compact(self, dataframe):
+        """
+        Compacta un dataset.
+        
+        Args:
+            dataframe (pandas.DataFrame): Dataset a compactar.
+            
+        Returns:
+            pandas.DataFrame: Dataset compactado; el detalle queda en last_report.
+        """
+        before = self.memory_usage(dataframe)
+        report = []
+        columns = {}
+        
+        for column in dataframe.columns:
+            values = dataframe[column]
+            entry = {"column": str(column), "dtype_before": str(values.dtype), "bytes_before": before[column]}
+            
+            if column in self.drop_columns:
+                entry.update(dtype_after="eliminada", bytes_after=0)
+                report.append(entry)
+                continue
+                
+            if self.flatten and self._is_nested(values):
+                parts = {}
+                for name, part in self._split_nested(column, values).items():
+                    unique = self._unique_name(name, dataframe.columns, columns, parts)
+                    if unique != name:
+                        print(f"La columna '{name}' ya existe: el campo anidado se guarda como '{unique}'.")
+                    parts[unique] = self._compact_series(part)
+                columns.update(parts)
+                entry.update(
+                    dtype_after=", ".join(f"{name}: {part.dtype}" for name, part in parts.items()),
+                    bytes_after=sum(int(part.memory_usage(index=False, deep=True)) for part in parts.values())
+                )
+            else:
+                compacted = columns[column] = self._compact_series(values)
+                entry.update(dtype_after=str(compacted.dtype), bytes_after=int(compacted.memory_usage(index=False, deep=True)))
+            report.append(entry)
+            
+        self.last_report = report
+        return pd.DataFrame(columns, index=dataframe.index)
+        
+    @staticmethod
+    def memory_usage(dataframe):
+        """
+        Calcula la memoria de cada columna, incluidos los objetos de Python que referencia.
+        
+        Args:
+            dataframe (pandas.DataFrame): Dataset.
+            
+        Returns:
+            dict: Bytes por columna.
+        """
+        return {column: int(size) for column, size in dataframe.memory_usage(index=False, deep=True).items()}
+        
+    @staticmethod
+    def totals(report):
+        """
+        Suma la memoria antes y después de la compactación.
+        
+        Args:
+            report (list): Detalle por columna (ver last_report).
+            
+        Returns:
+            tuple: (bytes antes, bytes después).
+        """
+        return sum(entry["bytes_before"] for entry in report), sum(entry["bytes_after"] for entry in report)
+        
+    @staticmethod
+    def report(report, log=print):
+        """
+        Informa la memoria de cada columna antes y después de la compactación.
+        
+        Args:
+            report (list): Detalle por columna (ver last_report).
+            log (callable): Recibe cada línea del informe.
+        """
+        log(f"{'columna':<32} {'antes':>12} {'después':>12}  tipo")
+        for entry in sorted(report, key=lambda entry: entry["bytes_before"], reverse=True):
+            log(
+                f"{entry['column']:<32} {entry['bytes_before'] / 1024:9.1f} KB {entry['bytes_after'] / 1024:9.1f} KB"
+                f"  {entry['dtype_before']} -> {entry['dtype_after']}"
+            )
+        before, after = DatasetCompactor.totals(report)
+        saved = 1 - after / before if before else 0
+        log(f"{'total':<32} {before / 1024:9.1f} KB {after / 1024:9.1f} KB  ({saved:.0%} menos)")
+        
+    @staticmethod
+    def _is_nested(values):
+        """
+        Indica si una columna contiene diccionarios (campos anidados del JSON).
+        
+        Args:
+            values (pandas.Series): Columna.
+            
+        Returns:
+            bool: True si todos los valores no nulos son diccionarios y hay al menos uno.
+        """
+        if values.dtype != object:
+            return False
+        present = values.dropna()
+        return len(present) > 0 and all(isinstance(item, dict) for item in present)
+        
+    @staticmethod
+    def _split_nested(column, values):
+        """
+        Separa una columna de diccionarios en una columna por clave.
+        
+        Args:
+            column (str): Nombre de la columna.
+            values (pandas.Series): Columna de diccionarios o nulos.
+            
+        Returns:
+            dict: Series por nombre de columna ("<columna>_<clave>").
+        """
+        keys = {}
+        for item in values:
+            if isinstance(item, dict):
+                keys.update(dict.fromkeys(item))
+                
+        parts = {}
+        for key in keys:
+            items = [item.get(key) if isinstance(item, dict) else None for item in values]
+            parts[f"{column}_{key}"] = pd.Series(items, index=values.index, dtype=object).infer_objects()
+        return parts
+        
+    @staticmethod
+    def _unique_name(name, *taken):
+        """
+        Elige un nombre de columna que no esté en uso.
+        
+        Args:
+            name (str): Nombre deseado.
+            *taken: Colecciones de nombres ya usados.
+            
+        Returns:
+            str: El nombre deseado, o el mismo con un sufijo numérico si ya existe.
+        """
+        unique = name
+        suffix = 2
+        while any(unique in names for names in taken):
+            unique = f"{name}_{suffix}"
+            suffix += 1
+        return unique
+        
+    def _compact_series(self, values):
+        """
+        Elige el tipo más pequeño que representa todos los valores de una columna.
+        
+        Args:
+            values (pandas.Series): Columna.
+            
+        Returns:
+            pandas.Series: Columna con el tipo reducido, o la original si no se puede reducir.
+        """
+        if pd.api.types.is_bool_dtype(values):
+            return values
+            
+        if pd.api.types.is_integer_dtype(values):
+            return pd.to_numeric(values, downcast="integer")
+            
+        if pd.api.types.is_float_dtype(values):
+            # Siempre punto flotante, aunque esta instantánea solo tenga valores enteros:
+            # float32 solo si cada valor se conserva exactamente
+            array = values.to_numpy(dtype=np.float64)
+            with np.errstate(over="ignore"):
+                reduced = array.astype(np.float32)
+            if np.array_equal(reduced.astype(np.float64), array, equal_nan=True):
+                return pd.Series(reduced, index=values.index, name=values.name)
+            return values
+            
+        if values.dtype == object:
+            present = values.dropna()
+            if len(present) and all(isinstance(item, str) for item in present):
+                if present.nunique() <= self.category_ratio * len(present):
+                    return values.astype("category")
+        return values
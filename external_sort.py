@@ -0,0 +1,496 @@
+import os
+import heapq
+import shutil
+import tempfile
+from lazy_imports import lazy_import
+from sort_keys import SortKeys, ReversedKey
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+def _null_field(column):
+    """
+    Nombre del campo con la máscara de nulos de una columna de texto.
+    
+    Args:
+        column: Nombre de la columna.
+        
+    Returns:
+        str: Nombre del campo en el arreglo estructurado.
+    """
+    return f"{column}\x00nulo"
+    
+def _column_values(records, column):
+    """
+    Lee una columna de un arreglo estructurado, con los nulos de texto como None.
+    
+    Args:
+        records (numpy.ndarray): Filas como arreglo estructurado.
+        column: Nombre de la columna.
+        
+    Returns:
+        numpy.ndarray: Valores de la columna.
+    """
+    values = records[str(column)]
+    if _null_field(column) in records.dtype.names:
+        values = np.where(records[_null_field(column)], None, values.astype(object))
+    return values
+    
+
+class ExternalSortResult:
+    """
+    Resultado de un ordenamiento externo, guardado en un archivo mapeado en memoria.
+    
+    Las filas se leen de forma diferida: iterar el resultado no carga el dataset
+    completo, solo el bloque que se está recorriendo.
+    """
+    
+    def __init__(self, path, columns, row_count, temp_dir, chunk_rows=10000):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            path (str): Ruta del archivo .npy con el resultado ordenado.
+            columns (list): Nombres de las columnas.
+            row_count (int): Cantidad de filas.
+            temp_dir (str): Directorio temporal a eliminar al cerrar.
+            chunk_rows (int): Filas por bloque al iterar.
+        """
+        self.path = path
+        self.columns = columns
+        self.row_count = row_count
+        self.temp_dir = temp_dir
+        self.chunk_rows = chunk_rows
+        self._array = None
+        
+    def __len__(self):
+        return self.row_count
+        
+    def __iter__(self):
+        return self.iter_chunks()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    @property
+    def array(self):
+        """
+        Arreglo estructurado mapeado en memoria con el resultado.
+        
+        Returns:
+            numpy.memmap: Filas ordenadas.
+        """
+        if self._array is None:
+            self._array = np.load(self.path, mmap_mode="r")
+        return self._array
+        
+    def iter_chunks(self, chunk_rows=None):
+        """
+        Recorre el resultado ordenado por bloques.
+        
+        Args:
+            chunk_rows (int, optional): Filas por bloque. Por defecto self.chunk_rows.
+            
+        Yields:
+            pandas.DataFrame: Bloque de filas ordenadas.
+        """
+        chunk_rows = chunk_rows or self.chunk_rows
+        for start in range(0, self.row_count, chunk_rows):
+            yield self.get_rows(start, start + chunk_rows)
+            
+    def get_rows(self, start, stop):
+        """
+        Obtiene un tramo de filas del resultado.
+        
+        Args:
+            start (int): Primera fila (inclusiva).
+            stop (int): Última fila (exclusiva).
+            
+        Returns:
+            pandas.DataFrame: Filas del tramo.
+        """
+        block = np.asarray(self.array[start:stop])
+        columns = {column: _column_values(block, column) for column in self.columns}
+        return pd.DataFrame(columns, index=pd.RangeIndex(start, start + len(block)))
+        
+    def close(self):
+        """Libera el archivo mapeado y elimina los archivos temporales."""
+        self._array = None
+        if self.temp_dir and os.path.isdir(self.temp_dir):
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = None
+        
+class ExternalSorter:
+    """
+    Ordenamiento externo (fuera de memoria) por mezcla.
+    
+    La entrada se divide en tramos que respetan un presupuesto de memoria; cada
+    tramo se ordena en memoria y se vuelca a un archivo temporal mapeado en
+    memoria. Luego los tramos se combinan con una mezcla de k vías basada en un
+    montículo, leyendo cada tramo por bloques, y el resultado se escribe en otro
+    archivo mapeado en memoria que puede recorrerse de forma diferida.
+    
+    Las columnas de texto u objetos se guardan como cadenas de ancho fijo con
+    un campo aparte que marca los nulos; las numéricas conservan su tipo. Cada
+    tramo se ordena con las mismas claves que usa la mezcla (los valores ya
+    guardados, enteros exactos y nulos según su máscara). Con
+    varias columnas, la mezcla compara las claves de cada columna en orden de
+    prioridad, cada una con su dirección.
+    """
+    
+    def __init__(self, column, ascending=True, na_position="last", memory_budget=64 * 1024 * 1024, temp_dir=None):
+        """
+        Inicializa el ordenamiento externo.
+        
+        Args:
+            column (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            memory_budget (int): Memoria aproximada disponible en bytes.
+            temp_dir (str, optional): Directorio base para los archivos temporales.
+            
+        Raises:
+            ValueError: Si na_position no es válido o las direcciones no coinciden con las columnas.
+        """
+        if na_position not in SortKeys.NA_POSITIONS:
+            raise ValueError(f"Ubicación de nulos no válida: '{na_position}'.")
+        self.columns, self.directions = SortKeys.normalize(column, ascending)
+        self.column = column
+        self.ascending = ascending
+        self.na_position = na_position
+        self.memory_budget = memory_budget
+        self.temp_dir = temp_dir
+        
+    def sort(self, source):
+        """
+        Ordena un dataset que puede no entrar en memoria.
+        
+        Args:
+            source (pandas.DataFrame | iterable): Dataset o iterable de bloques
+                (por ejemplo pandas.read_csv(..., chunksize=...)).
+                
+        Returns:
+            ExternalSortResult: Resultado ordenado, recorrible por bloques.
+        """
+        if isinstance(source, pd.DataFrame):
+            source = [source]
+            
+        work_dir = tempfile.mkdtemp(prefix="external_sort_", dir=self.temp_dir)
+        try:
+            runs, columns = self._write_runs(source, work_dir)
+            result_path, row_count = self._merge_runs(runs, columns, work_dir)
+        except BaseException:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+            
+        # Los tramos intermedios ya no son necesarios
+        for path in runs:
+            os.remove(path)
+        return ExternalSortResult(result_path, columns, row_count, work_dir)
+        
+    def _write_runs(self, source, work_dir):
+        """
+        Divide la entrada en tramos ordenados y los vuelca a disco.
+        
+        Args:
+            source (iterable): Bloques de entrada.
+            work_dir (str): Directorio de trabajo.
+            
+        Returns:
+            tuple: (rutas de los tramos, nombres de columnas).
+        """
+        runs = []
+        columns = None
+        pending = []
+        pending_bytes = 0
+        
+        for chunk in source:
+            if columns is None:
+                columns = list(chunk.columns)
+            if len(chunk) == 0:
+                continue
+            chunk = chunk[columns]
+            
+            # Reservar la mitad del presupuesto para las copias durante el ordenamiento
+            chunk_bytes = int(chunk.memory_usage(deep=True, index=False).sum())
+            row_bytes = max(chunk_bytes // len(chunk), 1)
+            run_rows = max(self.memory_budget // (2 * row_bytes), 1)
+            
+            start = 0
+            while start < len(chunk):
+                free_rows = max(run_rows - sum(len(part) for part in pending), 1)
+                part = chunk.iloc[start:start + free_rows]
+                pending.append(part)
+                pending_bytes += len(part) * row_bytes
+                start += len(part)
+                if pending_bytes * 2 >= self.memory_budget:
+                    runs.append(self._spill_run(pending, work_dir, len(runs)))
+                    pending, pending_bytes = [], 0
+                    
+        if pending:
+            runs.append(self._spill_run(pending, work_dir, len(runs)))
+        return runs, columns or []
+        
+    def _spill_run(self, parts, work_dir, index):
+        """
+        Ordena un tramo en memoria y lo guarda en un archivo mapeado en memoria.
+        
+        Args:
+            parts (list): Bloques que forman el tramo.
+            work_dir (str): Directorio de trabajo.
+            index (int): Número de tramo.
+            
+        Returns:
+            str: Ruta del archivo del tramo.
+        """
+        run = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0].reset_index(drop=True)
+        records = self._to_structured(run)
+        # Ordenar los valores tal como quedaron guardados, para que el orden del tramo sea el de la mezcla
+        keys = SortKeys.encode(self._key_frame(records), list(self.columns), self.directions, self.na_position)
+        records = records[np.argsort(keys, kind="stable")]
+        
+        path = os.path.join(work_dir, f"run_{index:05d}.npy")
+        mapped = np.lib.format.open_memmap(path, mode="w+", dtype=records.dtype, shape=records.shape)
+        mapped[:] = records
+        mapped.flush()
+        del mapped
+        return path
+        
+    @staticmethod
+    def _to_structured(dataframe):
+        """
+        Convierte un DataFrame en un arreglo estructurado de NumPy.
+        
+        Args:
+            dataframe (pandas.DataFrame): Datos a convertir.
+            
+        Returns:
+            numpy.ndarray: Arreglo estructurado con un campo por columna, más la
+            máscara de nulos de cada columna de texto.
+        """
+        fields = []
+        arrays = []
+        for column in dataframe.columns:
+            values = dataframe[column]
+            if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+                array = values.to_numpy()
+                if array.dtype == object:
+                    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                missing = values.isna().to_numpy()
+                array = values.astype(object).where(~missing, "").astype(str).to_numpy(dtype=str)
+                fields.append((_null_field(column), np.bool_))
+                arrays.append(missing)
+            fields.append((str(column), array.dtype))
+            arrays.append(array)
+            
+        records = np.empty(len(dataframe), dtype=fields)
+        for (name, _), array in zip(fields, arrays):
+            records[name] = array
+        return records
+        
+    def _key_frame(self, records):
+        """
+        Reconstruye las columnas de ordenamiento a partir de un tramo guardado.
+        
+        Args:
+            records (numpy.ndarray): Tramo como arreglo estructurado.
+            
+        Returns:
+            pandas.DataFrame: Columnas de ordenamiento, con los nulos de texto como None.
+        """
+        return pd.DataFrame({column: _column_values(records, column) for column in self.columns})
+        
+    def _merge_runs(self, runs, columns, work_dir):
+        """
+        Combina los tramos ordenados con una mezcla de k vías.
+        
+        Args:
+            runs (list): Rutas de los tramos.
+            columns (list): Nombres de las columnas.
+            work_dir (str): Directorio de trabajo.
+            
+        Returns:
+            tuple: (ruta del resultado, cantidad de filas).
+        """
+        mapped_runs = [np.load(path, mmap_mode="r") for path in runs]
+        row_count = sum(len(run) for run in mapped_runs)
+        result_dtype = self._result_dtype(mapped_runs, columns)
+        result_path = os.path.join(work_dir, "sorted.npy")
+        result = np.lib.format.open_memmap(result_path, mode="w+", dtype=result_dtype, shape=(row_count,))
+        
+        if not mapped_runs:
+            del result
+            return result_path, 0
+            
+        # Bloques de lectura y escritura dentro del presupuesto de memoria
+        block_rows = max(self.memory_budget // (2 * max(len(mapped_runs), 1) * result_dtype.itemsize), 1)
+        out_rows = max(self.memory_budget // (2 * result_dtype.itemsize), 1)
+        
+        buffers = [None] * len(mapped_runs)
+        offsets = [0] * len(mapped_runs)
+        heap = []
+        for run_index in range(len(mapped_runs)):
+            entry = self._next_entry(mapped_runs, buffers, offsets, run_index, block_rows)
+            if entry is not None:
+                heap.append(entry)
+        heapq.heapify(heap)
+        
+        written = 0
+        out_runs = []
+        out_positions = []
+        while heap:
+            _, run_index, position = heap[0]
+            out_runs.append(run_index)
+            out_positions.append(position)
+            
+            entry = self._next_entry(mapped_runs, buffers, offsets, run_index, block_rows)
+            if entry is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, entry)
+                
+            if len(out_runs) >= out_rows or not heap:
+                self._flush_block(result, written, mapped_runs, out_runs, out_positions)
+                written += len(out_runs)
+                out_runs, out_positions = [], []
+                
+        result.flush()
+        del result
+        return result_path, row_count
+        
+    def _next_entry(self, mapped_runs, buffers, offsets, run_index, block_rows):
+        """
+        Obtiene la siguiente entrada del montículo para un tramo, leyendo por bloques.
+        
+        Args:
+            mapped_runs (list): Tramos mapeados en memoria.
+            buffers (list): Bloque de claves en memoria de cada tramo (inicio, claves).
+            offsets (list): Próxima posición a leer de cada tramo.
+            run_index (int): Tramo a avanzar.
+            block_rows (int): Filas por bloque de lectura.
+            
+        Returns:
+            tuple: (clave, tramo, posición), o None si el tramo terminó.
+        """
+        position = offsets[run_index]
+        run = mapped_runs[run_index]
+        if position >= len(run):
+            return None
+            
+        buffer = buffers[run_index]
+        if buffer is None or position >= buffer[0] + len(buffer[1]):
+            buffer = (position, self._block_keys(run[position:position + block_rows]))
+            buffers[run_index] = buffer
+            
+        offsets[run_index] = position + 1
+        return buffer[1][position - buffer[0]], run_index, position
+        
+    def _block_keys(self, block):
+        """
+        Calcula las claves de comparación de un bloque de filas.
+        
+        Args:
+            block (numpy.ndarray): Filas de un tramo (arreglo estructurado).
+            
+        Returns:
+            list: Por fila, una tupla (rango de nulo, clave, rango de nulo, clave, ...)
+            con un par por columna de ordenamiento, comparable entre tramos.
+        """
+        pairs = [
+            self._column_keys(block, column, direction)
+            for column, direction in zip(self.columns, self.directions)
+        ]
+        if len(pairs) == 1:
+            return pairs[0]
+        return [sum(row, ()) for row in zip(*pairs)]
+        
+    def _column_keys(self, block, column, ascending):
+        """
+        Calcula las claves de comparación de una columna.
+        
+        Args:
+            block (numpy.ndarray): Filas de un tramo (arreglo estructurado).
+            column: Columna de ordenamiento.
+            ascending (bool): Dirección de la columna.
+            
+        Returns:
+            list: Tuplas (rango de nulo, clave) comparables entre tramos.
+        """
+        values = np.asarray(block[str(column)])
+        if values.dtype.kind in "Mm":
+            missing = np.isnat(values)
+            values = values.view(np.int64)
+        elif values.dtype.kind == "f":
+            missing = np.isnan(values)
+            values = np.where(missing, 0.0, values)
+        elif _null_field(column) in block.dtype.names:
+            missing = np.asarray(block[_null_field(column)])
+        else:
+            missing = np.zeros(len(values), dtype=bool)
+            
+        # Enteros de Python: exactos aun por encima de 2**53 y sin desborde al negarlos
+        keys = values.tolist()
+        if not ascending:
+            keys = [-key for key in keys] if values.dtype.kind in "biuf" else [ReversedKey(key) for key in keys]
+            
+        # Los nulos se ordenan por su rango: 1 al final o -1 al inicio
+        null_rank = 1 if self.na_position == "last" else -1
+        return list(zip(np.where(missing, null_rank, 0).tolist(), keys))
+        
+    @staticmethod
+    def _flush_block(result, start, mapped_runs, out_runs, out_positions):
+        """
+        Copia un bloque de filas mezcladas al resultado con lecturas vectorizadas.
+        
+        Args:
+            result (numpy.memmap): Arreglo de salida.
+            start (int): Posición de salida del bloque.
+            mapped_runs (list): Tramos mapeados en memoria.
+            out_runs (list): Tramo de origen de cada fila del bloque.
+            out_positions (list): Posición de origen de cada fila del bloque.
+        """
+        out_runs = np.asarray(out_runs)
+        out_positions = np.asarray(out_positions)
+        # Los tramos sin máscara de nulos para una columna la dejan en False
+        block = np.zeros(len(out_runs), dtype=result.dtype)
+        for run_index in np.unique(out_runs):
+            mask = out_runs == run_index
+            source = mapped_runs[run_index][out_positions[mask]]
+            for name in result.dtype.names:
+                if name in source.dtype.names:
+                    block[name][mask] = source[name]
+        result[start:start + len(block)] = block
+        
+    @staticmethod
+    def _result_dtype(mapped_runs, columns):
+        """
+        Calcula el tipo del resultado promoviendo los tipos de todos los tramos.
+        
+        Args:
+            mapped_runs (list): Tramos mapeados en memoria.
+            columns (list): Nombres de las columnas.
+            
+        Returns:
+            numpy.dtype: Tipo estructurado común.
+        """
+        fields = []
+        for column in columns:
+            if any(_null_field(column) in run.dtype.names for run in mapped_runs):
+                fields.append((_null_field(column), np.bool_))
+            name = str(column)
+            dtypes = [run.dtype[name] for run in mapped_runs]
+            if not dtypes:
+                fields.append((name, np.float64))
+            elif all(dtype.kind == "U" for dtype in dtypes):
+                fields.append((name, max(dtypes, key=lambda dtype: dtype.itemsize)))
+            elif any(dtype.kind == "U" for dtype in dtypes):
+                # Tipos mezclados entre tramos: guardar como texto
+                width = max(dtype.itemsize // 4 if dtype.kind == "U" else 32 for dtype in dtypes)
+                fields.append((name, f"U{width}"))
+            else:
+                fields.append((name, np.result_type(*dtypes)))
+        return np.dtype(fields)
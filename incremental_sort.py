@@ -0,0 +1,181 @@
+import copy
+from bisect import bisect_left, insort
+from lazy_imports import lazy_import
+from sort_keys import SortKeys
+
+np = lazy_import("numpy")
+
+class IncrementalSorter:
+    """
+    Mantiene ordenado un dataset que se actualiza por instantáneas.
+    
+    Cada instantánea se compara con la anterior por una columna identificadora:
+    solo las filas nuevas, eliminadas o cuya clave de ordenamiento cambió se
+    quitan y se vuelven a insertar con búsqueda binaria en la lista ordenada de
+    (clave, id). Si cambia una fracción grande de las filas se reordena todo.
+    Los empates se resuelven por id, de modo que el orden no depende de la
+    posición de cada fila en la instantánea.
+    """
+    
+    def __init__(self, columns, ascending=True, na_position="last", id_column="id", rebuild_ratio=0.25):
+        """
+        Inicializa el ordenamiento incremental.
+        
+        Args:
+            columns (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            id_column (str): Columna que identifica cada fila entre instantáneas.
+            rebuild_ratio (float): Fracción de filas cambiadas a partir de la cual se reordena todo.
+        """
+        self.columns, self.ascending = SortKeys.normalize(columns, ascending)
+        self.na_position = na_position
+        self.id_column = id_column
+        self.rebuild_ratio = rebuild_ratio
+        self.spec = (self.columns, self.ascending, na_position, id_column)
+        
+        self._order = []
+        self._keys = {}
+        self._view_ids = []
+        self._snapshot = None
+        
+    def reset(self, data):
+        """
+        Ordena una instantánea completa y la toma como punto de partida.
+        
+        Args:
+            data (pandas.DataFrame): Instantánea con ids únicos.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante.
+            
+        Raises:
+            ValueError: Si falta la columna identificadora o hay ids repetidos.
+        """
+        ids = self._ids(data)
+        keys = SortKeys.row_keys(data, self.columns, self.ascending, self.na_position)
+        self._keys = dict(zip(ids, keys))
+        self._order = sorted(zip(keys, ids))
+        return self._finish(data, ids)
+        
+    def copy(self):
+        """
+        Copia el ordenamiento para aplicar una instantánea sin modificar el original.
+        
+        Returns:
+            IncrementalSorter: Copia independiente; update no altera el estado de este objeto.
+        """
+        other = copy.copy(self)
+        # update reemplaza el resto del estado, pero modifica la lista ordenada en el lugar
+        other._order = list(self._order)
+        return other
+        
+    def update(self, data):
+        """
+        Aplica una nueva instantánea reubicando solo las filas que cambiaron.
+        
+        Args:
+            data (pandas.DataFrame): Nueva instantánea con ids únicos.
+            
+        Returns:
+            tuple: (permutación de las filas de data, diccionario con los ids
+            agregados, eliminados y reubicados y las posiciones de la vista que
+            cambiaron en "rows").
+            
+        Raises:
+            ValueError: Si falta la columna identificadora o hay ids repetidos.
+        """
+        ids = self._ids(data)
+        keys = SortKeys.row_keys(data, self.columns, self.ascending, self.na_position)
+        new_keys = dict(zip(ids, keys))
+        old_keys = self._keys
+        
+        removed = [row_id for row_id in old_keys if row_id not in new_keys]
+        added = [row_id for row_id in ids if row_id not in old_keys]
+        moved = [row_id for row_id in ids if row_id in old_keys and old_keys[row_id] != new_keys[row_id]]
+        
+        touched = len(removed) + len(added) + len(moved)
+        if touched > self.rebuild_ratio * max(len(ids), 1):
+            self._order = sorted(zip(keys, ids))
+        else:
+            order = self._order
+            for row_id in removed + moved:
+                del order[bisect_left(order, (old_keys[row_id], row_id))]
+            for row_id in added + moved:
+                insort(order, (new_keys[row_id], row_id))
+        self._keys = new_keys
+        
+        old_view_ids = self._view_ids
+        changed_ids = self._changed_values(data, ids)
+        permutation = self._finish(data, ids)
+        
+        # Posiciones de la vista que muestran otra fila o cuyos valores cambiaron
+        rows = [
+            position for position, row_id in enumerate(self._view_ids)
+            if position >= len(old_view_ids) or old_view_ids[position] != row_id or row_id in changed_ids
+        ]
+        rows.extend(range(len(self._view_ids), len(old_view_ids)))
+        
+        changes = {"added": added, "removed": removed, "moved": moved, "rows": rows}
+        return permutation, changes
+        
+    def _ids(self, data):
+        """
+        Obtiene los ids de una instantánea y verifica que sean únicos.
+        
+        Args:
+            data (pandas.DataFrame): Instantánea.
+            
+        Returns:
+            list: Ids en el orden de las filas.
+        """
+        if self.id_column not in data.columns:
+            raise ValueError(f"La columna identificadora '{self.id_column}' no existe.")
+        ids = data[self.id_column].tolist()
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"La columna identificadora '{self.id_column}' tiene valores repetidos.")
+        return ids
+        
+    def _changed_values(self, data, ids):
+        """
+        Obtiene los ids cuyas filas cambiaron en cualquier columna respecto de la instantánea anterior.
+        
+        Args:
+            data (pandas.DataFrame): Nueva instantánea.
+            ids (list): Ids de la nueva instantánea.
+            
+        Returns:
+            set: Ids con al menos un valor distinto (o nuevos).
+        """
+        previous = self._snapshot
+        current = data.set_index(self.id_column)
+        if previous is None or list(previous.columns) != list(current.columns):
+            return set(ids)
+            
+        previous = previous.reindex(current.index)
+        different = np.zeros(len(current), dtype=bool)
+        for column in current.columns:
+            old, new = previous[column], current[column]
+            try:
+                unequal = (old != new).to_numpy(dtype=bool)
+            except (TypeError, ValueError):
+                unequal = (old.astype(str) != new.astype(str)).to_numpy(dtype=bool)
+            # Dos nulos se consideran iguales
+            different |= unequal & ~(old.isna().to_numpy() & new.isna().to_numpy())
+        return {row_id for row_id, flag in zip(ids, different.tolist()) if flag}
+        
+    def _finish(self, data, ids):
+        """
+        Guarda la vista resultante y calcula la permutación de las filas de data.
+        
+        Args:
+            data (pandas.DataFrame): Instantánea actual.
+            ids (list): Ids de la instantánea.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante.
+        """
+        positions = {row_id: position for position, row_id in enumerate(ids)}
+        self._view_ids = [row_id for _, row_id in self._order]
+        self._snapshot = data.set_index(self.id_column)
+        return np.fromiter((positions[row_id] for row_id in self._view_ids), dtype=np.intp, count=len(self._view_ids))
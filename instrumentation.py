@@ -0,0 +1,262 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+class SortCounters:
+    """
+    Contadores de operaciones de un algoritmo de ordenamiento.
+    
+    Los algoritmos por registros reciben una instancia opcional y suman
+    intercambios y movimientos; las comparaciones se cuentan con CountingKey.
+    """
+    
+    __slots__ = ("comparisons", "swaps", "moves")
+    
+    def __init__(self):
+        """Inicializa los contadores en cero."""
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        
+    def to_dict(self):
+        """
+        Obtiene los contadores como diccionario.
+        
+        Returns:
+            dict: Comparaciones, intercambios y movimientos.
+        """
+        return {"comparisons": self.comparisons, "swaps": self.swaps, "moves": self.moves}
+        
+class CountingKey:
+    """
+    Clave de ordenamiento que cuenta cada comparación en un SortCounters.
+    
+    Solo se usa cuando se piden contadores: sin ellos los algoritmos comparan
+    las claves originales y no pagan ningún costo adicional.
+    """
+    
+    __slots__ = ("value", "counters")
+    
+    def __init__(self, value, counters):
+        """
+        Inicializa la clave.
+        
+        Args:
+            value: Clave original.
+            counters (SortCounters): Contadores donde sumar las comparaciones.
+        """
+        self.value = value
+        self.counters = counters
+        
+    def __lt__(self, other):
+        self.counters.comparisons += 1
+        return self.value < other.value
+        
+    def __le__(self, other):
+        self.counters.comparisons += 1
+        return self.value <= other.value
+        
+    def __gt__(self, other):
+        self.counters.comparisons += 1
+        return self.value > other.value
+        
+    def __ge__(self, other):
+        self.counters.comparisons += 1
+        return self.value >= other.value
+        
+    def __eq__(self, other):
+        self.counters.comparisons += 1
+        return self.value == other.value
+        
+    __hash__ = None
+    
+class OperationRecord:
+    """
+    Medición de una operación (descarga u ordenamiento): duración de cada etapa,
+    detalles y, opcionalmente, contadores del algoritmo.
+    """
+    
+    def __init__(self, name, details=None, counters=None):
+        """
+        Inicializa la medición.
+        
+        Args:
+            name (str): Nombre de la operación.
+            details (dict, optional): Datos descriptivos (algoritmo, filas, URL...).
+            counters (SortCounters, optional): Contadores de operaciones, o None.
+        """
+        self.name = name
+        self.details = dict(details or {})
+        self.counters = counters
+        self.phases = {}
+        self.started_at = time.time()
+        self.total = None
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide la duración de una etapa; las etapas repetidas se acumulan.
+        
+        Args:
+            name (str): Nombre de la etapa.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+            
+    def add(self, name, seconds):
+        """
+        Suma tiempo a una etapa (seguro entre hilos).
+        
+        Args:
+            name (str): Nombre de la etapa.
+            seconds (float): Duración a sumar.
+        """
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+            
+    def set(self, key, value):
+        """
+        Guarda un dato descriptivo de la operación.
+        
+        Args:
+            key (str): Nombre del dato.
+            value: Valor (serializable como JSON).
+        """
+        self.details[key] = value
+        
+    def finish(self):
+        """Registra la duración total de la operación."""
+        self.total = time.perf_counter() - self._started
+        
+    def to_dict(self):
+        """
+        Obtiene la medición como diccionario serializable.
+        
+        Returns:
+            dict: Operación, inicio, duración total y por etapa (en segundos), detalles y contadores.
+        """
+        return {
+            "operation": self.name,
+            "started_at": self.started_at,
+            "total_seconds": self.total,
+            "phases": dict(self.phases),
+            "details": dict(self.details),
+            "counters": self.counters.to_dict() if self.counters is not None else None
+        }
+        
+class _NullRecord:
+    """Medición vacía que se usa con la instrumentación desactivada."""
+    
+    counters = None
+    
+    def phase(self, name):
+        return _NULL_CONTEXT
+        
+    def add(self, name, seconds):
+        pass
+        
+    def set(self, key, value):
+        pass
+        
+_NULL_CONTEXT = nullcontext()
+NULL_RECORD = _NullRecord()
+
+class Instrumentation:
+    """
+    Registro de mediciones de las operaciones de la aplicación.
+    
+    Desactivada, cada operación recibe NULL_RECORD y las etapas son contextos
+    vacíos, así que el costo es prácticamente nulo. Activada, guarda las últimas
+    mediciones, que pueden consultarse o exportarse como JSON.
+    """
+    
+    def __init__(self, enabled=False, count_operations=False, history=50):
+        """
+        Inicializa la instrumentación.
+        
+        Args:
+            enabled (bool): True para medir los tiempos de cada etapa.
+            count_operations (bool): True para contar comparaciones, intercambios y
+                movimientos de los algoritmos (hace más lentos los ordenamientos).
+            history (int): Cantidad de mediciones a conservar.
+        """
+        self.enabled = enabled
+        self.count_operations = count_operations
+        self._records = deque(maxlen=history)
+        
+    @contextmanager
+    def operation(self, name, with_counters=False, **details):
+        """
+        Mide una operación completa.
+        
+        Args:
+            name (str): Nombre de la operación ("fetch", "sort"...).
+            with_counters (bool): True si la operación ejecuta un algoritmo cuyas
+                operaciones se cuentan (cuando count_operations está activo).
+            **details: Datos descriptivos de la operación.
+            
+        Yields:
+            OperationRecord: Medición en curso, o NULL_RECORD si está desactivada.
+        """
+        if not self.enabled:
+            yield NULL_RECORD
+            return
+            
+        counters = SortCounters() if with_counters and self.count_operations else None
+        record = OperationRecord(name, details, counters)
+        try:
+            yield record
+        except BaseException as e:
+            record.set("error", type(e).__name__)
+            raise
+        finally:
+            record.finish()
+            self._records.append(record)
+            
+    def records(self, name=None):
+        """
+        Obtiene las mediciones guardadas, de la más antigua a la más reciente.
+        
+        Args:
+            name (str, optional): Filtrar por nombre de operación.
+            
+        Returns:
+            list: Mediciones como diccionarios.
+        """
+        return [record.to_dict() for record in list(self._records) if name is None or record.name == name]
+        
+    def last(self, name):
+        """
+        Obtiene la medición más reciente de una operación.
+        
+        Args:
+            name (str): Nombre de la operación.
+            
+        Returns:
+            dict: Medición, o None si no hay ninguna.
+        """
+        for record in reversed(list(self._records)):
+            if record.name == name:
+                return record.to_dict()
+        return None
+        
+    def clear(self):
+        """Elimina las mediciones guardadas."""
+        self._records.clear()
+        
+    def export_json(self, path):
+        """
+        Exporta las mediciones guardadas a un archivo JSON.
+        
+        Args:
+            path (str): Ruta del archivo.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"records": self.records()}, file, indent=2, ensure_ascii=False, default=str)
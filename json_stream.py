@@ -0,0 +1,378 @@
+import codecs
+import json
+import math
+import re
+import struct
+from array import array
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class JSONArrayParser:
+    """
+    Analizador incremental de un arreglo JSON de objetos.
+    
+    Recibe el texto en fragmentos de cualquier tamaño (tal como llegan de la red)
+    y entrega cada elemento del arreglo apenas está completo, sin guardar el
+    cuerpo entero ni la lista de todos los elementos.
+    """
+    
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+    # Final de texto que todavía puede completarse con el próximo fragmento: un literal
+    # cortado ("tr", "-Inf"), la cola de un número ("1." o "1e+" se leen como 1 seguido
+    # de ".", "e+") o solo espacios
+    _LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+    _PARTIAL_TAIL = re.compile(
+        r"(?:" + "|".join(sorted({re.escape(literal[:size]) for literal in _LITERALS for size in range(1, len(literal))}, key=len, reverse=True))
+        + r"|\.\d*(?:[eE][-+]?\d*)?|[eE][-+]?\d*|[ \t\n\r]*)"
+    )
+    
+    # Escape \uXXXX (o par sustituto) cortado al final del texto
+    _PARTIAL_ESCAPE = re.compile(r"u[0-9a-fA-F]{0,4}(?:\\(?:u[0-9a-fA-F]{0,4})?)?")
+    
+    # Qué se espera a continuación dentro del arreglo
+    _FIRST = "first"
+    _VALUE = "value"
+    _SEPARATOR = "separator"
+    
+    def __init__(self):
+        """Inicializa el analizador antes del "[" inicial."""
+        self._decoder = json.JSONDecoder()
+        self._scan = self._decoder.scan_once
+        self._bytes = codecs.getincrementaldecoder("utf-8")()
+        self._pending = ""
+        self._started = False
+        self._finished = False
+        self._expect = self._FIRST
+        
+    def feed(self, chunk):
+        """
+        Agrega un fragmento del cuerpo y obtiene los elementos completos.
+        
+        Args:
+            chunk (bytes | str): Fragmento del cuerpo de la respuesta.
+            
+        Returns:
+            list: Elementos del arreglo que se completaron con este fragmento.
+            
+        Raises:
+            ValueError: Si el cuerpo no es un arreglo JSON válido; se detecta apenas
+                el texto recibido deja de poder completarse.
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._bytes.decode(chunk)
+        text = self._pending + chunk
+        position = 0
+        items = []
+        
+        if not self._started:
+            position = self._WHITESPACE.match(text).end()
+            if position == len(text):
+                self._pending = ""
+                return items
+            if text[position] != "[":
+                raise ValueError("La respuesta no es un arreglo JSON.")
+            self._started = True
+            position += 1
+            
+        scan = self._scan
+        whitespace = self._WHITESPACE
+        length = len(text)
+        while not self._finished:
+            position = whitespace.match(text, position).end()
+            if position == length:
+                break
+            char = text[position]
+            
+            if self._expect is self._SEPARATOR:
+                # Entre elementos va exactamente una coma, o el "]" final
+                if char == ",":
+                    self._expect = self._VALUE
+                    position += 1
+                elif char == "]":
+                    self._finished = True
+                    position += 1
+                else:
+                    raise ValueError(f"JSON inválido: se esperaba ',' o ']' y llegó {text[position:position + 20]!r}.")
+                continue
+                
+            if char == "]":
+                if self._expect is self._VALUE:
+                    raise ValueError("JSON inválido: coma sobrante antes de ']'.")
+                self._finished = True
+                position += 1
+                break
+                
+            try:
+                item, end = scan(text, position)
+            except StopIteration as e:
+                self._check_incomplete(text, e.value, "se esperaba un valor")
+                break
+            except json.JSONDecodeError as e:
+                self._check_incomplete(text, e.pos, e.msg)
+                break
+            if end == length and not isinstance(item, (dict, list)):
+                # Un número al final del fragmento puede seguir en el próximo
+                break
+            items.append(item)
+            position = end
+            self._expect = self._SEPARATOR
+            
+        self._pending = text[position:]
+        return items
+        
+    def close(self):
+        """
+        Verifica que el arreglo haya terminado.
+        
+        Raises:
+            ValueError: Si el cuerpo terminó antes de cerrar el arreglo o quedó texto sin analizar.
+        """
+        rest = self._pending + self._bytes.decode(b"", final=True)
+        if not self._finished:
+            if rest.strip():
+                # Volver a analizar para informar el error real del JSON
+                self._decoder.raw_decode(rest, self._WHITESPACE.match(rest).end())
+            raise ValueError("La respuesta JSON terminó antes de cerrar el arreglo.")
+        if rest.strip():
+            raise ValueError("La respuesta JSON tiene texto después del arreglo.")
+            
+    @classmethod
+    def _check_incomplete(cls, text, position, message):
+        """
+        Verifica que un elemento que no se pudo analizar esté solo incompleto.
+        
+        Args:
+            text (str): Texto pendiente.
+            position (int): Posición del error informada por el decodificador.
+            message (str): Mensaje del decodificador.
+            
+        Raises:
+            ValueError: Si el texto ya no es el comienzo de ningún JSON válido.
+        """
+        rest = text[position:]
+        if message.startswith("Unterminated string"):
+            # La cadena llega hasta el final del texto recibido
+            return
+        if message.startswith("Invalid \\uXXXX") and cls._PARTIAL_ESCAPE.fullmatch(rest):
+            return
+        if cls._PARTIAL_TAIL.fullmatch(rest):
+            return
+        raise ValueError(f"JSON inválido: {message} (cerca de {text[position:position + 20]!r}).")
+        
+class ColumnBuffers:
+    """
+    Columnas en construcción para armar un DataFrame registro por registro.
+    
+    Cada campo se guarda en un arreglo tipado que crece: enteros en array("q"),
+    números con decimales o nulos en array("d") y el resto (textos, booleanos,
+    objetos anidados) en una lista. Si llega un valor que el tipo actual no
+    admite, la columna se convierte al tipo más general, con las mismas reglas
+    que usa pandas al construir un DataFrame desde una lista de diccionarios:
+    un campo ausente es NaN y un null explícito es None, así que una columna sin
+    valores es float64 si le falta a algún registro y object si todos sus
+    valores son null.
+    """
+    
+    NULL = "null"
+    INTEGER = "integer"
+    FLOAT = "float"
+    OBJECT = "object"
+    
+    _INT64_MIN = -(1 << 63)
+    _INT64_MAX = (1 << 63) - 1
+    # En los arreglos de punto flotante, un null explícito se guarda como un NaN con
+    # estos bits, distinto del NaN de un campo ausente, por si la columna pasa a object
+    _NONE_BITS = 0x7FF8000000000001
+    _NONE = struct.unpack("<d", struct.pack("<Q", _NONE_BITS))[0]
+    
+    def __init__(self):
+        """Inicializa las columnas vacías."""
+        self.rows = 0
+        self._kinds = {}
+        self._buffers = {}
+        
+    def append(self, record):
+        """
+        Agrega un registro.
+        
+        Args:
+            record (dict): Campos del registro; los campos ausentes quedan nulos.
+            
+        Raises:
+            ValueError: Si el registro no es un objeto JSON.
+        """
+        self.extend((record,))
+        
+    def extend(self, records):
+        """
+        Agrega varios registros.
+        
+        Args:
+            records (iterable): Registros (diccionarios); los campos ausentes quedan nulos.
+            
+        Raises:
+            ValueError: Si algún registro no es un objeto JSON.
+        """
+        kinds = self._kinds
+        buffers = self._buffers
+        low, high = self._INT64_MIN, self._INT64_MAX
+        OBJECT, FLOAT, INTEGER, NULL = ColumnBuffers.OBJECT, ColumnBuffers.FLOAT, ColumnBuffers.INTEGER, ColumnBuffers.NULL
+        
+        for record in records:
+            if type(record) is not dict:
+                raise ValueError("Se esperaba un arreglo de objetos JSON.")
+                
+            for field, value in record.items():
+                kind = kinds.get(field)
+                if kind is None:
+                    # Campo nuevo: los registros anteriores no lo tenían
+                    kind = kinds[field] = NULL
+                    buffers[field] = [math.nan] * self.rows
+                if kind is NULL:
+                    # El tipo de la columna se decide con su primer valor no nulo
+                    if value is None:
+                        buffers[field].append(None)
+                        continue
+                    kind = self._start_column(field, value)
+                elif value is None:
+                    self._append_null(field, kind)
+                    continue
+                    
+                value_type = type(value)
+                if kind is OBJECT:
+                    buffers[field].append(value)
+                elif value_type is float and kind is FLOAT:
+                    buffers[field].append(value)
+                elif value_type is int and low <= value <= high:
+                    if kind is INTEGER or kind is FLOAT:
+                        buffers[field].append(value)
+                    else:
+                        self._promote(field, value)
+                else:
+                    self._promote(field, value)
+                    
+            self.rows += 1
+            # Los campos que faltan en este registro quedan nulos
+            if len(record) != len(kinds):
+                for field, kind in kinds.items():
+                    if len(buffers[field]) < self.rows:
+                        self._append_null(field, kind, missing=True)
+                        
+    def numeric_columns(self):
+        """
+        Obtiene las columnas que hasta ahora son numéricas.
+        
+        Returns:
+            list: Nombres de las columnas enteras o de punto flotante.
+        """
+        return [field for field, kind in self._kinds.items() if kind in (ColumnBuffers.INTEGER, ColumnBuffers.FLOAT)]
+        
+    def to_dataframe(self):
+        """
+        Construye el DataFrame a partir de las columnas.
+        
+        Las columnas numéricas se entregan a pandas como vistas de NumPy sobre los
+        arreglos, sin copiar ni pasar por objetos de Python.
+        
+        Returns:
+            pandas.DataFrame: Dataset con una columna por campo, en orden de aparición.
+        """
+        columns = {}
+        for field, kind in self._kinds.items():
+            buffer = self._buffers[field]
+            if kind == ColumnBuffers.INTEGER:
+                columns[field] = np.frombuffer(buffer, dtype=np.int64)
+            elif kind == ColumnBuffers.FLOAT:
+                columns[field] = np.frombuffer(buffer, dtype=np.float64)
+            elif kind == ColumnBuffers.NULL:
+                if all(value is None for value in buffer):
+                    columns[field] = pd.Series(buffer, dtype=object)
+                else:
+                    # Algún registro no tenía el campo: pandas lo toma como NaN
+                    columns[field] = np.full(self.rows, np.nan)
+            else:
+                columns[field] = pd.Series(buffer, dtype=object).infer_objects()
+        return pd.DataFrame(columns, index=pd.RangeIndex(self.rows), columns=list(columns), copy=False)
+        
+    def _start_column(self, field, value):
+        """
+        Crea la columna de un campo con su primer valor no nulo.
+        
+        Los registros anteriores, que no tenían el campo o lo tenían nulo, quedan nulos.
+        
+        Args:
+            field (str): Nombre del campo.
+            value: Primer valor no nulo del campo.
+            
+        Returns:
+            str: Tipo inicial de la columna.
+        """
+        nulls = self._buffers[field]
+        value_type = type(value)
+        in_range = value_type is int and self._INT64_MIN <= value <= self._INT64_MAX
+        if in_range and self.rows == 0:
+            kind, buffer = ColumnBuffers.INTEGER, array("q")
+        elif in_range or value_type is float:
+            # Sin lugar para nulos en un arreglo de enteros: la columna empieza en punto flotante
+            kind, buffer = ColumnBuffers.FLOAT, array("d", [self._NONE if item is None else math.nan for item in nulls])
+        else:
+            kind, buffer = ColumnBuffers.OBJECT, nulls
+        self._kinds[field] = kind
+        self._buffers[field] = buffer
+        return kind
+        
+    def _append_null(self, field, kind, missing=False):
+        """
+        Agrega un valor nulo a una columna.
+        
+        Args:
+            field (str): Nombre del campo.
+            kind (str): Tipo actual de la columna.
+            missing (bool): True si el registro no tenía el campo, False si era null.
+        """
+        if kind == ColumnBuffers.INTEGER:
+            # Como en pandas, los enteros con nulos pasan a punto flotante
+            self._convert(field, ColumnBuffers.FLOAT)
+            kind = ColumnBuffers.FLOAT
+        if kind == ColumnBuffers.FLOAT:
+            self._buffers[field].append(math.nan if missing else self._NONE)
+        else:
+            self._buffers[field].append(math.nan if missing else None)
+            
+    def _promote(self, field, value):
+        """
+        Convierte una columna al tipo que admite un valor nuevo y lo agrega.
+        
+        Args:
+            field (str): Nombre del campo.
+            value: Valor que el tipo actual no admite.
+        """
+        value_type = type(value)
+        if self._kinds[field] == ColumnBuffers.INTEGER and value_type is float:
+            self._convert(field, ColumnBuffers.FLOAT)
+        else:
+            self._convert(field, ColumnBuffers.OBJECT)
+        self._buffers[field].append(value)
+        
+    def _convert(self, field, kind):
+        """
+        Cambia el tipo de una columna conservando sus valores.
+        
+        Args:
+            field (str): Nombre del campo.
+            kind (str): Tipo nuevo (FLOAT u OBJECT).
+        """
+        buffer = self._buffers[field]
+        if kind == ColumnBuffers.FLOAT:
+            self._buffers[field] = array("d", buffer)
+        elif self._kinds[field] == ColumnBuffers.FLOAT:
+            values = buffer.tolist()
+            # Los null explícitos vuelven a ser None; los campos ausentes siguen siendo NaN
+            for position in np.flatnonzero(np.frombuffer(buffer, dtype=np.uint64) == self._NONE_BITS).tolist():
+                values[position] = None
+            self._buffers[field] = values
+        else:
+            self._buffers[field] = buffer.tolist()
+        self._kinds[field] = kind
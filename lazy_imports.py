@@ -0,0 +1,82 @@
+import importlib
+import threading
+import time
+
+class LazyModule:
+    """
+    Módulo que se importa recién cuando se usa por primera vez.
+    
+    Se comporta como el módulo real: el primer acceso a un atributo lo importa y
+    los siguientes se delegan directamente. Así los módulos pesados (pandas,
+    matplotlib) no demoran el arranque de la aplicación ni se cargan en las
+    ejecuciones que no los usan. La duración de cada importación diferida queda
+    registrada para el perfil de arranque.
+    """
+    
+    # Segundos que tardó cada importación diferida, por nombre de módulo
+    load_times = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, name):
+        """
+        Inicializa el módulo diferido.
+        
+        Args:
+            name (str): Nombre completo del módulo (por ejemplo "matplotlib.figure").
+        """
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+        
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+        
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+        
+    def __repr__(self):
+        state = "cargado" if self._module is not None else "sin cargar"
+        return f"<módulo diferido '{self._name}' ({state})>"
+        
+    def _load(self):
+        """
+        Importa el módulo si todavía no se importó.
+        
+        Returns:
+            module: Módulo real.
+        """
+        module = self._module
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            with LazyModule._lock:
+                LazyModule.load_times.setdefault(self._name, time.perf_counter() - started)
+            object.__setattr__(self, "_module", module)
+        return module
+        
+_modules = {}
+
+def lazy_import(name):
+    """
+    Obtiene un módulo diferido; todos los llamados con el mismo nombre comparten la instancia.
+    
+    Args:
+        name (str): Nombre completo del módulo.
+        
+    Returns:
+        LazyModule: Módulo que se importa en el primer uso.
+    """
+    with LazyModule._lock:
+        module = _modules.get(name)
+        if module is None:
+            module = _modules[name] = LazyModule(name)
+        return module
+        
+def preload(*modules):
+    """
+    Importa de inmediato módulos diferidos (por ejemplo, en segundo plano).
+    
+    Args:
+        *modules (LazyModule): Módulos a importar.
+    """
+    for module in modules:
+        module._load()
@@ -1,29 +1,124 @@
 from api_handler import APIHandler
+from dataset_compactor import DatasetCompactor
+from response_cache import ResponseCache
 from data_processor import DataProcessor
-from ui_manager import UIManager
+from batch_runner import BatchRunner, DataExporter
+from startup_profile import StartupProfile
+from instrumentation import Instrumentation
+import argparse
 import os
+import sys
 from dotenv import load_dotenv
 
-def main():
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos de la línea de comandos.
+    
+    Args:
+        argv (list, optional): Argumentos de la línea de comandos.
+        
+    Returns:
+        argparse.Namespace: Argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Ordenador de datasets obtenidos de una API.")
+    parser.add_argument("--batch", action="store_true", help="Ejecutar sin interfaz gráfica: descargar, ordenar y exportar")
+    parser.add_argument("--url", help="URL de la API (por defecto la de CoinGecko)")
+    parser.add_argument("--column", nargs="+", help="Columna o columnas por las cuales ordenar")
+    parser.add_argument("--algorithm", default="Auto", help="Algoritmo de ordenamiento")
+    parser.add_argument("--direction", nargs="+", choices=("asc", "desc"), default=["asc"],
+                        help="Dirección única o una por columna")
+    parser.add_argument("--nulls", choices=("last", "first"), default="last", help="Ubicación de los valores nulos")
+    parser.add_argument("--output", default="-", help="Archivo de salida (\"-\" para la salida estándar)")
+    parser.add_argument("--format", choices=DataExporter.FORMATS, help="Formato de salida (por defecto según la extensión)")
+    parser.add_argument("--chunk-rows", type=int, default=10000, help="Filas por bloque de escritura")
+    parser.add_argument("--all-pages", action="store_true", help="Descargar todas las páginas de la API")
+    parser.add_argument("--no-compact", action="store_true",
+                        help="Conservar los tipos de datos que infiere pandas (sin compactar)")
+    parser.add_argument("--drop-columns", nargs="+", default=[],
+                        help="Columnas a eliminar al compactar los datos descargados (por ejemplo image)")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="Informar la memoria de cada columna antes y después de compactar (modo --batch)")
+    parser.add_argument("--stats-json", help="Exportar a JSON los tiempos por etapa del modo --batch")
+    parser.add_argument("--count-operations", action="store_true",
+                        help="Contar comparaciones, intercambios y movimientos (con --stats-json)")
+    parser.add_argument("--profile-startup", action="store_true", help="Medir el tiempo de importación de cada módulo al arrancar")
+    parser.add_argument("--startup-budget", type=float, help="Objetivo de tiempo de arranque en milisegundos para --profile-startup")
+    args = parser.parse_args(argv)
+    
+    if args.batch:
+        if not args.column:
+            parser.error("--column es obligatorio en modo --batch")
+        if len(args.direction) not in (1, len(args.column)):
+            parser.error("--direction debe indicar una dirección o una por cada columna")
+    return args
+    
+def main(argv=None):
     """
     Función principal que inicializa y ejecuta la aplicación.
+    
+    Args:
+        argv (list, optional): Argumentos de la línea de comandos.
+        
+    Returns:
+        int: Código de salida.
     """
+    args = parse_args(argv)
+    
+    # Perfil de arranque: sale con 1 si se supera el objetivo
+    if args.profile_startup:
+        within_budget = StartupProfile.report(
+            StartupProfile.measure_imports(), budget_ms=args.startup_budget,
+            deferred=StartupProfile.measure_deferred()
+        )
+        return 0 if within_budget else 1
+        
     # Cargar variables de entorno desde archivo .env
     load_dotenv()
     
     # Obtener la API key desde la variable de entorno
     api_key = os.environ.get("API_KEY", "")
     
+    # Caché de respuestas en disco (CACHE_TTL en segundos, 0 para revalidar siempre)
+    cache = ResponseCache(
+        cache_dir=os.environ.get("CACHE_DIR") or None,
+        ttl=float(os.environ.get("CACHE_TTL", 300)),
+        max_bytes=int(os.environ.get("CACHE_MAX_BYTES", 200 * 1024 * 1024))
+    )
+    
+    # Instrumentación compartida por la API y el procesador (desactivada salvo que se pida)
+    instrumentation = Instrumentation(enabled=bool(args.stats_json), count_operations=args.count_operations)
+    
     # Inicializar el manejador de API
-    api_handler = APIHandler(api_key=api_key)
+    api_handler = APIHandler(api_url=args.url, api_key=api_key, cache=cache, instrumentation=instrumentation)
+    if args.no_compact:
+        api_handler.compactor = None
+    elif args.drop_columns:
+        api_handler.compactor = DatasetCompactor(drop_columns=args.drop_columns)
     
-    # Inicializar el procesador de datos
-    data_processor = DataProcessor()
+    # Inicializar el procesador de datos (SORT_WORKERS: procesos del ordenamiento en paralelo)
+    data_processor = DataProcessor(
+        parallel_workers=int(os.environ.get("SORT_WORKERS", 0)) or None,
+        parallel_min_size=int(os.environ.get("SORT_PARALLEL_MIN_ROWS", 500000)),
+        instrumentation=instrumentation
+    )
     
-    # Inicializar y ejecutar la interfaz gráfica
+    # Modo por lotes: sin Tk ni pantalla
+    if args.batch:
+        ascending = [direction == "asc" for direction in args.direction]
+        runner = BatchRunner(api_handler, data_processor, memory_report=args.memory_report)
+        status = runner.run(
+            args.column, args.algorithm, ascending if len(ascending) > 1 else ascending[0],
+            args.output, args.format, args.chunk_rows, args.all_pages, args.nulls
+        )
+        if args.stats_json:
+            instrumentation.export_json(args.stats_json)
+        return status
+        
+    # Inicializar y ejecutar la interfaz gráfica (se importa solo si hace falta)
+    from ui_manager import UIManager
     ui = UIManager(api_handler, data_processor)
     ui.run()
+    return 0
 
 if __name__ == "__main__":
-    main()
-    
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,202 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from lazy_imports import lazy_import
+from sorting_algorithms import SortingAlgorithms
+
+np = lazy_import("numpy")
+
+def _attach(name, n, dtype):
+    """
+    Abre un bloque de memoria compartida como arreglo de NumPy.
+    
+    Args:
+        name (str): Nombre del bloque.
+        n (int): Cantidad de elementos.
+        dtype: Tipo de los elementos.
+        
+    Returns:
+        tuple: (SharedMemory, numpy.ndarray) sobre el bloque.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray((n,), dtype=dtype, buffer=block.buf)
+    
+def _sort_chunk(names, n, start, stop):
+    """
+    Ordena un tramo de la clave en un proceso de trabajo.
+    
+    Escribe las claves ordenadas y sus posiciones originales en los bloques
+    compartidos; solo viajan entre procesos los nombres y los límites.
+    
+    Args:
+        names (tuple): Nombres de los bloques (claves, claves ordenadas, posiciones).
+        n (int): Cantidad total de elementos.
+        start (int): Inicio del tramo.
+        stop (int): Fin del tramo (exclusivo).
+    """
+    (keys_block, keys), (sorted_block, sorted_keys), (order_block, order) = (
+        _attach(name, n, np.int64) for name in names
+    )
+    try:
+        chunk_order = np.argsort(keys[start:stop], kind="stable")
+        sorted_keys[start:stop] = keys[start:stop][chunk_order]
+        order[start:stop] = chunk_order + start
+    finally:
+        # Soltar las vistas antes de cerrar los bloques
+        keys = sorted_keys = order = None
+        for block in (keys_block, sorted_block, order_block):
+            block.close()
+            
+def _merge_partition(names, n, slices, offset):
+    """
+    Mezcla de forma estable los fragmentos de una partición en un proceso de trabajo.
+    
+    Args:
+        names (tuple): Nombres de los bloques (claves ordenadas, posiciones, resultado).
+        n (int): Cantidad total de elementos.
+        slices (list): Tramos (inicio, fin) de cada tramo ordenado que caen en la
+            partición, en el orden original de los tramos.
+        offset (int): Posición de la partición en el resultado.
+    """
+    (sorted_block, sorted_keys), (order_block, order), (result_block, result) = (
+        _attach(name, n, np.int64) for name in names
+    )
+    try:
+        keys = np.concatenate([sorted_keys[start:stop] for start, stop in slices])
+        positions = np.concatenate([order[start:stop] for start, stop in slices])
+        # Los fragmentos ya están ordenados y en orden de tramo: el ordenamiento
+        # estable (timsort) los mezcla y conserva el orden original entre iguales
+        merged = np.argsort(keys, kind="stable")
+        result[offset:offset + len(merged)] = positions[merged]
+    finally:
+        # Soltar las vistas antes de cerrar los bloques
+        sorted_keys = order = result = None
+        for block in (sorted_block, order_block, result_block):
+            block.close()
+            
+class ParallelSorter:
+    """
+    Ordenamiento en paralelo con varios procesos y memoria compartida.
+    
+    La clave se copia una vez a un bloque de multiprocessing.shared_memory; cada
+    proceso ordena un tramo y luego la mezcla se reparte por particiones de
+    valores (sample sort): los divisores se eligen con un muestreo regular de los
+    tramos ordenados y cada proceso mezcla una partición y la escribe en su lugar
+    del resultado. Entre procesos solo viajan nombres de bloques y límites, nunca
+    filas. El orden es estable y por debajo de un umbral se ordena en serie.
+    """
+    
+    def __init__(self, workers=None, min_size=500000):
+        """
+        Inicializa el ordenamiento en paralelo.
+        
+        Args:
+            workers (int, optional): Cantidad de procesos. Por defecto, los núcleos disponibles.
+            min_size (int): Cantidad mínima de elementos para ordenar en paralelo.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_size = min_size
+        self._executor = None
+        
+    def sort(self, values, ascending=True):
+        """
+        Ordena una columna clave y devuelve la permutación de filas.
+        
+        Args:
+            values (array-like): Claves enteras (por ejemplo, las de SortKeys.encode).
+            ascending (bool): True para orden ascendente, False para descendente.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante.
+        """
+        values = np.asarray(values)
+        n = len(values)
+        
+        # Claves no enteras, datos pequeños o un solo proceso: ordenamiento en serie
+        if not np.can_cast(values.dtype, np.int64) or n < self.min_size or self.workers < 2:
+            return SortingAlgorithms.columnar_sort(values, ascending)
+            
+        if ascending:
+            return self._sort_keys(values)
+        # Ordenar la secuencia invertida y revertir el resultado mantiene estable el orden descendente
+        return (n - 1 - self._sort_keys(values[::-1]))[::-1]
+        
+    def shutdown(self):
+        """Detiene los procesos de trabajo."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            
+    def _get_executor(self):
+        """
+        Obtiene el grupo de procesos, creándolo la primera vez.
+        
+        Returns:
+            ProcessPoolExecutor: Grupo de procesos reutilizable.
+        """
+        if self._executor is None:
+            # "spawn" evita duplicar con fork un proceso que ya tiene hilos (Tk, trabajos en segundo plano)
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._executor
+        
+    def _sort_keys(self, values):
+        """
+        Ordena en paralelo (ascendente y estable) un arreglo de claves enteras.
+        
+        Args:
+            values (numpy.ndarray): Claves enteras.
+            
+        Returns:
+            numpy.ndarray: Permutación estable.
+        """
+        n = len(values)
+        workers = self.workers
+        executor = self._get_executor()
+        blocks = [shared_memory.SharedMemory(create=True, size=n * 8) for _ in range(4)]
+        keys, sorted_keys, order, result = (np.ndarray((n,), dtype=np.int64, buffer=block.buf) for block in blocks)
+        try:
+            keys[:] = values
+            names = tuple(block.name for block in blocks)
+            
+            # 1. Ordenar cada tramo en un proceso
+            bounds = np.linspace(0, n, workers + 1).astype(np.int64)
+            chunks = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+            futures = [executor.submit(_sort_chunk, names[:3], n, start, stop) for start, stop in chunks]
+            for future in futures:
+                future.result()
+                
+            # 2. Elegir divisores con un muestreo regular de los tramos ordenados
+            samples = np.concatenate([
+                sorted_keys[start + (np.arange(1, workers) * (stop - start)) // workers]
+                for start, stop in chunks
+            ])
+            samples.sort()
+            splitters = samples[np.arange(1, workers) * len(samples) // workers]
+            
+            # Cada partición toma de cada tramo los valores en [divisor anterior, divisor)
+            cuts = [
+                np.concatenate(([start], start + np.searchsorted(sorted_keys[start:stop], splitters, side="left"), [stop]))
+                for start, stop in chunks
+            ]
+            
+            # 3. Mezclar cada partición en un proceso, escribiendo en su lugar del resultado
+            futures = []
+            offset = 0
+            for partition in range(workers):
+                slices = [(int(cut[partition]), int(cut[partition + 1])) for cut in cuts]
+                size = sum(stop - start for start, stop in slices)
+                if size:
+                    futures.append(executor.submit(_merge_partition, names[1:], n, slices, offset))
+                offset += size
+            for future in futures:
+                future.result()
+                
+            return result.astype(np.intp, copy=True)
+        finally:
+            # Soltar las vistas antes de cerrar y liberar los bloques
+            keys = sorted_keys = order = result = None
+            for block in blocks:
+                block.close()
+                block.unlink()
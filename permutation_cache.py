@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+class PermutationCache:
+    """
+    Caché LRU de permutaciones de ordenamiento con límite de memoria.
+    
+    Las permutaciones se guardan como arreglos de NumPy y el límite se aplica
+    sobre la suma de sus tamaños en bytes. Se descartan primero las entradas
+    usadas hace más tiempo.
+    """
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Inicializa la caché.
+        
+        Args:
+            max_bytes (int): Memoria máxima ocupada por las permutaciones guardadas.
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def get(self, key):
+        """
+        Obtiene una permutación guardada y la marca como usada recientemente.
+        
+        Args:
+            key (tuple): Clave de la permutación.
+            
+        Returns:
+            numpy.ndarray: Permutación guardada, o None si no existe.
+        """
+        permutation = self._entries.get(key)
+        if permutation is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return permutation
+        
+    def peek(self, key):
+        """
+        Obtiene una permutación sin afectar las estadísticas ni el orden LRU.
+        
+        Args:
+            key (tuple): Clave de la permutación.
+            
+        Returns:
+            numpy.ndarray: Permutación guardada, o None si no existe.
+        """
+        return self._entries.get(key)
+        
+    def put(self, key, permutation):
+        """
+        Guarda una permutación, descartando entradas antiguas si se supera el límite.
+        
+        Args:
+            key (tuple): Clave de la permutación.
+            permutation (numpy.ndarray): Permutación a guardar.
+        """
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).nbytes
+            
+        # Las permutaciones más grandes que el límite no se guardan
+        if permutation.nbytes > self.max_bytes:
+            return
+            
+        # Evitar modificaciones accidentales del arreglo compartido
+        permutation.setflags(write=False)
+        self._entries[key] = permutation
+        self._bytes += permutation.nbytes
+        
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+            
+    def clear(self):
+        """Elimina todas las permutaciones guardadas."""
+        self._entries.clear()
+        self._bytes = 0
+        
+    def stats(self):
+        """
+        Obtiene las estadísticas de uso de la caché.
+        
+        Returns:
+            dict: Aciertos, fallos, descartes, entradas y bytes ocupados.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes
+        }
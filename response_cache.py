@@ -0,0 +1,427 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class CacheEntry:
+    """
+    Entrada de la caché: metadatos de la respuesta y acceso diferido al dataset.
+    """
+    
+    def __init__(self, cache, key, metadata):
+        """
+        Inicializa la entrada con sus metadatos.
+        
+        Args:
+            cache (ResponseCache): Caché a la que pertenece la entrada.
+            key (str): Clave de la entrada.
+            metadata (dict): Metadatos guardados junto al dataset.
+        """
+        self.cache = cache
+        self.key = key
+        self.metadata = metadata
+        
+    @property
+    def etag(self):
+        """str: ETag de la respuesta original, si existe."""
+        return self.metadata.get("etag")
+        
+    @property
+    def last_modified(self):
+        """str: Header Last-Modified de la respuesta original, si existe."""
+        return self.metadata.get("last_modified")
+        
+    def is_fresh(self):
+        """
+        Indica si la entrada sigue dentro del TTL de la caché.
+        
+        Returns:
+            bool: True si no es necesario consultar la API.
+        """
+        return time.time() - self.metadata.get("stored_at", 0) < self.cache.ttl
+        
+    def validation_headers(self):
+        """
+        Construye los headers para revalidar la entrada con la API.
+        
+        Returns:
+            dict: Headers If-None-Match / If-Modified-Since disponibles.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+        
+    def load_data(self):
+        """
+        Carga el dataset guardado y marca la entrada como usada recientemente.
+        
+        Returns:
+            pandas.DataFrame: Dataset guardado, o None si el archivo ya no existe.
+        """
+        return self.cache.load(self.key)
+        
+class ResponseCache:
+    """
+    Caché persistente en disco para las respuestas de la API.
+    
+    Cada entrada guarda el dataset ya procesado en un archivo .npz (las columnas
+    numéricas como arreglos de NumPy, las categóricas como códigos y las de texto
+    u objetos anidados como JSON), sin necesidad de volver a parsear la respuesta,
+    y un archivo JSON con los metadatos de revalidación. El archivo se lee sin
+    pickle, así que un directorio de caché compartido no puede ejecutar código.
+    El tamaño total se limita descartando primero las entradas usadas hace más
+    tiempo (LRU).
+    """
+    
+    DATA_SUFFIX = ".npz"
+    META_SUFFIX = ".json"
+    # Formato anterior (pickle de pandas): no se lee y se elimina
+    LEGACY_SUFFIX = ".pkl"
+    _KEY_NAME = re.compile(r"^[0-9a-f]{64}\.")
+    
+    def __init__(self, cache_dir=None, ttl=300, max_bytes=200 * 1024 * 1024):
+        """
+        Inicializa la caché.
+        
+        Args:
+            cache_dir (str, optional): Directorio de la caché. Por defecto ~/.cache/ordenador_dataset.
+            ttl (float): Segundos durante los que una entrada se usa sin consultar la API.
+            max_bytes (int): Tamaño máximo total de los datasets guardados.
+        """
+        self.cache_dir = cache_dir if cache_dir else os.path.join(os.path.expanduser("~"), ".cache", "ordenador_dataset")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._remove_legacy()
+        
+    @staticmethod
+    def make_key(url, auth=""):
+        """
+        Calcula la clave de caché para una URL y unas credenciales.
+        
+        Args:
+            url (str): URL consultada.
+            auth (str): Valor de autenticación usado en la petición.
+            
+        Returns:
+            str: Clave hexadecimal (las credenciales no se guardan en claro).
+        """
+        return hashlib.sha256(f"{url}\n{auth}".encode("utf-8")).hexdigest()
+        
+    def get(self, key):
+        """
+        Obtiene la entrada asociada a una clave sin cargar el dataset.
+        
+        Args:
+            key (str): Clave de la entrada.
+            
+        Returns:
+            CacheEntry: Entrada encontrada, o None si no existe.
+        """
+        try:
+            with open(self._path(key, self.META_SUFFIX), "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return None
+            
+        if not os.path.exists(self._path(key, self.DATA_SUFFIX)):
+            return None
+            
+        return CacheEntry(self, key, metadata)
+        
+    def load(self, key):
+        """
+        Carga el dataset de una entrada y actualiza su marca de uso.
+        
+        Args:
+            key (str): Clave de la entrada.
+            
+        Returns:
+            pandas.DataFrame: Dataset guardado, o None si no se puede leer.
+        """
+        data_path = self._path(key, self.DATA_SUFFIX)
+        try:
+            data = self._read_frame(data_path)
+            os.utime(data_path)
+        except Exception as e:
+            # Archivo truncado, dañado o de otro formato: se descarta y se vuelve a pedir a la API
+            print(f"Error al leer la caché, se descarta la entrada: {e}")
+            with self._lock:
+                self._remove(data_path)
+                self._remove(self._path(key, self.META_SUFFIX))
+            return None
+        return data
+        
+    def put(self, key, data, url=None, etag=None, last_modified=None):
+        """
+        Guarda un dataset y sus metadatos de revalidación.
+        
+        Args:
+            key (str): Clave de la entrada.
+            data (pandas.DataFrame): Dataset a guardar.
+            url (str, optional): URL de origen, solo informativa.
+            etag (str, optional): ETag de la respuesta.
+            last_modified (str, optional): Header Last-Modified de la respuesta.
+            
+        Returns:
+            bool: True si se guardó; False si el dataset solo no entra en max_bytes.
+        """
+        metadata = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time()
+        }
+        
+        with self._lock:
+            # Escribir en temporales y renombrar para no dejar entradas a medias
+            data_path = self._path(key, self.DATA_SUFFIX)
+            meta_path = self._path(key, self.META_SUFFIX)
+            with open(data_path + ".tmp", "wb") as file:
+                self._write_frame(file, data)
+                
+            # Guardarlo haría que _evict lo descartara enseguida (o vaciara la caché entera);
+            # la entrada anterior de la misma clave ya no corresponde a la respuesta
+            size = os.path.getsize(data_path + ".tmp")
+            if size > self.max_bytes:
+                print(f"El dataset ocupa {size} bytes, más que el límite de la caché ({self.max_bytes}); no se guarda.")
+                self._remove(data_path + ".tmp")
+                self._remove(data_path)
+                self._remove(meta_path)
+                return False
+                
+            os.replace(data_path + ".tmp", data_path)
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(metadata, file)
+            os.replace(meta_path + ".tmp", meta_path)
+            
+            self._evict()
+        return True
+            
+    def touch(self, key):
+        """
+        Renueva el TTL de una entrada tras una revalidación exitosa (304).
+        
+        Args:
+            key (str): Clave de la entrada.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return
+            
+        entry.metadata["stored_at"] = time.time()
+        meta_path = self._path(key, self.META_SUFFIX)
+        with self._lock:
+            with open(meta_path + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(entry.metadata, file)
+            os.replace(meta_path + ".tmp", meta_path)
+            
+    def clear(self):
+        """Elimina todas las entradas de la caché."""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith((self.DATA_SUFFIX, self.META_SUFFIX, self.LEGACY_SUFFIX)):
+                    self._remove(os.path.join(self.cache_dir, name))
+                    
+    def size(self):
+        """
+        Calcula el tamaño total de los datasets guardados.
+        
+        Returns:
+            int: Tamaño en bytes.
+        """
+        return sum(size for _, _, size in self._data_files())
+        
+    def _evict(self):
+        """Descarta las entradas usadas hace más tiempo hasta respetar max_bytes."""
+        files = sorted(self._data_files(), key=lambda item: item[1])
+        total = sum(size for _, _, size in files)
+        
+        for path, _, size in files:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            self._remove(path[:-len(self.DATA_SUFFIX)] + self.META_SUFFIX)
+            total -= size
+            
+    def _data_files(self):
+        """
+        Lista los datasets guardados.
+        
+        Returns:
+            list: Tuplas (ruta, último uso, tamaño en bytes).
+        """
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.DATA_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((path, stat.st_mtime, stat.st_size))
+        return files
+        
+    def _remove_legacy(self):
+        """Elimina los datasets guardados con el formato anterior (pickle)."""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(self.LEGACY_SUFFIX) and self._KEY_NAME.match(name):
+                self._remove(os.path.join(self.cache_dir, name))
+                
+    @staticmethod
+    def _write_frame(file, data):
+        """
+        Guarda un DataFrame en formato .npz sin objetos de Python serializados con pickle.
+        
+        Args:
+            file: Archivo binario abierto para escritura.
+            data (pandas.DataFrame): Dataset a guardar.
+        """
+        arrays = {}
+        columns = []
+        for position, column in enumerate(data.columns):
+            name = f"c{position}"
+            columns.append(ResponseCache._encode_values(data[column], name, arrays, {"name": column}))
+        index = {"start": data.index.start, "stop": data.index.stop, "step": data.index.step} \
+            if isinstance(data.index, pd.RangeIndex) else ResponseCache._encode_values(data.index, "index", arrays, {})
+        arrays["schema"] = np.array(json.dumps({"columns": columns, "index": index}))
+        np.savez(file, **arrays)
+        
+    @staticmethod
+    def _encode_values(values, name, arrays, spec):
+        """
+        Codifica una columna (o el índice) para _write_frame.
+        
+        Args:
+            values (pandas.Series | pandas.Index): Valores a guardar.
+            name (str): Nombre del arreglo dentro del archivo.
+            arrays (dict): Arreglos del archivo; se agrega el de esta columna.
+            spec (dict): Descripción de la columna; se completa con su codificación.
+            
+        Returns:
+            dict: Descripción de la columna.
+        """
+        dtype = values.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            spec.update(kind="category", ordered=bool(dtype.ordered))
+            arrays[name] = np.asarray(values.cat.codes if isinstance(values, pd.Series) else values.codes)
+            categories = dtype.categories
+            if categories.dtype == object:
+                spec["categories"] = categories.tolist()
+            else:
+                arrays[name + "_categories"] = categories.to_numpy()
+        elif isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            spec["kind"] = "array"
+            arrays[name] = values.to_numpy()
+        else:
+            # Textos, objetos anidados y tipos de extensión: como JSON
+            spec["kind"] = "json"
+            arrays[name] = np.array(json.dumps(values.tolist(), default=ResponseCache._json_default))
+            if not isinstance(dtype, np.dtype):
+                spec["dtype"] = str(dtype)
+        return spec
+        
+    @staticmethod
+    def _json_default(value):
+        """
+        Convierte a JSON los valores que json no admite directamente.
+        
+        Args:
+            value: Valor a convertir (escalares de NumPy, fechas, pd.NA).
+            
+        Returns:
+            Valor equivalente serializable.
+        """
+        if value is pd.NA:
+            return None
+        if hasattr(value, "item"):
+            return value.item()
+        return str(value)
+        
+    @staticmethod
+    def _read_frame(path):
+        """
+        Lee un DataFrame guardado con _write_frame.
+        
+        Args:
+            path (str): Ruta del archivo.
+            
+        Returns:
+            pandas.DataFrame: Dataset guardado.
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            schema = json.loads(str(arrays["schema"]))
+            index = schema["index"]
+            if "kind" in index:
+                index = pd.Index(ResponseCache._decode_values(arrays, "index", index))
+            else:
+                index = pd.RangeIndex(index["start"], index["stop"], index["step"])
+            columns = {}
+            for position, spec in enumerate(schema["columns"]):
+                columns[spec["name"]] = pd.Series(ResponseCache._decode_values(arrays, f"c{position}", spec), index=index)
+        return pd.DataFrame(columns, index=index, columns=[spec["name"] for spec in schema["columns"]])
+        
+    @staticmethod
+    def _decode_values(arrays, name, spec):
+        """
+        Reconstruye los valores de una columna guardada con _encode_values.
+        
+        Args:
+            arrays: Arreglos del archivo .npz.
+            name (str): Nombre del arreglo de la columna.
+            spec (dict): Descripción de la columna.
+            
+        Returns:
+            array-like: Valores de la columna.
+        """
+        if spec["kind"] == "array":
+            return arrays[name]
+        if spec["kind"] == "category":
+            categories = spec["categories"] if "categories" in spec else arrays[name + "_categories"]
+            return pd.Categorical.from_codes(arrays[name], categories=categories, ordered=spec["ordered"])
+        values = pd.array(json.loads(str(arrays[name])), dtype=object)
+        if "dtype" in spec:
+            return pd.array(values, dtype=spec["dtype"])
+        return values
+        
+    def _path(self, key, suffix):
+        """
+        Construye la ruta de un archivo de la caché.
+        
+        Args:
+            key (str): Clave de la entrada.
+            suffix (str): Extensión del archivo.
+            
+        Returns:
+            str: Ruta del archivo.
+        """
+        return os.path.join(self.cache_dir, key + suffix)
+        
+    @staticmethod
+    def _remove(path):
+        """
+        Elimina un archivo ignorando si ya no existe.
+        
+        Args:
+            path (str): Ruta del archivo.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
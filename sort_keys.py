@@ -0,0 +1,227 @@
+import numbers
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class ReversedKey:
+    """
+    Envoltorio que invierte la comparación de una clave no numérica.
+    """
+    
+    __slots__ = ("value",)
+    
+    def __init__(self, value):
+        """
+        Inicializa el envoltorio.
+        
+        Args:
+            value: Valor a comparar en orden inverso.
+        """
+        self.value = value
+        
+    def __lt__(self, other):
+        return other.value < self.value
+        
+    def __gt__(self, other):
+        return other.value > self.value
+        
+    def __eq__(self, other):
+        return self.value == other.value
+        
+    __hash__ = None
+    
+class SortKeys:
+    """
+    Codificación vectorizada de claves de ordenamiento.
+    
+    Cada columna se reemplaza por el rango denso de sus valores (respetando la
+    dirección pedida y la ubicación de los nulos) y los rangos de varias columnas
+    se combinan en un único entero de 64 bits. Ordenar ascendentemente y de forma
+    estable por ese entero equivale a ordenar lexicográficamente por todas las
+    columnas, así que un ordenamiento por varias columnas cuesta lo mismo que uno
+    por una sola y ningún algoritmo necesita comparar tuplas ni manejar NaN.
+    """
+    
+    NA_POSITIONS = ("last", "first")
+    
+    # Límite para combinar rangos sin desbordar int64
+    _MAX_CARDINALITY = 1 << 62
+    
+    @staticmethod
+    def normalize(columns, ascending=True):
+        """
+        Normaliza la especificación de columnas y direcciones.
+        
+        Args:
+            columns (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            
+        Returns:
+            tuple: (tupla de columnas, tupla de direcciones).
+            
+        Raises:
+            ValueError: Si no hay columnas o las direcciones no coinciden con las columnas.
+        """
+        if isinstance(columns, (list, tuple)):
+            columns = tuple(columns)
+        else:
+            columns = (columns,)
+            
+        if isinstance(ascending, (list, tuple)):
+            ascending = tuple(bool(direction) for direction in ascending)
+        else:
+            ascending = (bool(ascending),) * len(columns)
+            
+        if not columns:
+            raise ValueError("Debe indicarse al menos una columna para ordenar.")
+        if len(ascending) != len(columns):
+            raise ValueError("Debe indicarse una dirección por cada columna.")
+        return columns, ascending
+        
+    @staticmethod
+    def encode(dataframe, columns, ascending=True, na_position="last"):
+        """
+        Codifica una o varias columnas en una única clave entera.
+        
+        Args:
+            dataframe (pandas.DataFrame): Dataset a ordenar.
+            columns (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los nulos en cada columna.
+            
+        Returns:
+            numpy.ndarray: Claves int64; su orden ascendente estable es el orden pedido.
+            
+        Raises:
+            ValueError: Si na_position no es válido.
+        """
+        if na_position not in SortKeys.NA_POSITIONS:
+            raise ValueError(f"Ubicación de nulos no válida: '{na_position}'.")
+            
+        columns, ascending = SortKeys.normalize(columns, ascending)
+        
+        combined = None
+        cardinality = 1
+        for column, direction in zip(columns, ascending):
+            codes, column_cardinality = SortKeys.column_ranks(dataframe[column], direction, na_position)
+            
+            if combined is None:
+                combined, cardinality = codes, column_cardinality
+                continue
+                
+            # Recomprimir a rangos densos si la combinación pudiera desbordar int64
+            if cardinality * column_cardinality >= SortKeys._MAX_CARDINALITY:
+                combined, cardinality = SortKeys._densify(combined)
+            combined = combined * column_cardinality + codes
+            cardinality *= column_cardinality
+            
+        return combined
+        
+    @staticmethod
+    def column_ranks(values, ascending=True, na_position="last"):
+        """
+        Calcula el rango denso de cada valor de una columna.
+        
+        Args:
+            values (pandas.Series): Valores de la columna.
+            ascending (bool): True para orden ascendente, False para descendente.
+            na_position (str): "last" o "first".
+            
+        Returns:
+            tuple: (numpy.ndarray int64 de rangos, cantidad de rangos distintos).
+        """
+        try:
+            codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=True)
+        except TypeError:
+            # Valores no comparables o no hashables (por ejemplo diccionarios): ordenar por su texto
+            missing = values.isna()
+            codes, uniques = pd.factorize(values.astype(str).where(~missing), sort=True, use_na_sentinel=True)
+            
+        codes = codes.astype(np.int64, copy=False)
+        distinct = len(uniques)
+        missing = codes < 0
+        
+        if not ascending:
+            codes = np.where(missing, codes, distinct - 1 - codes)
+            
+        if na_position == "last":
+            codes[missing] = distinct
+        else:
+            codes = codes + 1
+            codes[missing] = 0
+        return codes, distinct + 1
+        
+    @staticmethod
+    def row_keys(dataframe, columns, ascending=True, na_position="last"):
+        """
+        Construye una clave comparable de Python por fila.
+        
+        A diferencia de encode, las claves no dependen del resto del dataset, así
+        que pueden compararse entre versiones distintas de los datos (por ejemplo,
+        para reubicar filas con búsqueda binaria). Respetan el mismo orden: cada
+        columna aporta (rango de nulo, valor), con el valor negado o invertido en
+        las columnas descendentes.
+        
+        Args:
+            dataframe (pandas.DataFrame): Dataset.
+            columns (str | list): Columna o lista de columnas por las cuales ordenar.
+            ascending (bool | list): Dirección única o una por columna.
+            na_position (str): "last" o "first": ubicación de los valores nulos.
+            
+        Returns:
+            list: Una tupla por fila.
+            
+        Raises:
+            ValueError: Si na_position no es válido.
+        """
+        if na_position not in SortKeys.NA_POSITIONS:
+            raise ValueError(f"Ubicación de nulos no válida: '{na_position}'.")
+            
+        columns, ascending = SortKeys.normalize(columns, ascending)
+        null_rank = 1 if na_position == "last" else -1
+        
+        parts = []
+        for column, direction in zip(columns, ascending):
+            values = dataframe[column]
+            missing = values.isna().to_numpy()
+            ranks = np.where(missing, null_rank, 0).tolist()
+            
+            if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+                floats = values.to_numpy(dtype=np.float64, na_value=0.0)
+                parts.append(list(zip(ranks, (floats if direction else -floats).tolist())))
+                continue
+                
+            if pd.api.types.is_datetime64_any_dtype(values):
+                items = values.to_numpy().view(np.int64).tolist()
+                placeholder = 0
+            else:
+                items = values.tolist()
+                present = [item for item, null in zip(items, missing) if not null]
+                placeholder = ""
+                if all(isinstance(item, numbers.Real) for item in present):
+                    placeholder = 0
+                elif not all(isinstance(item, str) for item in present):
+                    # Valores no comparables entre sí (por ejemplo diccionarios): comparar su texto
+                    items = [str(item) for item in items]
+            if missing.any():
+                items = [placeholder if null else item for item, null in zip(items, missing)]
+            if not direction:
+                items = [ReversedKey(item) for item in items]
+            parts.append(list(zip(ranks, items)))
+            
+        return list(zip(*parts))
+        
+    @staticmethod
+    def _densify(keys):
+        """
+        Reemplaza claves enteras por su rango denso.
+        
+        Args:
+            keys (numpy.ndarray): Claves enteras.
+            
+        Returns:
+            tuple: (numpy.ndarray int64 de rangos, cantidad de rangos distintos).
+        """
+        uniques, codes = np.unique(keys, return_inverse=True)
+        return codes.astype(np.int64, copy=False), len(uniques)
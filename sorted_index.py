@@ -0,0 +1,321 @@
+import re
+import threading
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class SortedIndex:
+    """
+    Índice ordenado de una columna numérica.
+    
+    Guarda los valores no nulos ordenados junto con la posición de su fila, así
+    que un rango de valores es un tramo contiguo que se ubica con dos búsquedas
+    binarias: cada consulta cuesta O(log n + k) para k filas encontradas.
+    """
+    
+    def __init__(self, values):
+        """
+        Construye el índice.
+        
+        Args:
+            values (pandas.Series): Valores de la columna.
+        """
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = np.flatnonzero(~np.isnan(array))
+        order = np.argsort(array[present], kind="stable")
+        self.positions = present[order]
+        self.values = array[self.positions]
+        # Valores por fila, para verificar condiciones sobre filas ya elegidas por otro índice
+        self.column = array
+        
+    def __len__(self):
+        return len(self.positions)
+        
+    def bounds(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Ubica el tramo del índice con los valores dentro de un rango.
+        
+        Args:
+            low (float, optional): Límite inferior, o None si no hay.
+            high (float, optional): Límite superior, o None si no hay.
+            include_low (bool): True si el límite inferior se incluye.
+            include_high (bool): True si el límite superior se incluye.
+            
+        Returns:
+            tuple: (inicio, fin) del tramo en el índice.
+        """
+        start = 0 if low is None else int(np.searchsorted(self.values, low, side="left" if include_low else "right"))
+        stop = len(self.values) if high is None else int(np.searchsorted(self.values, high, side="right" if include_high else "left"))
+        return start, max(start, stop)
+        
+    def range(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Obtiene las filas con valores dentro de un rango.
+        
+        Args:
+            low (float, optional): Límite inferior, o None si no hay.
+            high (float, optional): Límite superior, o None si no hay.
+            include_low (bool): True si el límite inferior se incluye.
+            include_high (bool): True si el límite superior se incluye.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas, de menor a mayor valor.
+        """
+        start, stop = self.bounds(low, high, include_low, include_high)
+        return self.positions[start:stop]
+        
+    def matches(self, positions, low=None, high=None, include_low=True, include_high=True):
+        """
+        Verifica qué filas tienen su valor dentro de un rango (O(k)).
+        
+        Args:
+            positions (numpy.ndarray): Posiciones de las filas a verificar.
+            low (float, optional): Límite inferior, o None si no hay.
+            high (float, optional): Límite superior, o None si no hay.
+            include_low (bool): True si el límite inferior se incluye.
+            include_high (bool): True si el límite superior se incluye.
+            
+        Returns:
+            numpy.ndarray: Máscara booleana; los nulos nunca cumplen.
+        """
+        values = self.column[positions]
+        mask = ~np.isnan(values)
+        if low is not None:
+            mask &= values >= low if include_low else values > low
+        if high is not None:
+            mask &= values <= high if include_high else values < high
+        return mask
+        
+    def count(self, low=None, high=None, include_low=True, include_high=True):
+        """
+        Cuenta las filas con valores dentro de un rango sin materializarlas (O(log n)).
+        
+        Args:
+            low (float, optional): Límite inferior, o None si no hay.
+            high (float, optional): Límite superior, o None si no hay.
+            include_low (bool): True si el límite inferior se incluye.
+            include_high (bool): True si el límite superior se incluye.
+            
+        Returns:
+            int: Cantidad de filas.
+        """
+        start, stop = self.bounds(low, high, include_low, include_high)
+        return stop - start
+        
+    def top(self, n, largest=True):
+        """
+        Obtiene las filas con los n valores más grandes (o más chicos).
+        
+        Args:
+            n (int): Cantidad de filas.
+            largest (bool): True para los más grandes, False para los más chicos.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas, empezando por el valor extremo.
+        """
+        n = max(min(int(n), len(self.positions)), 0)
+        if largest:
+            return self.positions[len(self.positions) - n:][::-1]
+        return self.positions[:n]
+        
+class IndexManager:
+    """
+    Índices ordenados de las columnas numéricas de un dataset.
+    
+    Cada índice se construye recién la primera vez que se consulta su columna y
+    todos se descartan cuando cambia el dataset. Las consultas combinan
+    condiciones de rango ("market_cap >= 1e9") y de top-N ("top 10 market_cap").
+    """
+    
+    # Condición de comparación: columna, operador y número ("current_price > 100")
+    _COMPARISON = re.compile(r"^(?P<column>[^\s<>=]+)\s*(?P<operator>>=|<=|==|=|>|<)\s*(?P<value>\S+)$")
+    # Rango cerrado: columna y límites ("market_cap 1e9..5e9")
+    _BETWEEN = re.compile(r"^(?P<column>[^\s<>=]+)\s+(?P<low>\S+?)\.\.(?P<high>\S+)$")
+    # Top-N: "top 10 market_cap" o "bottom 5 current_price"
+    _TOP = re.compile(r"^(?P<which>top|bottom)\s+(?P<count>\d+)\s+(?P<column>\S+)$", re.IGNORECASE)
+    # Separadores entre condiciones
+    _SEPARATOR = re.compile(r"\s*(?:,|;|\s+y\s+|\s+and\s+)\s*", re.IGNORECASE)
+    
+    def __init__(self, data=None):
+        """
+        Inicializa los índices de un dataset.
+        
+        Args:
+            data (pandas.DataFrame, optional): Dataset a indexar.
+        """
+        self.data = data
+        self._indexes = {}
+        self._lock = threading.Lock()
+        
+    def reset(self, data):
+        """
+        Cambia el dataset y descarta los índices construidos.
+        
+        Args:
+            data (pandas.DataFrame): Nuevo dataset.
+        """
+        with self._lock:
+            self.data = data
+            self._indexes = {}
+            
+    def get(self, column):
+        """
+        Obtiene el índice de una columna, construyéndolo si todavía no existe.
+        
+        Args:
+            column (str): Columna numérica.
+            
+        Returns:
+            SortedIndex: Índice de la columna.
+            
+        Raises:
+            ValueError: Si no hay datos, la columna no existe o no es numérica.
+        """
+        with self._lock:
+            index = self._indexes.get(column)
+            if index is not None:
+                return index
+            data = self.data
+            if data is None:
+                raise ValueError("No hay datos para filtrar.")
+            if column not in data.columns:
+                raise ValueError(f"La columna '{column}' no existe.")
+            values = data[column]
+            if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                raise ValueError(f"La columna '{column}' no es numérica.")
+            index = self._indexes[column] = SortedIndex(values)
+            return index
+            
+    def built(self):
+        """
+        Obtiene las columnas cuyo índice ya se construyó.
+        
+        Returns:
+            list: Nombres de las columnas.
+        """
+        return list(self._indexes)
+        
+    def query(self, conditions):
+        """
+        Obtiene las filas que cumplen todas las condiciones.
+        
+        Args:
+            conditions (list): Condiciones de parse: ("range", columna, mínimo, máximo,
+                incluir mínimo, incluir máximo) o ("top", columna, n, más grandes).
+                
+        Returns:
+            numpy.ndarray: Posiciones de las filas, en el orden del dataset.
+        """
+        if not conditions:
+            return np.arange(len(self.data) if self.data is not None else 0)
+            
+        # Materializar solo la condición más selectiva (contar cuesta O(log n)) y verificar
+        # las demás sobre esas filas, sin recorrer el resto del dataset
+        conditions = sorted(conditions, key=self._count)
+        positions = np.sort(self._positions(conditions[0]))
+        for kind, column, *arguments in conditions[1:]:
+            index = self.get(column)
+            if kind == "top":
+                positions = positions[np.isin(positions, index.top(*arguments))]
+            else:
+                positions = positions[index.matches(positions, *arguments)]
+        return positions
+        
+    def _count(self, condition):
+        """
+        Cuenta las filas que cumplen una condición.
+        
+        Args:
+            condition (tuple): Condición (ver query).
+            
+        Returns:
+            int: Cantidad de filas.
+        """
+        kind, column, *arguments = condition
+        index = self.get(column)
+        if kind == "top":
+            return min(arguments[0], len(index))
+        return index.count(*arguments)
+        
+    def _positions(self, condition):
+        """
+        Obtiene las filas que cumplen una condición.
+        
+        Args:
+            condition (tuple): Condición (ver query).
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas, en el orden del índice.
+        """
+        kind, column, *arguments = condition
+        index = self.get(column)
+        if kind == "top":
+            return index.top(*arguments)
+        return index.range(*arguments)
+        
+    @staticmethod
+    def parse(text):
+        """
+        Interpreta un filtro escrito por el usuario.
+        
+        Acepta condiciones separadas por comas o "y": comparaciones
+        ("current_price > 100", "market_cap <= 5e9", "market_cap_rank = 1"), rangos
+        cerrados ("market_cap 1e9..5e9") y top-N ("top 10 market_cap", "bottom 5 total_volume").
+        
+        Args:
+            text (str): Filtro.
+            
+        Returns:
+            list: Condiciones para query.
+            
+        Raises:
+            ValueError: Si alguna condición no se puede interpretar.
+        """
+        conditions = []
+        for clause in IndexManager._SEPARATOR.split(text.strip()):
+            if not clause:
+                continue
+            match = IndexManager._TOP.match(clause)
+            if match:
+                conditions.append(("top", match["column"], int(match["count"]), match["which"].lower() == "top"))
+                continue
+            match = IndexManager._BETWEEN.match(clause)
+            if match:
+                low, high = IndexManager._number(match["low"]), IndexManager._number(match["high"])
+                conditions.append(("range", match["column"], low, high, True, True))
+                continue
+            match = IndexManager._COMPARISON.match(clause)
+            if match is None:
+                raise ValueError(f"No se entiende la condición '{clause}'.")
+            value = IndexManager._number(match["value"])
+            operator = match["operator"]
+            if operator in ("=", "=="):
+                conditions.append(("range", match["column"], value, value, True, True))
+            elif operator.startswith(">"):
+                conditions.append(("range", match["column"], value, None, operator == ">=", True))
+            else:
+                conditions.append(("range", match["column"], None, value, True, operator == "<="))
+        return conditions
+        
+    @staticmethod
+    def _number(text):
+        """
+        Convierte un valor del filtro en número.
+        
+        Args:
+            text (str): Valor escrito por el usuario.
+            
+        Returns:
+            float: Número.
+            
+        Raises:
+            ValueError: Si el valor no es numérico.
+        """
+        try:
+            value = float(text)
+        except ValueError:
+            raise ValueError(f"'{text}' no es un número.")
+        if np.isnan(value):
+            raise ValueError("El filtro no admite NaN.")
+        return value
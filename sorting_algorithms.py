@@ -1,10 +1,18 @@
+import math
+import numbers
+
+from lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
 class SortingAlgorithms:
     """
     Clase que implementa diferentes algoritmos de ordenamiento.
     """
     
     @staticmethod
-    def bubble_sort(data, column, ascending=True):
+    def bubble_sort(data, column, ascending=True, progress=None, counters=None):
         """
         Implementación del algoritmo de ordenamiento burbuja.
         
@@ -12,6 +20,8 @@ class SortingAlgorithms:
             data (list): Lista de diccionarios o registros a ordenar.
             column (str): Nombre de la columna por la cual ordenar.
             ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
             
         Returns:
             list: Lista ordenada de registros.
@@ -20,17 +30,22 @@ class SortingAlgorithms:
         n = len(result)
         
         for i in range(n):
+            if progress is not None:
+                progress(i / n)
+                
             for j in range(0, n - i - 1):
                 # Comparación para orden ascendente o descendente
                 condition = result[j][column] > result[j + 1][column] if ascending else result[j][column] < result[j + 1][column]
                 
                 if condition:
                     result[j], result[j + 1] = result[j + 1], result[j]
+                    if counters is not None:
+                        counters.swaps += 1
                     
         return result
 
     @staticmethod
-    def selection_sort(data, column, ascending=True):
+    def selection_sort(data, column, ascending=True, progress=None, counters=None):
         """
         Implementación del algoritmo de ordenamiento por selección.
         
@@ -38,6 +53,8 @@ class SortingAlgorithms:
             data (list): Lista de diccionarios o registros a ordenar.
             column (str): Nombre de la columna por la cual ordenar.
             ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
             
         Returns:
             list: Lista ordenada de registros.
@@ -46,6 +63,9 @@ class SortingAlgorithms:
         n = len(result)
         
         for i in range(n):
+            if progress is not None:
+                progress(i / n)
+                
             # Encontrar el valor mínimo/máximo en el resto de la lista
             idx = i
             for j in range(i + 1, n):
@@ -57,11 +77,13 @@ class SortingAlgorithms:
                     
             # Intercambiar el elemento encontrado con el primer elemento sin ordenar
             result[i], result[idx] = result[idx], result[i]
+            if counters is not None:
+                counters.swaps += 1
                     
         return result
 
     @staticmethod
-    def insertion_sort(data, column, ascending=True):
+    def insertion_sort(data, column, ascending=True, progress=None, counters=None):
         """
         Implementación del algoritmo de ordenamiento por inserción.
         
@@ -69,6 +91,8 @@ class SortingAlgorithms:
             data (list): Lista de diccionarios o registros a ordenar.
             column (str): Nombre de la columna por la cual ordenar.
             ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
             
         Returns:
             list: Lista ordenada de registros.
@@ -77,6 +101,9 @@ class SortingAlgorithms:
         n = len(result)
         
         for i in range(1, n):
+            if progress is not None:
+                progress(i / n)
+                
             key = result[i]
             j = i - 1
             
@@ -90,5 +117,384 @@ class SortingAlgorithms:
                     condition = key[column] < result[j][column] if ascending else key[column] > result[j][column]
                     
             result[j + 1] = key
+            if counters is not None:
+                counters.moves += i - j
                     
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    def columnar_sort(values, ascending=True):
+        """
+        Ordenamiento columnar con NumPy: trabaja solo sobre la columna clave y
+        devuelve la permutación de filas en lugar de los registros.
+        
+        El orden es estable en ambas direcciones y los valores nulos (None/NaN)
+        quedan siempre al final, igual que en pandas.
+        
+        Args:
+            values (array-like): Valores de la columna por la cual ordenar.
+            ascending (bool): True para orden ascendente, False para descendente.
+            
+        Returns:
+            numpy.ndarray: Posiciones de las filas en el orden resultante.
+        """
+        values = np.asarray(values)
+        missing = pd.isna(values)
+        
+        # Separar los nulos para que no interfieran en las comparaciones
+        valid_positions = np.flatnonzero(~missing)
+        keys = values[valid_positions]
+        
+        if ascending:
+            order = np.argsort(keys, kind="stable")
+        else:
+            # Ordenar la secuencia invertida y revertir el resultado mantiene
+            # el orden original entre elementos iguales
+            n = len(keys)
+            order = (n - 1 - np.argsort(keys[::-1], kind="stable"))[::-1]
+            
+        return np.concatenate((valid_positions[order], np.flatnonzero(missing)))
+
+
+    @staticmethod
+    def merge_sort(data, column, ascending=True, progress=None, counters=None):
+        """
+        Implementación del algoritmo de ordenamiento por mezcla (estable).
+        
+        Args:
+            data (list): Lista de diccionarios o registros a ordenar.
+            column (str): Nombre de la columna por la cual ordenar.
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+            
+        Returns:
+            list: Lista ordenada de registros.
+        """
+        result = data.copy()
+        n = len(result)
+        
+        # Extraer las claves una sola vez para no consultar diccionarios en el bucle interno
+        keys = [record[column] for record in result]
+        order = list(range(n))
+        buffer = order[:]
+        
+        # Mezcla ascendente (bottom-up) de tramos de tamaño creciente
+        width = 1
+        passes = max(math.ceil(math.log2(n)), 1) if n > 1 else 1
+        while width < n:
+            if progress is not None:
+                progress(math.log2(width) / passes)
+                
+            for start in range(0, n, 2 * width):
+                middle = min(start + width, n)
+                end = min(start + 2 * width, n)
+                left, right, k = start, middle, start
+                
+                while left < middle and right < end:
+                    # Solo se toma de la derecha si es estrictamente menor/mayor (estabilidad)
+                    condition = keys[order[right]] < keys[order[left]] if ascending else keys[order[right]] > keys[order[left]]
+                    
+                    if condition:
+                        buffer[k] = order[right]
+                        right += 1
+                    else:
+                        buffer[k] = order[left]
+                        left += 1
+                    k += 1
+                    
+                buffer[k:end] = order[left:middle] if left < middle else order[right:end]
+                if counters is not None:
+                    counters.moves += end - start
+                
+            order, buffer = buffer, order
+            width *= 2
+            
+        return [result[i] for i in order]
+
+    @staticmethod
+    def heap_sort(data, column, ascending=True, progress=None, counters=None):
+        """
+        Implementación del algoritmo de ordenamiento por montículo.
+        
+        Args:
+            data (list): Lista de diccionarios o registros a ordenar.
+            column (str): Nombre de la columna por la cual ordenar.
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+            
+        Returns:
+            list: Lista ordenada de registros.
+        """
+        result = data.copy()
+        keys = [record[column] for record in result]
+        order = list(range(len(result)))
+        
+        SortingAlgorithms._heap_sort_range(order, keys, 0, len(order), ascending, progress, counters)
+        
+        return [result[i] for i in order]
+
+    @staticmethod
+    def intro_sort(data, column, ascending=True, progress=None, counters=None):
+        """
+        Implementación del algoritmo introsort: quicksort con mediana de tres que
+        cambia a ordenamiento por montículo si la recursión se degrada y a
+        inserción en tramos pequeños.
+        
+        Args:
+            data (list): Lista de diccionarios o registros a ordenar.
+            column (str): Nombre de la columna por la cual ordenar.
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+            
+        Returns:
+            list: Lista ordenada de registros.
+        """
+        result = data.copy()
+        n = len(result)
+        keys = [record[column] for record in result]
+        order = list(range(n))
+        
+        if n > 1:
+            max_depth = 2 * int(math.log2(n))
+            SortingAlgorithms._intro_sort_range(order, keys, 0, n, max_depth, ascending, progress, counters)
+            
+        return [result[i] for i in order]
+
+    @staticmethod
+    def radix_sort(data, column, ascending=True, progress=None, counters=None):
+        """
+        Implementación del algoritmo de ordenamiento radix LSD (estable) para
+        claves enteras o de punto flotante.
+        
+        Las claves se transforman a enteros sin signo de 64 bits que conservan el
+        orden y se ordenan en pasadas de 16 bits. Los NaN quedan al final. Si la
+        columna no es numérica se recurre al ordenamiento por mezcla.
+        
+        Args:
+            data (list): Lista de diccionarios o registros a ordenar.
+            column (str): Nombre de la columna por la cual ordenar.
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada; puede interrumpir el ordenamiento lanzando una excepción.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+            
+        Returns:
+            list: Lista ordenada de registros.
+        """
+        result = data.copy()
+        keys = [record[column] for record in result]
+        
+        encoded = SortingAlgorithms._radix_keys(keys)
+        if encoded is None:
+            return SortingAlgorithms.merge_sort(data, column, ascending, progress, counters)
+            
+        encoded, missing = encoded
+        if not ascending:
+            encoded = ~encoded
+        # Los NaN van siempre al final, independientemente de la dirección
+        encoded[missing] = np.iinfo(np.uint64).max
+        
+        order = np.arange(len(encoded))
+        for shift in range(0, 64, 16):
+            if progress is not None:
+                progress(shift / 64)
+                
+            digits = ((encoded[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+            # Saltar las pasadas en las que todos los dígitos coinciden
+            if len(digits) and digits.min() == digits.max():
+                continue
+            # El argsort estable sobre enteros de 16 bits es un counting sort por dígito
+            order = order[np.argsort(digits, kind="stable")]
+            if counters is not None:
+                counters.moves += len(order)
+            
+        return [result[i] for i in order]
+
+    @staticmethod
+    def _radix_keys(keys):
+        """
+        Convierte claves numéricas en enteros sin signo que conservan el orden.
+        
+        Args:
+            keys (list): Claves a convertir.
+            
+        Returns:
+            tuple: (numpy.ndarray de uint64, máscara de NaN), o None si alguna clave no es numérica.
+        """
+        if not all(isinstance(key, numbers.Real) for key in keys):
+            return None
+            
+        sign_bit = np.uint64(1 << 63)
+        
+        if all(isinstance(key, numbers.Integral) for key in keys):
+            try:
+                values = np.asarray(keys, dtype=np.int64)
+            except OverflowError:
+                return None
+            return values.view(np.uint64) ^ sign_bit, np.zeros(len(values), dtype=bool)
+            
+        return SortingAlgorithms.float_keys(np.asarray(keys, dtype=np.float64))
+        
+    @staticmethod
+    def float_keys(values):
+        """
+        Convierte flotantes en enteros sin signo que conservan el orden exacto.
+        
+        Args:
+            values (numpy.ndarray): Valores float64.
+            
+        Returns:
+            tuple: (numpy.ndarray de uint64, máscara de NaN).
+        """
+        sign_bit = np.uint64(1 << 63)
+        missing = np.isnan(values)
+        # Normalizar -0.0 para que coincida con 0.0
+        bits = (values + 0.0).view(np.uint64)
+        negative = (bits & sign_bit) != 0
+        # Negativos: invertir todos los bits; positivos: activar el bit de signo
+        encoded = np.where(negative, ~bits, bits | sign_bit)
+        return encoded, missing
+
+    @staticmethod
+    def _heap_sort_range(order, keys, start, end, ascending, progress=None, counters=None):
+        """
+        Ordena por montículo el tramo order[start:end] comparando keys.
+        
+        Args:
+            order (list): Índices a reordenar en el lugar.
+            keys (list): Claves de ordenamiento indexadas por los valores de order.
+            start (int): Inicio del tramo (inclusivo).
+            end (int): Fin del tramo (exclusivo).
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción completada.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+        """
+        n = end - start
+        
+        # Construir el montículo (máximo para ascendente, mínimo para descendente)
+        for root in range(n // 2 - 1, -1, -1):
+            SortingAlgorithms._sift_down(order, keys, start, root, n, ascending, counters)
+            
+        # Extraer la raíz repetidamente hacia el final del tramo
+        for last in range(n - 1, 0, -1):
+            if progress is not None:
+                progress((n - last) / n)
+            order[start], order[start + last] = order[start + last], order[start]
+            if counters is not None:
+                counters.swaps += 1
+            SortingAlgorithms._sift_down(order, keys, start, 0, last, ascending, counters)
+
+    @staticmethod
+    def _sift_down(order, keys, offset, root, size, ascending, counters=None):
+        """
+        Hunde el elemento en root hasta restaurar la propiedad de montículo.
+        
+        Args:
+            order (list): Índices que forman el montículo.
+            keys (list): Claves de ordenamiento indexadas por los valores de order.
+            offset (int): Posición de order donde comienza el montículo.
+            root (int): Posición relativa del elemento a hundir.
+            size (int): Cantidad de elementos del montículo.
+            ascending (bool): True para montículo de máximos, False para montículo de mínimos.
+            counters (SortCounters, optional): Acumula movimientos.
+        """
+        item = order[offset + root]
+        item_key = keys[item]
+        
+        while True:
+            child = 2 * root + 1
+            if child >= size:
+                break
+                
+            # Elegir el hijo que debe subir
+            if child + 1 < size:
+                right_key, left_key = keys[order[offset + child + 1]], keys[order[offset + child]]
+                condition = right_key > left_key if ascending else right_key < left_key
+                if condition:
+                    child += 1
+                    
+            child_key = keys[order[offset + child]]
+            condition = child_key > item_key if ascending else child_key < item_key
+            if not condition:
+                break
+                
+            order[offset + root] = order[offset + child]
+            root = child
+            if counters is not None:
+                counters.moves += 1
+                
+        order[offset + root] = item
+
+    @staticmethod
+    def _intro_sort_range(order, keys, start, end, depth, ascending, progress=None, counters=None):
+        """
+        Ordena el tramo order[start:end] con introsort.
+        
+        Args:
+            order (list): Índices a reordenar en el lugar.
+            keys (list): Claves de ordenamiento indexadas por los valores de order.
+            start (int): Inicio del tramo (inclusivo).
+            end (int): Fin del tramo (exclusivo).
+            depth (int): Profundidad de recursión restante antes de usar heap sort.
+            ascending (bool): True para orden ascendente, False para descendente.
+            progress (callable, optional): Recibe la fracción de elementos ya ubicados en su tramo final.
+            counters (SortCounters, optional): Acumula intercambios y movimientos.
+        """
+        total = end - start
+        
+        while end - start > 16:
+            if progress is not None:
+                progress(1 - (end - start) / total)
+                
+            if depth == 0:
+                SortingAlgorithms._heap_sort_range(order, keys, start, end, ascending, counters=counters)
+                return
+            depth -= 1
+            
+            # Mediana de tres como pivote
+            middle = (start + end) // 2
+            candidates = sorted((order[start], order[middle], order[end - 1]), key=keys.__getitem__)
+            pivot = keys[candidates[1]]
+            
+            # Partición de Hoare
+            i, j = start, end - 1
+            while True:
+                if ascending:
+                    while keys[order[i]] < pivot:
+                        i += 1
+                    while keys[order[j]] > pivot:
+                        j -= 1
+                else:
+                    while keys[order[i]] > pivot:
+                        i += 1
+                    while keys[order[j]] < pivot:
+                        j -= 1
+                if i >= j:
+                    break
+                order[i], order[j] = order[j], order[i]
+                if counters is not None:
+                    counters.swaps += 1
+                i += 1
+                j -= 1
+                
+            # Recursión sobre el tramo menor, iteración sobre el mayor
+            if j + 1 - start < end - (j + 1):
+                SortingAlgorithms._intro_sort_range(order, keys, start, j + 1, depth, ascending, counters=counters)
+                start = j + 1
+            else:
+                SortingAlgorithms._intro_sort_range(order, keys, j + 1, end, depth, ascending, counters=counters)
+                end = j + 1
+                
+        # Inserción para tramos pequeños
+        for i in range(start + 1, end):
+            item = order[i]
+            item_key = keys[item]
+            j = i - 1
+            while j >= start and (item_key < keys[order[j]] if ascending else item_key > keys[order[j]]):
+                order[j + 1] = order[j]
+                j -= 1
+            order[j + 1] = item
+            if counters is not None:
+                counters.moves += i - j
@@ -0,0 +1,124 @@
+import os
+import json
+import subprocess
+import sys
+
+class StartupProfile:
+    """
+    Perfil del tiempo de arranque de la aplicación.
+    
+    Importa los módulos de arranque en un intérprete nuevo con "python -X importtime"
+    (arranque en frío) y resume el tiempo de importación de cada módulo, para
+    verificar que el arranque se mantenga por debajo de un objetivo y que los
+    módulos pesados sigan diferidos.
+    """
+    
+    # Módulos que importa la aplicación antes de mostrar la ventana
+    STARTUP_MODULES = ("main", "ui_manager")
+    
+    # Módulos que deben cargarse recién en el primer uso
+    DEFERRED_MODULES = ("numpy", "pandas", "matplotlib")
+    
+    @staticmethod
+    def measure_imports(modules=STARTUP_MODULES):
+        """
+        Mide el tiempo de importación de cada módulo en un intérprete nuevo.
+        
+        Args:
+            modules (tuple): Módulos a importar.
+            
+        Returns:
+            list: Diccionarios con module, depth, self_ms y cumulative_ms, en orden de importación.
+            
+        Raises:
+            RuntimeError: Si la importación falla.
+        """
+        command = [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"]
+        completed = subprocess.run(
+            command, capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"No se pudieron importar los módulos de arranque:\n{completed.stderr}")
+            
+        entries = []
+        for line in completed.stderr.splitlines():
+            # Formato: "import time: <propio> | <acumulado> | <sangría><módulo>"
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            entries.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000
+            })
+        return entries
+        
+    @staticmethod
+    def measure_deferred(modules=STARTUP_MODULES):
+        """
+        Mide el primer uso de cada módulo diferido, en un intérprete nuevo y después del arranque.
+        
+        Es lo que paga la primera descarga u ordenamiento. Cada módulo se carga en el
+        orden en que se registró, así que no incluye lo que ya cargó uno anterior
+        (por ejemplo, pandas sin numpy).
+        
+        Args:
+            modules (tuple): Módulos de arranque que registran los módulos diferidos.
+            
+        Returns:
+            dict: Segundos por nombre de módulo diferido.
+            
+        Raises:
+            RuntimeError: Si la importación falla.
+        """
+        script = (
+            f"import json, lazy_imports, {', '.join(modules)}\n"
+            "lazy_imports.preload(*lazy_imports._modules.values())\n"
+            "print(json.dumps(lazy_imports.LazyModule.load_times))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"No se pudieron importar los módulos diferidos:\n{completed.stderr}")
+        return json.loads(completed.stdout.splitlines()[-1])
+        
+    @staticmethod
+    def report(entries, top=15, budget_ms=None, deferred=None, log=print):
+        """
+        Informa el tiempo total de arranque y los módulos más lentos.
+        
+        Args:
+            entries (list): Resultado de measure_imports.
+            top (int): Cantidad de módulos a listar.
+            budget_ms (float, optional): Objetivo de tiempo de importación en milisegundos.
+            deferred (dict, optional): Resultado de measure_deferred.
+            log (callable): Recibe cada línea del informe.
+            
+        Returns:
+            bool: True si el arranque está dentro del objetivo (o no hay objetivo).
+        """
+        total_ms = sum(entry["cumulative_ms"] for entry in entries if entry["depth"] == 0)
+        log(f"Importación de arranque: {total_ms:.1f} ms")
+        
+        log(f"{'módulo':<45} {'propio':>10} {'acumulado':>10}")
+        for entry in sorted(entries, key=lambda entry: entry["cumulative_ms"], reverse=True)[:top]:
+            log(f"{entry['module']:<45} {entry['self_ms']:8.1f} ms {entry['cumulative_ms']:8.1f} ms")
+            
+        # Los módulos diferidos no deberían aparecer en el arranque
+        imported = {entry["module"].split(".")[0] for entry in entries}
+        eager = [name for name in StartupProfile.DEFERRED_MODULES if name in imported]
+        if eager:
+            log(f"Módulos que deberían diferirse y se importan al arrancar: {', '.join(eager)}")
+            
+        for name, seconds in (deferred or {}).items():
+            log(f"Diferido {name:<36} {seconds * 1000:8.1f} ms")
+            
+        if budget_ms is None:
+            return True
+        within_budget = total_ms <= budget_ms
+        log(f"Objetivo: {budget_ms:.1f} ms ({'cumplido' if within_budget else 'superado'})")
+        return within_budget
@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+import pytest
+
+# Los módulos de la aplicación están en la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class APIStub:
+    """
+    API HTTP local para las pruebas de descarga.
+    
+    Responde cada página (parámetro "page", 1 por defecto) con el cuerpo de
+    pages como JSON, o tal cual si es bytes. Si etag está definido lo envía y
+    responde 304 a If-None-Match. Guarda cada petición recibida en requests.
+    """
+    
+    def __init__(self):
+        self.pages = {}
+        self.etag = None
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        
+    def url(self, query="vs_currency=usd&per_page=100&page=1"):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/markets?{query}"
+        
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        
+    def _handler(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = dict(parse_qsl(urlsplit(self.path).query))
+                stub.requests.append({"query": query, "headers": dict(self.headers)})
+                if stub.etag is not None and self.headers.get("If-None-Match") == stub.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                    
+                body = stub.pages.get(int(query.get("page", 1)), [])
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if stub.etag is not None:
+                    self.send_header("ETag", stub.etag)
+                self.end_headers()
+                self.wfile.write(body)
+                
+            def log_message(self, format, *args):
+                pass
+                
+        return Handler
+        
+@pytest.fixture
+def api_stub():
+    stub = APIStub()
+    yield stub
+    stub.close()
@@ -0,0 +1,24 @@
+import numpy as np
+from algorithm_selector import AlgorithmSelector
+
+def test_small_key_range_reports_range_not_distinct_count():
+    # Dos valores distintos, pero la clave más alta es 40000
+    keys = np.array([0, 40000] * 50, dtype=np.int64)
+    profile = AlgorithmSelector.profile(keys)
+    assert profile["key_range"] == 40001
+    algorithm, reasons = AlgorithmSelector.choose(profile)
+    assert algorithm == "Columnar (NumPy)"
+    assert reasons[-1].startswith("claves codificadas entre 0 y 40000")
+    assert AlgorithmSelector.narrow(keys, profile).dtype == np.uint16
+
+def test_small_input_uses_insertion():
+    profile = AlgorithmSelector.profile(np.arange(10, dtype=np.int64))
+    assert AlgorithmSelector.choose(profile)[0] == "Inserción"
+
+def test_wide_keys_on_one_core_use_numpy():
+    keys = np.random.default_rng(0).integers(0, 1 << 40, 1000)
+    profile = AlgorithmSelector.profile(keys)
+    algorithm, reasons = AlgorithmSelector.choose(profile, parallel_workers=1)
+    assert algorithm == "Columnar (NumPy)"
+    assert any("un solo núcleo" in reason for reason in reasons)
+    assert AlgorithmSelector.narrow(keys, profile) is keys
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from api_handler import APIHandler
+
+def coins(start, count):
+    return [{"id": f"coin-{i}", "current_price": float(i), "market_cap": 1000 * i} for i in range(start, start + count)]
+    
+def fetch_all(api_stub, per_page, max_workers=3, **kwargs):
+    handler = APIHandler(api_url=api_stub.url())
+    handler.compactor = None
+    return handler.fetch_all_pages(per_page=per_page, max_workers=max_workers, **kwargs)
+    
+def test_pages_are_joined_in_order(api_stub):
+    for page in range(1, 8):
+        api_stub.pages[page] = coins((page - 1) * 5, 5)
+    api_stub.pages[8] = coins(35, 2)
+    
+    data = fetch_all(api_stub, per_page=5)
+    
+    assert data["id"].tolist() == [f"coin-{i}" for i in range(37)]
+    
+def test_server_capping_per_page_does_not_truncate(api_stub):
+    # Se piden 10 por página pero la API sirve 4
+    for page in range(1, 5):
+        api_stub.pages[page] = coins((page - 1) * 4, 4)
+    api_stub.pages[5] = coins(16, 1)
+    
+    data = fetch_all(api_stub, per_page=10)
+    
+    assert data["id"].tolist() == [f"coin-{i}" for i in range(17)]
+    
+def test_pages_longer_than_per_page_are_kept(api_stub):
+    api_stub.pages[1] = coins(0, 6)
+    api_stub.pages[2] = coins(6, 3)
+    
+    data = fetch_all(api_stub, per_page=4)
+    
+    assert len(data) == 9 and data["id"].is_unique
+    
+def test_empty_first_page_returns_none(api_stub):
+    assert fetch_all(api_stub, per_page=5) is None
+    
+def test_error_payload_is_rejected(api_stub, capsys):
+    api_stub.pages[1] = coins(0, 5)
+    api_stub.pages[2] = {"status": {"error_code": 429, "error_message": "rate limited"}}
+    
+    assert fetch_all(api_stub, per_page=5) is None
+    assert "no es un JSON válido" in capsys.readouterr().out
+    
+def test_max_pages_limits_the_download(api_stub):
+    for page in range(1, 10):
+        api_stub.pages[page] = coins((page - 1) * 2, 2)
+        
+    data = fetch_all(api_stub, per_page=2, max_pages=3)
+    
+    assert len(data) == 6
+    assert max(int(request["query"]["page"]) for request in api_stub.requests) == 3
+    
+def test_streamed_fetch_matches_pandas(api_stub):
+    api_stub.pages[1] = coins(0, 20) + [{"id": "extra", "current_price": None, "market_cap": 5, "max_supply": None}]
+    handler = APIHandler(api_url=api_stub.url())
+    handler.compactor = None
+    
+    data = handler.fetch_data()
+    
+    pd.testing.assert_frame_equal(data, pd.DataFrame(api_stub.pages[1]))
@@ -0,0 +1,93 @@
+import io
+import json
+import pandas as pd
+import pytest
+import main
+from api_handler import APIHandler
+from batch_runner import BatchRunner, DataExporter, EXIT_OK, EXIT_FETCH_ERROR, EXIT_USAGE_ERROR, EXIT_SORT_ERROR, EXIT_EXPORT_ERROR
+from data_processor import DataProcessor
+
+COINS = [
+    {"id": "bitcoin", "symbol": "btc", "current_price": 65000.0, "market_cap_rank": 1},
+    {"id": "tether", "symbol": "usdt", "current_price": 1.0, "market_cap_rank": 3},
+    {"id": "ethereum", "symbol": "eth", "current_price": 3000.0, "market_cap_rank": 2},
+    {"id": "dogecoin", "symbol": "doge", "current_price": None, "market_cap_rank": 8},
+    {"id": "usd-coin", "symbol": "usdc", "current_price": 1.0, "market_cap_rank": 6},
+]
+
+@pytest.fixture
+def run(api_stub, tmp_path, monkeypatch):
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("CACHE_TTL", "0")
+    monkeypatch.delenv("API_KEY", raising=False)
+    api_stub.pages[1] = COINS
+    
+    def run(*arguments):
+        return main.main(["--batch", "--url", api_stub.url(), *arguments])
+    return run
+
+def test_csv_export_in_chunks(run, tmp_path):
+    output = tmp_path / "sorted.csv"
+    assert run("--column", "current_price", "--direction", "desc", "--output", str(output), "--chunk-rows", "2") == EXIT_OK
+    data = pd.read_csv(output)
+    # Un solo encabezado aunque se escriba en tres bloques
+    assert data["id"].tolist() == ["bitcoin", "ethereum", "tether", "usd-coin", "dogecoin"]
+
+def test_ndjson_export_with_several_columns(run, tmp_path):
+    output = tmp_path / "sorted.ndjson"
+    status = run("--column", "current_price", "market_cap_rank", "--direction", "asc", "desc",
+                 "--nulls", "first", "--output", str(output), "--chunk-rows", "3", "--algorithm", "Mezcla")
+    assert status == EXIT_OK
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [row["id"] for row in rows] == ["dogecoin", "usd-coin", "tether", "ethereum", "bitcoin"]
+
+def test_csv_to_standard_output(run, capsys):
+    assert run("--column", "market_cap_rank") == EXIT_OK
+    data = pd.read_csv(io.StringIO(capsys.readouterr().out))
+    assert data["market_cap_rank"].tolist() == [1, 2, 3, 6, 8]
+
+def test_fetch_error(run, api_stub):
+    api_stub.pages[1] = b"{not json"
+    assert run("--column", "current_price") == EXIT_FETCH_ERROR
+
+@pytest.mark.parametrize("arguments", [
+    ["--column", "current_price", "--algorithm", "Inexistente"],
+    ["--column", "current_price", "--chunk-rows", "0"],
+    ["--column", "current_price", "--output", "sorted.xlsx"],
+    ["--column", "current_price", "--format", "parquet"],
+    ["--column", "price"],
+])
+def test_usage_errors(run, arguments):
+    assert run(*arguments) == EXIT_USAGE_ERROR
+
+@pytest.mark.parametrize("arguments", [
+    [],
+    ["--column", "current_price", "market_cap_rank", "--direction", "asc", "desc", "asc"],
+    ["--column", "current_price", "--direction", "up"],
+])
+def test_invalid_arguments_exit_before_running(run, arguments):
+    with pytest.raises(SystemExit) as error:
+        run(*arguments)
+    assert error.value.code == EXIT_USAGE_ERROR
+
+def test_sort_error(run, monkeypatch):
+    def fail(*args, **kwargs):
+        raise TypeError("claves no comparables")
+    monkeypatch.setattr(DataProcessor, "get_permutation", fail)
+    assert run("--column", "current_price") == EXIT_SORT_ERROR
+
+def test_export_error(run, tmp_path):
+    assert run("--column", "current_price", "--output", str(tmp_path / "missing" / "sorted.csv")) == EXIT_EXPORT_ERROR
+
+def test_timings_are_reported(api_stub, capsys):
+    api_stub.pages[1] = COINS
+    messages = []
+    runner = BatchRunner(APIHandler(api_url=api_stub.url()), DataProcessor(), log=messages.append)
+    assert runner.run("id", "Columnar (NumPy)") == EXIT_OK
+    assert set(runner.timings) == {"fetch", "sort", "export", "total"}
+    assert "Filas exportadas: 5 (csv)." in messages
+    assert capsys.readouterr().out.startswith("id,")
+
+@pytest.mark.parametrize("path, expected", [("-", "csv"), ("a.CSV", "csv"), ("a.jsonl", "ndjson"), ("a.parquet", "parquet")])
+def test_exporter_infers_the_format(path, expected):
+    assert DataExporter(path).file_format == expected
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_processor import DataProcessor
+
+def markets(rows=100, seed=0, nulls=0):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(0, 1000, rows).astype(float)
+    price[rng.choice(rows, nulls, replace=False)] = np.nan
+    return pd.DataFrame({"id": np.arange(rows), "price": price})
+
+def test_plan_sort_profiles_the_snapshot_and_defers_the_decision():
+    processor = DataProcessor(markets(20))
+    processor.sort_data("price", "Auto")
+    previous = processor.last_auto_decision
+    snapshot = markets(300, seed=1, nulls=30)
+    
+    plan = processor.plan_sort(snapshot, "price", "Auto")
+    # El plan no modifica el procesador: se puede calcular en otro hilo
+    assert processor.last_auto_decision is previous
+    decision = plan["auto_decision"]
+    assert decision["profile"]["rows"] == 300
+    assert decision["profile"]["has_nulls"]
+    
+    processor.apply_refresh(plan)
+    assert processor.last_auto_decision is decision
+
+def test_plan_sort_without_auto_clears_the_decision():
+    processor = DataProcessor(markets())
+    processor.sort_data("price", "Auto")
+    processor.apply_refresh(processor.plan_sort(markets(seed=1), "price", "Mezcla"))
+    assert processor.last_auto_decision is None
+
+def test_select_algorithm_returns_the_decision():
+    processor = DataProcessor(markets())
+    keys = np.arange(100, dtype=np.int64)
+    algorithm, sort_input, decision = processor.select_algorithm(keys, "price")
+    assert algorithm == decision["algorithm"] == "Columnar (NumPy)"
+    assert processor.last_auto_decision is None
+    assert sort_input.dtype == np.uint8
+
+def ties(rows=200, seed=0):
+    # Muchos empates y nulos, para verificar la estabilidad y la ubicación de los nulos
+    rng = np.random.default_rng(seed)
+    price = rng.integers(0, 10, rows).astype(float)
+    price[rng.choice(rows, rows // 10, replace=False)] = np.nan
+    return pd.DataFrame({"id": np.arange(rows), "price": price, "rank": rng.integers(0, 3, rows)})
+
+def test_cache_key_includes_every_sort_option():
+    processor = DataProcessor(ties())
+    processor.get_permutation("price", "Mezcla", True)
+    assert processor.permutation_cache.stats()["entries"] == 1
+    # Otro algoritmo estable comparte la entrada
+    processor.get_permutation("price", "Columnar (NumPy)", True)
+    assert processor.permutation_cache.stats()["hits"] == 1
+    # Cambiar la estabilidad, las columnas o la ubicación de nulos son entradas distintas
+    processor.get_permutation("price", "Montículo", True)
+    processor.get_permutation(["price", "rank"], "Mezcla", True)
+    processor.get_permutation("price", "Mezcla", True, na_position="first")
+    stats = processor.permutation_cache.stats()
+    assert stats["entries"] == 4
+    assert stats["hits"] == 1
+    key = (processor.data_version, ("price",), True, (True,), "first")
+    assert processor.permutation_cache.peek(key) is not None
+
+@pytest.mark.parametrize("replace", ["set_data", "refresh_data"])
+def test_cache_is_invalidated_when_the_data_changes(replace):
+    processor = DataProcessor(ties())
+    processor.sort_data("price", "Mezcla")
+    version = processor.data_version
+    if replace == "set_data":
+        processor.set_data(ties(seed=1))
+    else:
+        processor.refresh_data(ties(seed=1), "price")
+    assert processor.data_version == version + 1
+    assert processor.permutation_cache.stats()["entries"] == 0
+    
+    result = processor.sort_data("price", "Mezcla")
+    expected = ties(seed=1).sort_values("price", kind="stable")
+    assert result.index.tolist() == expected.index.tolist()
+
+def test_cache_evicts_least_recently_used():
+    data = ties()
+    # Lugar para dos permutaciones
+    processor = DataProcessor(data, cache_max_bytes=2 * len(data) * np.dtype(np.intp).itemsize)
+    first = ("price", "Mezcla", True)
+    processor.get_permutation(*first)
+    processor.get_permutation("rank", "Mezcla", True)
+    processor.get_permutation(*first)
+    processor.get_permutation(["rank", "price"], "Mezcla", True)
+    stats = processor.permutation_cache.stats()
+    assert stats["evictions"] == 1
+    assert processor.permutation_cache.peek((processor.data_version, ("price",), True, (True,), "last")) is not None
+    assert processor.permutation_cache.peek((processor.data_version, ("rank",), True, (True,), "last")) is None
+
+@pytest.mark.parametrize("na_position", ["last", "first"])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_opposite_direction_is_derived_stably(na_position, ascending):
+    data = ties()
+    processor = DataProcessor(data)
+    processor.sort_data("price", "Mezcla", not ascending, na_position=na_position)
+    result = processor.sort_data("price", "Mezcla", ascending, na_position=na_position)
+    assert processor.derived_permutations == 1
+    expected = data.sort_values("price", ascending=ascending, na_position=na_position, kind="stable")
+    assert result.index.tolist() == expected.index.tolist()
+
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_unstable_derivation_keeps_values_and_nulls_in_place(na_position):
+    data = ties()
+    processor = DataProcessor(data)
+    processor.sort_data("price", "Montículo", True, na_position=na_position)
+    result = processor.sort_data("price", "Montículo", False, na_position=na_position)
+    assert processor.derived_permutations == 1
+    expected = data.sort_values("price", ascending=False, na_position=na_position, kind="stable")
+    pd.testing.assert_series_equal(result["price"].reset_index(drop=True), expected["price"].reset_index(drop=True))
+
+def test_multi_column_sorts_are_not_derived():
+    data = ties()
+    processor = DataProcessor(data)
+    processor.sort_data(["rank", "price"], "Mezcla", True)
+    result = processor.sort_data(["rank", "price"], "Mezcla", False)
+    assert processor.derived_permutations == 0
+    expected = data.sort_values(["rank", "price"], ascending=False, kind="stable")
+    assert result.index.tolist() == expected.index.tolist()
+
+def full_sort(data, column, ascending, na_position):
+    return DataProcessor(data).sort_data(column, "Columnar (NumPy)", ascending, na_position=na_position)
+
+@pytest.mark.parametrize("k", [0, 1, 7, 50, 199, 200, 500])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+@pytest.mark.parametrize("column", ["price", "rank", ["rank", "price"]])
+def test_top_k_matches_head_of_full_sort(k, ascending, na_position, column):
+    data = ties()
+    result = DataProcessor(data).top_k(column, k, ascending, na_position)
+    assert result.index.tolist() == full_sort(data, column, ascending, na_position).index[:k].tolist()
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_top_k_keeps_large_int64_values_apart(ascending):
+    # Distintos en int64 pero iguales al pasarlos a float64
+    data = pd.DataFrame({"supply": np.array([2 ** 53 + 1, 2 ** 53, 2 ** 53 + 1, 2 ** 53 + 2, 2 ** 53], dtype=np.int64)})
+    result = DataProcessor(data).top_k("supply", 3, ascending)
+    assert result.index.tolist() == full_sort(data, "supply", ascending, "last").index[:3].tolist()
+
+@pytest.mark.parametrize("na_position", ["last", "first"])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_top_k_keeps_extreme_floats_apart_from_nulls(na_position, ascending):
+    big = np.finfo(np.float64).max
+    data = pd.DataFrame({"price": [np.inf, np.nan, big, -np.inf, -big, np.nan, 0.0, -0.0, np.inf]})
+    result = DataProcessor(data).top_k("price", 9, ascending, na_position)
+    assert result.index.tolist() == full_sort(data, "price", ascending, na_position).index.tolist()
+    for k in range(9):
+        assert DataProcessor(data).top_k("price", k, ascending, na_position).index.tolist() == result.index[:k].tolist()
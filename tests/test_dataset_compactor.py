@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from dataset_compactor import DatasetCompactor
+
+def markets():
+    return pd.DataFrame({
+        "id": ["bitcoin", "ethereum", "tether", "bitcoin-cash"],
+        "image": ["https://img/1.png", "https://img/2.png", "https://img/3.png", "https://img/4.png"],
+        "market_cap_rank": [1, 2, 3, 4],
+        "current_price": [65000.0, 3000.0, 1.0, 400.0],
+        "total_supply": [21000000.0, 120000000.0, 100000000000.0, 21000000.0],
+        "price_change_percentage_24h": [1.25, -0.5, 0.0, np.nan],
+        "symbol": ["btc", "btc", "btc", "bch"],
+        "roi": [None, {"times": 5.5, "currency": "btc", "percentage": 550.0}, None, None],
+    })
+
+def test_no_column_is_dropped_by_default():
+    compacted = DatasetCompactor().compact(markets())
+    assert "image" in compacted.columns
+    assert compacted["image"].tolist() == markets()["image"].tolist()
+
+def test_drop_columns_is_opt_in():
+    compactor = DatasetCompactor(drop_columns=["image"])
+    compacted = compactor.compact(markets())
+    assert "image" not in compacted.columns
+    assert compactor.last_report[1]["dtype_after"] == "eliminada"
+
+def test_integral_floats_stay_float():
+    compacted = DatasetCompactor().compact(markets())
+    assert compacted["current_price"].dtype == np.float32
+    assert compacted["total_supply"].dtype.kind == "f"
+    assert compacted["market_cap_rank"].dtype == np.int8
+
+def test_values_survive_compaction():
+    data = markets()
+    compacted = DatasetCompactor().compact(data)
+    for column in ["id", "market_cap_rank", "current_price", "total_supply", "price_change_percentage_24h", "symbol"]:
+        pd.testing.assert_series_equal(compacted[column].astype(data[column].dtype), data[column])
+    assert compacted["roi_times"].tolist()[1] == 5.5
+    assert compacted["roi_currency"].tolist()[1] == "btc"
+
+def test_colliding_nested_column_is_renamed(capsys):
+    data = markets()
+    data["roi_times"] = [1.0, 2.0, 3.0, 4.0]
+    compacted = DatasetCompactor().compact(data)
+    assert compacted["roi_times"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert compacted["roi_times_2"].tolist()[1] == 5.5
+    assert "roi_times_2" in capsys.readouterr().out
+
+def test_same_dtype_across_snapshots():
+    # Una instantánea con precios enteros no debe cambiar el tipo de la columna
+    compactor = DatasetCompactor()
+    whole = compactor.compact(pd.DataFrame({"current_price": [1.0, 2.0, 3.0]}))
+    fractional = compactor.compact(pd.DataFrame({"current_price": [1.5, 2.0, 3.0]}))
+    assert whole["current_price"].dtype == fractional["current_price"].dtype
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+from external_sort import ExternalSorter
+
+def markets(rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(0, 20, rows).astype(float)
+    price[rng.choice(rows, rows // 20, replace=False)] = np.nan
+    symbol = rng.choice(["btc", "eth", "sol", "ada"], rows).astype(object)
+    symbol[rng.choice(rows, rows // 20, replace=False)] = None
+    return pd.DataFrame({"id": np.arange(rows), "price": price, "symbol": symbol})
+
+def sort_all(sorter, data, chunk_rows=None):
+    source = data if chunk_rows is None else [data.iloc[start:start + chunk_rows] for start in range(0, len(data), chunk_rows)]
+    with sorter.sort(source) as result:
+        return pd.concat(list(result), ignore_index=True)
+
+# Presupuesto chico para forzar varios tramos en disco
+BUDGET = 16 * 1024
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_single_column_matches_pandas(tmp_path, ascending, na_position):
+    data = markets()
+    sorter = ExternalSorter("price", ascending, na_position, memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sort_all(sorter, data, chunk_rows=300)
+    expected = data.sort_values("price", ascending=ascending, na_position=na_position, kind="stable")
+    assert result["id"].tolist() == expected["id"].tolist()
+
+@pytest.mark.parametrize("ascending", [[True, True], [False, True], [True, False]])
+def test_several_columns_match_pandas(tmp_path, ascending):
+    data = markets()
+    sorter = ExternalSorter(["symbol", "price"], ascending, memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sort_all(sorter, data)
+    expected = data.sort_values(["symbol", "price"], ascending=ascending, na_position="last", kind="stable")
+    assert result["id"].tolist() == expected["id"].tolist()
+
+def test_temporary_files_are_removed(tmp_path):
+    sorter = ExternalSorter("price", memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sorter.sort(markets())
+    assert len(result) == 2000
+    result.close()
+    assert list(tmp_path.iterdir()) == []
+
+def test_empty_source(tmp_path):
+    with ExternalSorter("price", temp_dir=tmp_path).sort(markets(0)) as result:
+        assert len(result) == 0
+        assert list(result) == []
+
+def test_rejects_mismatched_directions():
+    with pytest.raises(ValueError):
+        ExternalSorter(["symbol", "price"], [True])
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_empty_strings_are_not_nulls(tmp_path, ascending, na_position):
+    rng = np.random.default_rng(1)
+    symbol = rng.choice(np.array(["", "btc", "eth", None], dtype=object), 2000)
+    data = pd.DataFrame({"id": np.arange(2000), "symbol": symbol})
+    sorter = ExternalSorter("symbol", ascending, na_position, memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sort_all(sorter, data, chunk_rows=300)
+    expected = data.sort_values("symbol", ascending=ascending, na_position=na_position, kind="stable")
+    assert result["id"].tolist() == expected["id"].tolist()
+    # Los nulos vuelven como None y las cadenas vacías se conservan
+    assert result["symbol"].tolist() == expected["symbol"].tolist()
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_large_int64_keys_are_exact(tmp_path, ascending):
+    # Valores que coinciden al pasarlos a float64
+    base = 2 ** 62
+    values = base + np.random.default_rng(2).integers(-3, 3, 2000)
+    data = pd.DataFrame({"id": np.arange(2000), "supply": values.astype(np.int64)})
+    sorter = ExternalSorter("supply", ascending, memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sort_all(sorter, data, chunk_rows=300)
+    expected = data.sort_values("supply", ascending=ascending, kind="stable")
+    assert result["id"].tolist() == expected["id"].tolist()
+    assert result["supply"].dtype == np.int64
+
+def test_datetime_column(tmp_path):
+    rng = np.random.default_rng(3)
+    stamps = pd.to_datetime(rng.integers(0, 10 ** 6, 1000), unit="s").to_series(index=range(1000))
+    stamps[rng.choice(1000, 50, replace=False)] = pd.NaT
+    data = pd.DataFrame({"id": np.arange(1000), "last_updated": stamps})
+    sorter = ExternalSorter("last_updated", False, memory_budget=BUDGET, temp_dir=tmp_path)
+    result = sort_all(sorter, data, chunk_rows=200)
+    expected = data.sort_values("last_updated", ascending=False, na_position="last", kind="stable")
+    assert result["id"].tolist() == expected["id"].tolist()
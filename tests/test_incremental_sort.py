@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from incremental_sort import IncrementalSorter
+from data_processor import DataProcessor
+
+def snapshot(values, ids=None):
+    ids = list(range(len(values))) if ids is None else ids
+    return pd.DataFrame({"id": ids, "price": values})
+
+def expected(data, ascending=True):
+    # Orden completo con desempate por id, como el ordenamiento incremental
+    return data.sort_values(["price", "id"], ascending=[ascending, True], na_position="last", kind="stable").index.tolist()
+
+def test_reset_orders_with_ties_by_id():
+    data = snapshot([3.0, 1.0, 3.0, np.nan, 2.0], ids=[10, 4, 2, 7, 1])
+    sorter = IncrementalSorter("price")
+    assert data.index[sorter.reset(data)].tolist() == expected(data)
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_update_matches_full_sort(ascending):
+    rng = np.random.default_rng(0)
+    data = snapshot(rng.integers(0, 50, 200).astype(float))
+    sorter = IncrementalSorter("price", ascending)
+    sorter.reset(data)
+    for _ in range(20):
+        data = data.copy()
+        changed = rng.choice(len(data), 5, replace=False)
+        data.loc[changed, "price"] = rng.integers(0, 50, 5)
+        # Quitar una fila y agregar otra con un id nuevo
+        data = pd.concat([data.iloc[1:], snapshot([rng.random() * 50], ids=[int(data["id"].max()) + 1])], ignore_index=True)
+        permutation, changes = sorter.update(data)
+        assert data.index[permutation].tolist() == expected(data, ascending)
+        assert len(changes["added"]) == 1 and len(changes["removed"]) == 1
+
+def test_update_reports_changed_rows():
+    data = snapshot([1.0, 2.0, 3.0])
+    sorter = IncrementalSorter("price")
+    sorter.reset(data)
+    updated = snapshot([1.0, 5.0, 3.0])
+    permutation, changes = sorter.update(updated)
+    assert changes["moved"] == [1]
+    # La fila 1 pasa al final: cambian las posiciones 1 y 2 de la vista
+    assert changes["rows"] == [1, 2]
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        IncrementalSorter("price").reset(snapshot([1.0, 2.0], ids=[1, 1]))
+
+def test_copy_leaves_original_untouched():
+    data = snapshot([1.0, 2.0, 3.0])
+    sorter = IncrementalSorter("price")
+    sorter.reset(data)
+    order = list(sorter._order)
+    sorter.copy().update(snapshot([9.0, 2.0, 3.0]))
+    assert sorter._order == order
+
+def test_plan_refresh_does_not_modify_processor():
+    processor = DataProcessor()
+    data = snapshot([1.0, 2.0, 3.0])
+    processor.refresh_data(data, "price")
+    sorter = processor.incremental_sorter
+    
+    plan = processor.plan_refresh(snapshot([9.0, 2.0, 3.0]), "price")
+    assert processor.data is data and processor.incremental_sorter is sorter
+    
+    sorted_data, changes = processor.apply_refresh(plan)
+    assert sorted_data["price"].tolist() == [2.0, 3.0, 9.0]
+    assert changes["moved"] == [0]
+
+def test_stale_plan_is_rejected():
+    processor = DataProcessor()
+    processor.refresh_data(snapshot([1.0, 2.0]), "price")
+    plan = processor.plan_refresh(snapshot([2.0, 1.0]), "price")
+    processor.set_data(snapshot([5.0]))
+    with pytest.raises(ValueError):
+        processor.apply_refresh(plan)
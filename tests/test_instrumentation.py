@@ -0,0 +1,82 @@
+import json
+import pandas as pd
+import pytest
+from data_processor import DataProcessor
+from instrumentation import Instrumentation, CountingKey, SortCounters, NULL_RECORD
+
+def counted_sort(values, algorithm):
+    instrumentation = Instrumentation(enabled=True, count_operations=True)
+    processor = DataProcessor(pd.DataFrame({"value": values}), instrumentation=instrumentation)
+    processor.sort_data("value", algorithm)
+    return instrumentation.last("sort")["counters"]
+
+def inversions(values):
+    return sum(1 for i in range(len(values)) for j in range(i + 1, len(values)) if values[i] > values[j])
+
+def test_counting_key_counts_each_comparison():
+    counters = SortCounters()
+    low, high = CountingKey(1, counters), CountingKey(2, counters)
+    assert low < high and low <= high and high > low and high >= low and not low == high
+    assert counters.to_dict() == {"comparisons": 5, "swaps": 0, "moves": 0}
+
+@pytest.mark.parametrize("values", [list(range(10, 0, -1)), list(range(10)), [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]])
+def test_bubble_sort_counters(values):
+    n = len(values)
+    counters = counted_sort(values, "Burbuja")
+    # Burbuja compara todos los pares de cada pasada e intercambia una vez por inversión
+    assert counters == {"comparisons": n * (n - 1) // 2, "swaps": inversions(values), "moves": 0}
+
+def test_merge_sort_moves():
+    # Tres pasadas de mezcla sobre 8 elementos, cada una mueve los 8
+    counters = counted_sort([5, 2, 7, 1, 8, 3, 6, 4], "Mezcla")
+    assert counters["moves"] == 24
+    assert counters["swaps"] == 0
+    assert 0 < counters["comparisons"] <= 8 * 3
+
+def test_columnar_algorithms_have_no_comparison_counts():
+    counters = counted_sort([3, 1, 2], "Columnar (NumPy)")
+    assert counters["comparisons"] == 0
+
+def test_counters_are_off_unless_requested():
+    instrumentation = Instrumentation(enabled=True)
+    DataProcessor(pd.DataFrame({"value": [3, 1, 2]}), instrumentation=instrumentation).sort_data("value", "Burbuja")
+    record = instrumentation.last("sort")
+    assert record["counters"] is None
+    assert {"encode", "algorithm", "extract", "take"} <= set(record["phases"])
+
+def test_disabled_instrumentation_is_a_no_op():
+    instrumentation = Instrumentation()
+    with instrumentation.operation("sort", True, rows=3) as record:
+        assert record is NULL_RECORD
+        with record.phase("algorithm"):
+            pass
+        record.set("cache", "miss")
+        record.add("take", 1.0)
+    assert record.counters is None
+    assert instrumentation.records() == []
+    
+    # Los algoritmos reciben las claves originales y ningún contador
+    calls = []
+    processor = DataProcessor(pd.DataFrame({"value": [3, 1, 2]}), instrumentation=instrumentation)
+    bubble_sort = processor.sorting_algorithms["Burbuja"]
+    def spy(data, column, ascending=True, progress=None, counters=None):
+        calls.append((counters, {type(item[column]) for item in data}))
+        return bubble_sort(data, column, ascending, progress, counters)
+    processor.sorting_algorithms["Burbuja"] = spy
+    assert processor.sort_data("value", "Burbuja")["value"].tolist() == [1, 2, 3]
+    assert calls == [(None, {int})]
+
+def test_errors_are_recorded_and_history_is_bounded(tmp_path):
+    instrumentation = Instrumentation(enabled=True, history=2)
+    with pytest.raises(ValueError):
+        with instrumentation.operation("fetch"):
+            raise ValueError("sin red")
+    assert instrumentation.last("fetch")["details"]["error"] == "ValueError"
+    for _ in range(3):
+        with instrumentation.operation("sort"):
+            pass
+    assert [record["operation"] for record in instrumentation.records()] == ["sort", "sort"]
+    
+    path = tmp_path / "stats.json"
+    instrumentation.export_json(str(path))
+    assert len(json.loads(path.read_text(encoding="utf-8"))["records"]) == 2
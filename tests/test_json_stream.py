@@ -0,0 +1,94 @@
+import json
+import random
+import numpy as np
+import pandas as pd
+import pytest
+from json_stream import JSONArrayParser, ColumnBuffers
+
+BODY = ('[{"id": 1, "price": -2.5e+3, "name": "x\\u00e9y\\ud83d\\ude00", "active": true, "supply": null,'
+        ' "roi": {"times": 1.5}, "tags": [1, {"a": false}], "ratio": NaN}, {"id": 123456}, {"ratio": -Infinity} ]')
+
+def parse(body, chunk_size):
+    parser = JSONArrayParser()
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items += parser.feed(body[start:start + chunk_size].encode("utf-8"))
+    parser.close()
+    return items
+
+def test_any_chunk_size_matches_json_loads():
+    expected = json.dumps(json.loads(BODY))
+    for chunk_size in range(1, len(BODY) + 1):
+        assert json.dumps(parse(BODY, chunk_size)) == expected
+        
+def test_split_multibyte_characters():
+    body = json.dumps([{"name": "añoñ€"}], ensure_ascii=False).encode("utf-8")
+    parser = JSONArrayParser()
+    items = [item for byte in range(len(body)) for item in parser.feed(body[byte:byte + 1])]
+    parser.close()
+    assert items == [{"name": "añoñ€"}]
+    
+@pytest.mark.parametrize("body", [
+    '[{"a": 1},]',
+    '[{"a": 1} {"a": 2}]',
+    '[,{"a": 1}]',
+    '[{"a": 1},,{"a": 2}]',
+    '[{"a": x}]',
+    '[{"a" 1}]',
+    '[{"a": tru}]',
+    '[{"a": 1.}]',
+    '[{"a": 1}] x',
+    '[{"a": 1}',
+    '{"a": 1}',
+])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_invalid_bodies_are_rejected(body, chunk_size):
+    with pytest.raises(ValueError):
+        parse(body, chunk_size)
+        
+def test_syntax_error_is_reported_before_close():
+    parser = JSONArrayParser()
+    with pytest.raises(ValueError):
+        parser.feed('[{"a": 1}, {"a" 1, "b": 2')
+        
+def test_number_at_chunk_end_waits_for_more_digits():
+    parser = JSONArrayParser()
+    assert parser.feed("[12") == []
+    assert parser.feed("3, 4]") == [123, 4]
+    parser.close()
+    
+def random_value(rng, kind):
+    if rng.random() < 0.25:
+        return None
+    if kind == "int":
+        return rng.randint(-5, 5)
+    if kind == "float":
+        return rng.choice([rng.random(), float(rng.randint(0, 3))])
+    if kind == "str":
+        return rng.choice(["a", "b"])
+    if kind == "bool":
+        return rng.choice([True, False])
+    if kind == "mixed":
+        return rng.choice([1, 2.5, "x", True, {"k": 1}, [1], 2 ** 70])
+    return None
+    
+@pytest.mark.parametrize("seed", range(400))
+def test_column_buffers_match_pandas(seed):
+    rng = random.Random(seed)
+    kinds = {f"c{i}": rng.choice(["int", "float", "str", "bool", "mixed", "null"]) for i in range(rng.randint(1, 5))}
+    records = []
+    for _ in range(rng.randint(1, 8)):
+        # Algunos campos faltan en algunos registros
+        records.append({field: random_value(rng, kind) for field, kind in kinds.items() if rng.random() >= 0.15})
+        
+    buffers = ColumnBuffers()
+    buffers.extend(records)
+    pd.testing.assert_frame_equal(buffers.to_dataframe(), pd.DataFrame(records), check_index_type=False)
+    
+def test_columns_without_values():
+    buffers = ColumnBuffers()
+    buffers.extend([{"max_supply": None, "roi": None}, {"roi": None}])
+    data = buffers.to_dataframe()
+    # Como en pandas: NaN si falta en algún registro, None si todos son null explícitos
+    assert data["max_supply"].dtype == np.float64
+    assert data["roi"].dtype == object and data["roi"].tolist() == [None, None]
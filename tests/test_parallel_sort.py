@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from parallel_sort import ParallelSorter
+
+@pytest.fixture(scope="module")
+def sorter():
+    # Umbral mínimo y varios procesos, aunque la máquina tenga un solo núcleo
+    sorter = ParallelSorter(workers=3, min_size=10)
+    yield sorter
+    sorter.shutdown()
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("high", [5, 1 << 40])
+def test_matches_stable_argsort(sorter, ascending, high):
+    values = np.random.default_rng(high).integers(-high, high, 20000)
+    expected = np.argsort(values if ascending else -values, kind="stable")
+    assert np.array_equal(sorter.sort(values, ascending), expected)
+
+def test_all_equal_keys_keep_input_order(sorter):
+    assert np.array_equal(sorter.sort(np.zeros(1000, dtype=np.int64)), np.arange(1000))
+
+def test_sorted_and_reversed_input(sorter):
+    values = np.arange(5000)
+    assert np.array_equal(sorter.sort(values), values)
+    assert np.array_equal(sorter.sort(values[::-1]), values[::-1])
+
+def test_small_or_float_input_sorts_serially():
+    sorter = ParallelSorter(workers=3, min_size=1000)
+    values = np.array([3, 1, 2])
+    assert sorter.sort(values).tolist() == [1, 2, 0]
+    assert sorter.sort(np.array([0.5, np.nan, -1.0])).tolist() == [2, 0, 1]
+    # Sin trabajo en paralelo no se crea el grupo de procesos
+    assert sorter._executor is None
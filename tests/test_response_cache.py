@@ -0,0 +1,130 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from api_handler import APIHandler
+from instrumentation import Instrumentation
+from response_cache import ResponseCache
+
+def coins(count, price=1.0):
+    return [{"id": f"coin-{i}", "current_price": price + i, "market_cap": 1000 * (i + 1)} for i in range(count)]
+    
+def make_handler(api_stub, cache):
+    return APIHandler(api_url=api_stub.url(), cache=cache, instrumentation=Instrumentation(enabled=True))
+    
+def last_source(handler):
+    return handler.instrumentation.last("fetch")["details"]["source"]
+    
+def test_fresh_entry_is_served_without_network(api_stub, tmp_path):
+    api_stub.pages[1] = coins(3)
+    handler = make_handler(api_stub, ResponseCache(str(tmp_path), ttl=300))
+    
+    first = handler.fetch_data()
+    second = handler.fetch_data()
+    
+    assert len(api_stub.requests) == 1
+    assert last_source(handler) == "cache"
+    pd.testing.assert_frame_equal(first, second)
+    
+def test_expired_entry_is_revalidated_with_etag(api_stub, tmp_path):
+    api_stub.pages[1] = coins(3)
+    api_stub.etag = '"v1"'
+    handler = make_handler(api_stub, ResponseCache(str(tmp_path), ttl=0))
+    
+    first = handler.fetch_data()
+    second = handler.fetch_data()
+    
+    assert len(api_stub.requests) == 2
+    assert api_stub.requests[1]["headers"].get("If-None-Match") == '"v1"'
+    assert last_source(handler) == "not_modified"
+    pd.testing.assert_frame_equal(first, second)
+    
+def test_ttl_expiry_fetches_new_data(api_stub, tmp_path):
+    api_stub.pages[1] = coins(3)
+    api_stub.etag = '"v1"'
+    cache = ResponseCache(str(tmp_path), ttl=0.2)
+    handler = make_handler(api_stub, cache)
+    handler.fetch_data()
+    
+    api_stub.pages[1] = coins(4, price=10.0)
+    api_stub.etag = '"v2"'
+    # Dentro del TTL se sigue usando la entrada guardada
+    assert len(handler.fetch_data()) == 3
+    time.sleep(0.3)
+    data = handler.fetch_data()
+    
+    assert last_source(handler) == "network"
+    assert len(data) == 4 and data["current_price"].iloc[0] == 10.0
+    entry = cache.get(cache.make_key(api_stub.url()))
+    assert entry.etag == '"v2"'
+    
+def test_corrupt_entry_is_discarded_and_refetched(api_stub, tmp_path):
+    api_stub.pages[1] = coins(3)
+    cache = ResponseCache(str(tmp_path), ttl=300)
+    handler = make_handler(api_stub, cache)
+    handler.fetch_data()
+    
+    key = cache.make_key(api_stub.url())
+    with open(os.path.join(str(tmp_path), key + ResponseCache.DATA_SUFFIX), "wb") as file:
+        file.write(b"PK\x03\x04 truncated")
+    data = handler.fetch_data()
+    
+    assert len(data) == 3
+    assert last_source(handler) == "network"
+    assert len(api_stub.requests) == 2
+    
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    data = pd.DataFrame({"value": np.arange(1000, dtype=np.int64)})
+    for key in ("a", "b"):
+        cache.put(key, data)
+    entry_size = cache.size() // 2
+    
+    # "a" se guardó primero pero se usó después que "b"
+    now = time.time()
+    os.utime(cache._path("a", ResponseCache.DATA_SUFFIX), (now - 20, now - 20))
+    os.utime(cache._path("b", ResponseCache.DATA_SUFFIX), (now - 10, now - 10))
+    assert cache.load("a") is not None
+    
+    cache.max_bytes = 2 * entry_size
+    cache.put("c", data)
+    
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    
+def test_oversized_entry_is_not_stored(tmp_path, capsys):
+    cache = ResponseCache(str(tmp_path))
+    small = pd.DataFrame(coins(3))
+    assert cache.put("a", small)
+    assert cache.put("b", small)
+    cache.max_bytes = cache.size()
+    
+    # No desaloja a las demás ni deja la versión anterior de su propia clave
+    assert not cache.put("a", pd.DataFrame(coins(5000)))
+    assert "no se guarda" in capsys.readouterr().out
+    assert cache.get("a") is None
+    assert cache.load("b") is not None
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+    
+def test_round_trip_keeps_dtypes(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    data = pd.DataFrame({
+        "id": ["a", "b", "c"],
+        "price": np.array([1.5, np.nan, 3.0], dtype=np.float32),
+        "rank": np.array([1, 2, 3], dtype=np.int16),
+        "category": pd.Categorical(["x", "y", "x"]),
+        "roi": [{"times": 1.5}, None, np.nan],
+        "active": [True, False, True],
+        "updated": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+        "supply": pd.array([1, None, 3], dtype="Int64"),
+    }, index=[5, 3, 9])
+    cache.put("key", data)
+    pd.testing.assert_frame_equal(cache.load("key"), data)
+    
+def test_pickle_files_are_not_loaded(tmp_path):
+    legacy = tmp_path / ("0" * 64 + ResponseCache.LEGACY_SUFFIX)
+    pd.DataFrame({"a": [1]}).to_pickle(str(legacy))
+    ResponseCache(str(tmp_path))
+    assert not legacy.exists()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sort_keys import SortKeys
+from data_processor import DataProcessor
+
+def markets(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(0, 20, rows).astype(float)
+    price[rng.choice(rows, rows // 10, replace=False)] = np.nan
+    symbol = rng.choice(np.array(["btc", "eth", "ada", "Sol", ""], dtype=object), rows)
+    symbol[rng.choice(rows, rows // 10, replace=False)] = None
+    return pd.DataFrame({
+        "price": price,
+        "symbol": symbol,
+        "rank": rng.integers(-3, 3, rows),
+        "supply": (2 ** 62 + rng.integers(0, 4, rows)).astype(np.int64),
+    })
+
+def expected(data, columns, ascending, na_position="last"):
+    return data.sort_values(columns, ascending=ascending, na_position=na_position, kind="stable").index.tolist()
+
+def encoded_order(data, columns, ascending, na_position="last"):
+    keys = SortKeys.encode(data, columns, ascending, na_position)
+    assert keys.dtype == np.int64
+    return data.index[np.argsort(keys, kind="stable")].tolist()
+
+@pytest.mark.parametrize("columns, ascending", [
+    ("price", True),
+    ("symbol", False),
+    ("supply", False),
+    (["symbol", "price"], [True, False]),
+    (["rank", "symbol", "price"], [False, True, True]),
+    (["price", "supply", "rank"], [True, False, False]),
+])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_encoded_keys_match_stable_sort_values(columns, ascending, na_position):
+    data = markets()
+    assert encoded_order(data, columns, ascending, na_position) == expected(data, columns, ascending, na_position)
+
+def test_combination_is_recompressed_before_overflowing(monkeypatch):
+    # Cuatro columnas de ~60000 valores distintos: el producto supera int64
+    rows = 60000
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame({name: rng.integers(0, 10 ** 6, rows) for name in "abcd"})
+    calls = []
+    densify = SortKeys._densify
+    monkeypatch.setattr(SortKeys, "_densify", staticmethod(lambda keys: calls.append(1) or densify(keys)))
+    columns, ascending = list("abcd"), [True, False, True, False]
+    assert encoded_order(data, columns, ascending) == expected(data, columns, ascending)
+    assert calls
+
+def test_object_columns_with_mixed_values_sort_by_text():
+    data = pd.DataFrame({"roi": [{"times": 2}, None, {"times": 1}, {"times": 2}]})
+    keys = SortKeys.encode(data, "roi")
+    assert np.argsort(keys, kind="stable").tolist() == [2, 0, 3, 1]
+
+@pytest.mark.parametrize("algorithm", ["Mezcla", "Columnar (NumPy)"])
+def test_build_sort_input_matches_sort_values(algorithm):
+    data = markets()
+    processor = DataProcessor(data)
+    result = processor.sort_data(["symbol", "rank"], algorithm, [False, True], na_position="first")
+    assert result.index.tolist() == expected(data, ["symbol", "rank"], [False, True], "first")
+
+@pytest.mark.parametrize("ascending, na_position", [([True], "last"), (True, "middle")])
+def test_rejects_invalid_options(ascending, na_position):
+    with pytest.raises(ValueError):
+        SortKeys.encode(markets(), ["price", "rank"], ascending, na_position)
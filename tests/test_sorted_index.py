@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sorted_index import SortedIndex, IndexManager
+
+def markets(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(0, 100, rows).astype(float)
+    price[rng.choice(rows, rows // 10, replace=False)] = np.nan
+    return pd.DataFrame({
+        "current_price": price,
+        "market_cap": rng.permutation(rows).astype(float) * 1e7,
+        "symbol": rng.choice(["btc", "eth"], rows),
+    })
+
+def rows(data, mask):
+    return np.flatnonzero(mask.to_numpy()).tolist()
+
+@pytest.mark.parametrize("text, expected", [
+    ("current_price > 50", lambda data: data["current_price"] > 50),
+    ("current_price >= 50", lambda data: data["current_price"] >= 50),
+    ("current_price < 10", lambda data: data["current_price"] < 10),
+    ("current_price = 42", lambda data: data["current_price"] == 42),
+    ("current_price 20..30", lambda data: data["current_price"].between(20, 30)),
+    ("current_price > 50 y market_cap <= 2e9", lambda data: (data["current_price"] > 50) & (data["market_cap"] <= 2e9)),
+    ("market_cap 1e9..3e9, current_price < 90", lambda data: data["market_cap"].between(1e9, 3e9) & (data["current_price"] < 90)),
+])
+def test_query_matches_boolean_mask(text, expected):
+    data = markets()
+    manager = IndexManager(data)
+    assert manager.query(IndexManager.parse(text)).tolist() == rows(data, expected(data))
+
+def test_top_and_bottom():
+    data = markets()
+    manager = IndexManager(data)
+    top = manager.query(IndexManager.parse("top 10 market_cap"))
+    assert sorted(top.tolist()) == sorted(data["market_cap"].nlargest(10).index.tolist())
+    bottom = manager.query(IndexManager.parse("bottom 5 market_cap"))
+    assert sorted(bottom.tolist()) == sorted(data["market_cap"].nsmallest(5).index.tolist())
+
+def test_top_combined_with_range():
+    data = markets()
+    manager = IndexManager(data)
+    positions = manager.query(IndexManager.parse("top 50 market_cap and current_price > 50"))
+    largest = set(data["market_cap"].nlargest(50).index)
+    expected = [row for row in rows(data, data["current_price"] > 50) if row in largest]
+    assert positions.tolist() == expected
+
+def test_index_counts_and_skips_nulls():
+    index = SortedIndex(pd.Series([3.0, np.nan, 1.0, 2.0, 2.0]))
+    assert len(index) == 4
+    assert index.count(2, 3) == 3
+    assert index.count(2, 3, include_low=False) == 1
+    assert index.range(None, 2).tolist() == [2, 3, 4]
+    assert index.top(1).tolist() == [0]
+    assert index.matches(np.array([0, 1, 2]), low=1).tolist() == [True, False, True]
+
+def test_indexes_are_lazy_and_reset():
+    data = markets()
+    manager = IndexManager(data)
+    assert manager.built() == []
+    manager.query(IndexManager.parse("current_price > 1"))
+    assert manager.built() == ["current_price"]
+    manager.reset(data.head(10))
+    assert manager.built() == []
+    assert manager.query([]).tolist() == list(range(10))
+
+@pytest.mark.parametrize("text", ["current_price ~ 5", "current_price > abc", "current_price > nan"])
+def test_parse_rejects_invalid_conditions(text):
+    with pytest.raises(ValueError):
+        IndexManager.parse(text)
+
+@pytest.mark.parametrize("column", ["missing", "symbol"])
+def test_rejects_unknown_or_text_columns(column):
+    with pytest.raises(ValueError):
+        IndexManager(markets()).query(IndexManager.parse(f"{column} > 1"))
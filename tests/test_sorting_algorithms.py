@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sorting_algorithms import SortingAlgorithms
+from data_processor import DataProcessor
+
+STABLE = {"merge_sort": SortingAlgorithms.merge_sort, "radix_sort": SortingAlgorithms.radix_sort}
+UNSTABLE = {"heap_sort": SortingAlgorithms.heap_sort, "intro_sort": SortingAlgorithms.intro_sort}
+ALGORITHMS = {**STABLE, **UNSTABLE}
+
+def records(values):
+    return [{"value": value, "position": position} for position, value in enumerate(values)]
+
+def positions(result):
+    return [item["position"] for item in result]
+
+def expected_positions(values, ascending=True):
+    # sort_values estable: los iguales conservan su orden original en ambas direcciones
+    return pd.Series(values, dtype=float).sort_values(ascending=ascending, kind="stable", na_position="last").index.tolist()
+
+def inputs():
+    rng = np.random.default_rng(0)
+    return {
+        "empty": [],
+        "single": [7],
+        "duplicates": rng.integers(0, 5, 300).tolist(),
+        "random": rng.integers(-10 ** 6, 10 ** 6, 1000).tolist(),
+        "sorted": list(range(200)),
+        "reversed": list(range(200, 0, -1)),
+        "equal": [3] * 100,
+        "floats": [1.5, -2.25, float("inf"), 0.0, -0.0, float("-inf"), -1e300, 1e-300, 2.0, -2.25],
+    }
+
+@pytest.mark.parametrize("name", sorted(STABLE))
+@pytest.mark.parametrize("case", sorted(inputs()))
+@pytest.mark.parametrize("ascending", [True, False])
+def test_stable_algorithms_match_stable_sort(name, case, ascending):
+    values = inputs()[case]
+    result = STABLE[name](records(values), "value", ascending)
+    assert positions(result) == expected_positions(values, ascending)
+
+@pytest.mark.parametrize("name", sorted(UNSTABLE))
+@pytest.mark.parametrize("case", sorted(inputs()))
+@pytest.mark.parametrize("ascending", [True, False])
+def test_unstable_algorithms_sort_the_values(name, case, ascending):
+    values = inputs()[case]
+    result = UNSTABLE[name](records(values), "value", ascending)
+    assert sorted(positions(result)) == list(range(len(values)))
+    assert [item["value"] for item in result] == sorted(values, reverse=not ascending)
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+def test_input_is_not_modified(name):
+    data = records([3, 1, 2])
+    ALGORITHMS[name](data, "value")
+    assert positions(data) == [0, 1, 2]
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_radix_puts_nan_last(ascending):
+    values = [2.0, float("nan"), -1.0, float("-inf"), float("nan"), 2.0, float("inf"), -0.0, 0.0]
+    result = SortingAlgorithms.radix_sort(records(values), "value", ascending)
+    assert positions(result) == expected_positions(values, ascending)
+
+def test_radix_handles_int64_extremes():
+    values = [2 ** 63 - 1, -2 ** 63, 0, -1, 1, 2 ** 53 + 1, 2 ** 53]
+    result = SortingAlgorithms.radix_sort(records(values), "value")
+    assert [item["value"] for item in result] == sorted(values)
+
+@pytest.mark.parametrize("values", [["eth", "btc", "ada", "btc"], [2 ** 70, 1, -5]])
+def test_radix_falls_back_to_merge_sort(values):
+    result = SortingAlgorithms.radix_sort(records(values), "value")
+    assert positions(result) == sorted(range(len(values)), key=values.__getitem__)
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_intro_sort_heap_fallback(ascending):
+    # Sin profundidad disponible el tramo se ordena por montículo
+    keys = np.random.default_rng(1).integers(0, 50, 500).tolist()
+    order = list(range(len(keys)))
+    SortingAlgorithms._intro_sort_range(order, keys, 0, len(order), 0, ascending)
+    assert [keys[i] for i in order] == sorted(keys, reverse=not ascending)
+
+def test_intro_sort_survives_median_of_three_killer():
+    # Entrada organ-pipe: degrada el quicksort y obliga a usar el montículo
+    n = 2000
+    values = list(range(n // 2)) + list(range(n // 2, 0, -1))
+    result = SortingAlgorithms.intro_sort(records(values), "value")
+    assert [item["value"] for item in result] == sorted(values)
+
+@pytest.mark.parametrize("algorithm", ["Mezcla", "Montículo", "Introsort", "Radix"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["last", "first"])
+def test_nulls_through_data_processor(algorithm, ascending, na_position):
+    rng = np.random.default_rng(2)
+    price = rng.integers(-5, 5, 400).astype(float)
+    price[rng.choice(400, 40, replace=False)] = np.nan
+    price[:3] = [np.inf, -np.inf, -0.0]
+    data = pd.DataFrame({"price": price})
+    result = DataProcessor(data).sort_data("price", algorithm, ascending, na_position=na_position)
+    expected = data.sort_values("price", ascending=ascending, na_position=na_position, kind="stable")
+    if algorithm in ("Mezcla", "Radix"):
+        assert result.index.tolist() == expected.index.tolist()
+    else:
+        pd.testing.assert_series_equal(result["price"].reset_index(drop=True), expected["price"].reset_index(drop=True))
@@ -0,0 +1,16 @@
+from startup_profile import StartupProfile
+
+def test_heavy_modules_are_not_imported_at_startup():
+    imported = {entry["module"].split(".")[0] for entry in StartupProfile.measure_imports()}
+    assert not imported & set(StartupProfile.DEFERRED_MODULES)
+
+def test_deferred_modules_are_measured_after_startup():
+    deferred = StartupProfile.measure_deferred()
+    assert {"numpy", "pandas"} <= set(deferred)
+    assert all(seconds >= 0 for seconds in deferred.values())
+
+def test_report_lists_deferred_loads():
+    lines = []
+    entries = [{"module": "main", "depth": 0, "self_ms": 1.0, "cumulative_ms": 5.0}]
+    assert StartupProfile.report(entries, budget_ms=10, deferred={"numpy": 0.1}, log=lines.append)
+    assert any(line.startswith("Diferido numpy") for line in lines)
@@ -1,8 +1,11 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import ttk, messagebox, filedialog
+from lazy_imports import lazy_import, preload
+from background_worker import BackgroundWorker
+from virtual_table import VirtualTable
+from chart_view import ChartView, mpl_figure, backend_tkagg
+
+pd = lazy_import("pandas")
 
 class UIManager:
     """
@@ -26,6 +29,23 @@ class UIManager:
         self.root.geometry("1200x800")
         self.root.configure(bg="#f0f0f0")
         
+        # Vista previa: filas que se obtienen con top-k antes de ordenar todo el dataset
+        self.preview_rows = 200
+        self.view_data = None
+        self.pending_full_sort = None
+        
+        # Actualización en vivo: criterio del último ordenamiento completo y próxima consulta
+        self.current_sort = None
+        self.live_job = None
+        
+        # Filtro por índices: se aplica un instante después de la última tecla
+        self.filter_delay = 250
+        self.filter_job = None
+        
+        # Ejecutor de tareas en segundo plano para no bloquear la ventana
+        self.worker = BackgroundWorker(self.root)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -58,6 +78,22 @@ class UIManager:
         update_api_button = ttk.Button(api_frame, text="Actualizar Configuración", command=self.update_api_config)
         update_api_button.grid(row=1, column=2, padx=5, pady=5)
         
+        # Descarga de todas las páginas de la API
+        self.all_pages_var = tk.BooleanVar(value=False)
+        all_pages_check = ttk.Checkbutton(api_frame, text="Cargar todas las páginas", variable=self.all_pages_var)
+        all_pages_check.grid(row=0, column=2, padx=5, pady=5)
+        
+        # Actualización en vivo: consulta periódica que reubica solo las filas que cambiaron
+        self.live_var = tk.BooleanVar(value=False)
+        live_check = ttk.Checkbutton(api_frame, text="Actualización en vivo", variable=self.live_var, command=self.toggle_live)
+        live_check.grid(row=2, column=0, padx=5, pady=5)
+        
+        self.live_interval_var = tk.IntVar(value=30)
+        live_interval_label = ttk.Label(api_frame, text="Intervalo (s):")
+        live_interval_label.grid(row=2, column=1, padx=5, pady=5, sticky=tk.E)
+        live_interval_spinbox = ttk.Spinbox(api_frame, from_=5, to=3600, increment=5, textvariable=self.live_interval_var, width=6)
+        live_interval_spinbox.grid(row=2, column=2, padx=5, pady=5, sticky=tk.W)
+        
         # Frame superior para controles
         control_frame = ttk.LabelFrame(main_frame, text="Controles", padding=10)
         control_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -96,29 +132,192 @@ class UIManager:
         sort_button = ttk.Button(control_frame, text="Ordenar Datos", command=self.sort_data)
         sort_button.grid(row=0, column=7, padx=5, pady=5)
         
+        # Vista previa con top-k: el ordenamiento completo se hace al desplazarse más allá
+        self.preview_var = tk.BooleanVar(value=True)
+        preview_check = ttk.Checkbutton(control_frame, text="Vista previa rápida", variable=self.preview_var)
+        preview_check.grid(row=0, column=8, padx=5, pady=5)
+        
+        # Criterios de desempate: columnas adicionales con su propia dirección
+        self.then_column_vars = []
+        self.then_descending_vars = []
+        self.then_column_dropdowns = []
+        for i in range(2):
+            then_label = ttk.Label(control_frame, text="Luego por:")
+            then_label.grid(row=1, column=3 * i, padx=5, pady=5)
+            
+            column_var = tk.StringVar()
+            column_dropdown = ttk.Combobox(control_frame, textvariable=column_var, state="readonly")
+            column_dropdown.grid(row=1, column=3 * i + 1, padx=5, pady=5)
+            
+            descending_var = tk.BooleanVar(value=False)
+            descending_check = ttk.Checkbutton(control_frame, text="Descendente", variable=descending_var)
+            descending_check.grid(row=1, column=3 * i + 2, padx=5, pady=5)
+            
+            self.then_column_vars.append(column_var)
+            self.then_descending_vars.append(descending_var)
+            self.then_column_dropdowns.append(column_dropdown)
+            
+        # Ubicación de los valores nulos
+        na_label = ttk.Label(control_frame, text="Nulos:")
+        na_label.grid(row=1, column=6, padx=5, pady=5)
+        
+        self.na_position_options = {"Al final": "last", "Al inicio": "first"}
+        self.na_position_var = tk.StringVar()
+        self.na_position_dropdown = ttk.Combobox(control_frame, textvariable=self.na_position_var, state="readonly", width=10)
+        self.na_position_dropdown.grid(row=1, column=7, padx=5, pady=5)
+        self.na_position_dropdown["values"] = list(self.na_position_options)
+        self.na_position_dropdown.current(0)
+        
+        # Progreso y cancelación de las tareas en segundo plano
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_bar = ttk.Progressbar(control_frame, variable=self.progress_var, maximum=1.0, length=300)
+        self.progress_bar.grid(row=2, column=0, columnspan=3, padx=5, pady=5, sticky=tk.W + tk.E)
+        
+        self.status_var = tk.StringVar(value="Listo")
+        status_label = ttk.Label(control_frame, textvariable=self.status_var)
+        status_label.grid(row=2, column=3, columnspan=4, padx=5, pady=5, sticky=tk.W)
+        
+        self.cancel_button = ttk.Button(control_frame, text="Cancelar", command=self.cancel_tasks, state=tk.DISABLED)
+        self.cancel_button.grid(row=2, column=7, padx=5, pady=5)
+        
+        # Filtro por rangos de columnas numéricas (por ejemplo "market_cap >= 1e9, current_price < 100")
+        filter_label = ttk.Label(control_frame, text="Filtro:")
+        filter_label.grid(row=3, column=0, padx=5, pady=5)
+        
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(control_frame, textvariable=self.filter_var, width=50)
+        filter_entry.grid(row=3, column=1, columnspan=3, padx=5, pady=5, sticky=tk.W + tk.E)
+        self.filter_var.trace_add("write", self.schedule_filter)
+        
+        self.filter_status_var = tk.StringVar(value="Ej.: market_cap >= 1e9, current_price 1..100, top 10 total_volume")
+        filter_status_label = ttk.Label(control_frame, textvariable=self.filter_status_var)
+        filter_status_label.grid(row=3, column=4, columnspan=4, padx=5, pady=5, sticky=tk.W)
+        
+        # Panel de estadísticas: tiempos por etapa y contadores de la última descarga y ordenamiento
+        stats_frame = ttk.LabelFrame(main_frame, text="Estadísticas", padding=10)
+        stats_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        instrumentation = self.data_processor.instrumentation
+        self.timings_var = tk.BooleanVar(value=instrumentation.enabled)
+        timings_check = ttk.Checkbutton(stats_frame, text="Medir tiempos", variable=self.timings_var, command=self.update_instrumentation)
+        timings_check.grid(row=0, column=0, padx=5, pady=5)
+        
+        self.counters_var = tk.BooleanVar(value=instrumentation.count_operations)
+        counters_check = ttk.Checkbutton(stats_frame, text="Contar operaciones", variable=self.counters_var, command=self.update_instrumentation)
+        counters_check.grid(row=0, column=1, padx=5, pady=5)
+        
+        export_stats_button = ttk.Button(stats_frame, text="Exportar JSON", command=self.export_stats)
+        export_stats_button.grid(row=0, column=2, padx=5, pady=5)
+        
+        self.stats_var = tk.StringVar(value="Active \"Medir tiempos\" para registrar las operaciones.")
+        stats_label = ttk.Label(stats_frame, textvariable=self.stats_var, font="TkFixedFont", justify=tk.LEFT)
+        stats_label.grid(row=1, column=0, columnspan=8, padx=5, pady=5, sticky=tk.W)
+        
         # Frame para tabla de datos
         data_frame = ttk.LabelFrame(main_frame, text="Datos", padding=10)
         data_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Crear treeview para mostrar datos
-        self.tree_frame = ttk.Frame(data_frame)
-        self.tree_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.tree_scroll = ttk.Scrollbar(self.tree_frame)
-        self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.tree = ttk.Treeview(self.tree_frame, yscrollcommand=self.tree_scroll.set)
-        self.tree.pack(fill=tk.BOTH, expand=True)
-        
-        self.tree_scroll.config(command=self.tree.yview)
+        # Crear tabla virtualizada para mostrar datos
+        self.table = VirtualTable(data_frame, on_reach_end=self.load_full_sort)
+        self.table.pack(fill=tk.BOTH, expand=True)
+        self.tree = self.table.tree
         
         # Frame para gráfico
         self.graph_frame = ttk.LabelFrame(main_frame, text="Visualización", padding=10)
         self.graph_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Gráfico persistente: se crea cuando matplotlib termina de cargarse
+        self.chart = None
+        self.chart_placeholder = ttk.Label(self.graph_frame, text="Cargando gráficos...")
+        self.chart_placeholder.pack(expand=True)
+        
         # Configurar selector de columnas después de cargar los datos
         self.column_dropdown.bind("<<ComboboxSelected>>", self.update_graph)
         
+    def load_deferred_modules(self):
+        """Importa pandas y matplotlib en segundo plano una vez que la ventana ya está visible."""
+        def task(context):
+            preload(pd, mpl_figure, backend_tkagg)
+            
+        def on_loaded(result):
+            self.finish_task()
+            self.ensure_chart()
+            if self.data_processor.data is not None:
+                self.update_graph()
+                
+        self.start_task("startup", task, on_loaded, "Cargando módulos...")
+        
+    def ensure_chart(self):
+        """
+        Crea el gráfico persistente si todavía no existe.
+        
+        Returns:
+            ChartView: Gráfico de la aplicación.
+        """
+        if self.chart is None:
+            # Gráfico persistente: se actualiza en el lugar en vez de recrearse
+            self.chart = ChartView(self.graph_frame)
+            self.chart_placeholder.destroy()
+        return self.chart
+        
+    def update_instrumentation(self):
+        """Activa o desactiva la medición de tiempos y los contadores según el panel."""
+        enabled = self.timings_var.get()
+        for instrumentation in (self.data_processor.instrumentation, self.api_handler.instrumentation):
+            instrumentation.enabled = enabled
+            instrumentation.count_operations = enabled and self.counters_var.get()
+        self.update_stats()
+        
+    def update_stats(self):
+        """Muestra en el panel la última descarga y el último ordenamiento medidos."""
+        lines = []
+        fetch = self.api_handler.instrumentation.last("fetch") or self.api_handler.instrumentation.last("fetch_all_pages")
+        if fetch is not None:
+            lines.append(self.format_record("Descarga", fetch))
+        sort = self.data_processor.instrumentation.last("sort")
+        if sort is not None:
+            lines.append(self.format_record("Ordenamiento", sort))
+        refresh = self.data_processor.instrumentation.last("refresh")
+        if refresh is not None and self.live_var.get():
+            lines.append(self.format_record("Actualización", refresh))
+        if not lines:
+            lines.append("Sin mediciones." if self.timings_var.get() else "Active \"Medir tiempos\" para registrar las operaciones.")
+        self.stats_var.set("\n".join(lines))
+        
+    @staticmethod
+    def format_record(title, record):
+        """
+        Resume una medición en una línea.
+        
+        Args:
+            title (str): Título de la operación.
+            record (dict): Medición (ver Instrumentation.records).
+            
+        Returns:
+            str: Resumen con la duración total, la de cada etapa y los contadores.
+        """
+        details = ", ".join(f"{key}: {value}" for key, value in record["details"].items() if key not in ("url", "memory", "auto_reasons", "auto_profile"))
+        parts = [f"{title} ({details}): total {record['total_seconds'] * 1000:.1f} ms"]
+        parts += [f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in record["phases"].items()]
+        counters = record["counters"]
+        if counters is not None:
+            parts.append(f"comparaciones {counters['comparisons']}, intercambios {counters['swaps']}, movimientos {counters['moves']}")
+        return " | ".join(parts)
+        
+    def export_stats(self):
+        """Exporta las mediciones guardadas a un archivo JSON."""
+        path = filedialog.asksaveasfilename(
+            title="Exportar estadísticas", defaultextension=".json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            # main.py comparte la misma instrumentación entre la API y el procesador
+            self.data_processor.instrumentation.export_json(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudieron exportar las estadísticas: {e}")
+            
     def update_api_config(self):
         """Actualiza la configuración de la API con la URL y API key proporcionadas."""
         api_url = self.api_url_var.get().strip()
@@ -133,108 +332,415 @@ class UIManager:
         messagebox.showinfo("Configuración Actualizada", "La configuración de la API ha sido actualizada")
         
     def fetch_data(self):
-        """Obtiene datos de la API y actualiza la interfaz."""
-        data = self.api_handler.fetch_data()
+        """Obtiene datos de la API en segundo plano y actualiza la interfaz al terminar."""
+        all_pages = self.all_pages_var.get()
+        
+        def task(context):
+            if all_pages:
+                return self.api_handler.fetch_all_pages(progress=context.report_progress)
+            return self.api_handler.fetch_data(progress=context.report_progress)
+            
+        # Un ordenamiento o una actualización en vivo en curso quedarían obsoletos con los datos nuevos
+        self.worker.cancel("sort")
+        self.worker.cancel("live")
+        self.start_task("fetch", task, self.on_data_fetched, "Cargando datos...")
+        
+    def on_data_fetched(self, data):
+        """
+        Actualiza la interfaz con los datos obtenidos de la API.
+        
+        Args:
+            data (pandas.DataFrame): Datos obtenidos, o None si hubo un error.
+        """
+        self.finish_task()
         if data is not None:
             # Actualizar el procesador de datos
             self.data_processor.set_data(data)
+            self.pending_full_sort = None
+            self.current_sort = None
             
             # Actualizar el selector de columnas
             numeric_columns = self.api_handler.get_numeric_columns()
             self.column_dropdown["values"] = numeric_columns
             if numeric_columns:
                 self.column_dropdown.current(0)
+                
+            # Los criterios de desempate admiten cualquier columna (por ejemplo el nombre)
+            for column_var, column_dropdown in zip(self.then_column_vars, self.then_column_dropdowns):
+                column_dropdown["values"] = [""] + [str(column) for column in data.columns]
+                column_var.set("")
             
             # Actualizar la tabla de datos
             self.update_table(data)
+            self.update_stats()
             
             # Actualizar el gráfico
             self.update_graph()
+            self.reapply_filter()
             
             messagebox.showinfo("Éxito", "Datos cargados correctamente")
         else:
             messagebox.showerror("Error", "No se pudieron cargar los datos")
             
     def sort_data(self):
-        """Ordena los datos según las selecciones del usuario."""
+        """Ordena los datos en segundo plano según las selecciones del usuario."""
         column = self.column_var.get()
         algorithm = self.algorithm_var.get()
         ascending = self.direction_var.get()
+        na_position = self.na_position_options[self.na_position_var.get()]
         
         if not column:
             messagebox.showerror("Error", "Seleccione una columna para ordenar")
             return
             
-        sorted_data = self.data_processor.sort_data(column, algorithm, ascending)
+        # Agregar los criterios de desempate seleccionados
+        columns = [column]
+        directions = [ascending]
+        for column_var, descending_var in zip(self.then_column_vars, self.then_descending_vars):
+            then_column = column_var.get()
+            if then_column and then_column not in columns:
+                columns.append(then_column)
+                directions.append(not descending_var.get())
+                
+        # La actualización en vivo en curso usa el criterio anterior
+        self.worker.cancel("live")
+        data = self.data_processor.data
+        if self.preview_var.get() and data is not None and len(data) > self.preview_rows:
+            self.sort_preview(columns, algorithm, directions, na_position)
+        else:
+            self.run_full_sort(columns, algorithm, directions, na_position)
+            
+    def sort_preview(self, columns, algorithm, directions, na_position):
+        """
+        Muestra las primeras filas del orden pedido usando top-k, sin ordenar todo el dataset.
+        
+        El ordenamiento completo con el algoritmo elegido queda pendiente hasta que
+        el usuario se desplace más allá de las filas de la vista previa.
+        
+        Args:
+            columns (list): Columnas por las cuales ordenar.
+            algorithm (str): Algoritmo para el ordenamiento completo.
+            directions (list): Dirección de cada columna.
+            na_position (str): "last" o "first".
+        """
+        def task(context):
+            context.report_progress(0, "Calculando vista previa")
+            return self.data_processor.top_k(columns, self.preview_rows, directions, na_position)
+            
+        def on_preview(preview):
+            self.finish_task(f"Vista previa de {len(preview)} filas: desplácese al final para ordenar todo")
+            self.pending_full_sort = (columns, algorithm, directions, na_position)
+            # La actualización en vivo ordena con el criterio de la vista previa
+            self.current_sort = (columns, algorithm, directions, na_position)
+            self.update_table(preview)
+            self.update_graph()
+            
+        self.pending_full_sort = None
+        self.start_task("sort", task, on_preview, "Calculando vista previa...")
+        
+    def load_full_sort(self):
+        """Ejecuta el ordenamiento completo pendiente cuando el usuario pasa la vista previa."""
+        if self.pending_full_sort is None or self.worker.is_busy("sort"):
+            return
+        self.worker.cancel("live")
+        columns, algorithm, directions, na_position = self.pending_full_sort
+        self.run_full_sort(columns, algorithm, directions, na_position, keep_position=True)
+        
+    def run_full_sort(self, columns, algorithm, directions, na_position, keep_position=False):
+        """
+        Ordena todo el dataset en segundo plano con el algoritmo elegido.
+        
+        Args:
+            columns (list): Columnas por las cuales ordenar.
+            algorithm (str): Algoritmo a utilizar.
+            directions (list): Dirección de cada columna.
+            na_position (str): "last" o "first".
+            keep_position (bool): True para conservar la posición de la tabla.
+        """
+        def task(context):
+            return self.data_processor.sort_data(
+                columns, algorithm, directions,
+                progress=context.report_progress, na_position=na_position
+            )
+            
+        def on_sorted(sorted_data):
+            self.finish_task()
+            self.pending_full_sort = None
+            if sorted_data is not None:
+                self.current_sort = (columns, algorithm, directions, na_position)
+                self.update_table(sorted_data, keep_position=keep_position)
+                self.update_graph()
+                self.update_stats()
+                self.reapply_filter()
+                decision = self.data_processor.last_auto_decision
+                if algorithm == "Auto" and decision is not None:
+                    reasons = "\n".join(f"- {reason}" for reason in decision["reasons"])
+                    messagebox.showinfo("Éxito", f"Datos ordenados usando algoritmo '{decision['algorithm']}' (Auto):\n{reasons}")
+                else:
+                    messagebox.showinfo("Éxito", f"Datos ordenados usando algoritmo '{algorithm}'")
+                
+        self.start_task("sort", task, on_sorted, f"Ordenando con '{algorithm}'...")
+        
+    def toggle_live(self):
+        """Activa o desactiva la actualización en vivo."""
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+            self.live_job = None
+        if self.live_var.get():
+            self.schedule_live()
+            
+    def schedule_live(self):
+        """Programa la próxima consulta de la actualización en vivo."""
+        try:
+            interval = max(int(self.live_interval_var.get()), 1)
+        except (tk.TclError, ValueError):
+            interval = 30
+        self.live_job = self.root.after(interval * 1000, self.live_tick)
+        
+    def live_tick(self):
+        """Vuelve a consultar la API y aplica la nueva instantánea sobre el orden actual."""
+        self.live_job = None
+        if not self.live_var.get():
+            return
+        self.schedule_live()
+        
+        # No interrumpir una descarga u ordenamiento iniciado por el usuario
+        if self.worker.is_busy() or self.data_processor.data is None:
+            return
+            
+        current_sort = self.current_sort
+        processor = self.data_processor
+        
+        def task(context):
+            # La caché no debe ocultar los cambios: se revalida siempre con la API
+            data = self.api_handler.fetch_data(progress=context.report_progress, revalidate=True)
+            if data is None or current_sort is None:
+                return current_sort, data, None
+                
+            # Solo se calcula el nuevo orden: el procesador se actualiza en on_live_data
+            columns, algorithm, directions, na_position = current_sort
+            context.report_progress(None, "Reubicando filas modificadas")
+            try:
+                plan = processor.plan_refresh(data, columns, directions, na_position)
+            except ValueError as e:
+                # Sin ids únicos no se pueden emparejar las filas: ordenar todo
+                print(f"Actualización incremental no disponible: {e}")
+                plan = processor.plan_sort(data, columns, algorithm, directions, na_position)
+            return current_sort, data, plan
+            
+        self.start_task("live", task, self.on_live_data, "Actualizando datos...")
+        
+    def on_live_data(self, result):
+        """
+        Aplica y muestra una instantánea obtenida por la actualización en vivo.
+        
+        Args:
+            result (tuple): (criterio de ordenamiento usado, datos nuevos, actualización
+                calculada por DataProcessor o None si no había ordenamiento activo).
+        """
+        current_sort, data, plan = result
+        if data is None:
+            self.finish_task("La actualización en vivo no pudo obtener datos")
+            return
+        if current_sort != self.current_sort:
+            # El usuario cambió el ordenamiento mientras se descargaban los datos
+            self.finish_task()
+            return
+            
+        sorted_data = changes = None
+        try:
+            if plan is None:
+                self.data_processor.set_data(data)
+            else:
+                sorted_data, changes = self.data_processor.apply_refresh(plan)
+        except ValueError as e:
+            self.finish_task(f"Actualización descartada: {e}")
+            return
         if sorted_data is not None:
-            self.update_table(sorted_data)
+            # La vista muestra el orden completo: ya no hay vista previa pendiente
+            self.pending_full_sort = None
+            
+        if self.filter_var.get().strip():
+            # Con un filtro activo se muestran solo las filas que lo cumplen en la nueva instantánea
+            self.apply_filter()
+            self.finish_task(f"Datos actualizados: {len(data)} filas")
+        elif sorted_data is None:
+            # Sin ordenamiento activo se muestra la instantánea tal como llega
+            self.update_table(data, keep_position=True)
+            self.update_graph()
+            self.finish_task(f"Datos actualizados: {len(data)} filas")
+        elif changes is None:
+            self.update_table(sorted_data, keep_position=True)
             self.update_graph()
-            messagebox.showinfo("Éxito", f"Datos ordenados usando algoritmo '{algorithm}'")
+            self.finish_task(f"Datos actualizados y reordenados: {len(sorted_data)} filas")
+        else:
+            # Solo se redibujan las filas que cambiaron de lugar o de valores
+            rows = changes["rows"]
+            self.view_data = sorted_data
+            self.table.replace_data(sorted_data, rows)
+            if any(row < 20 for row in rows):
+                self.update_graph()
+            self.finish_task(
+                f"Datos actualizados: {len(changes['added'])} nuevas, {len(changes['removed'])} eliminadas, "
+                f"{len(changes['moved'])} reubicadas"
+            )
+        self.update_stats()
+        
+    def schedule_filter(self, *args):
+        """Programa la aplicación del filtro para cuando el usuario deje de escribir."""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(self.filter_delay, self.apply_filter)
+        
+    def reapply_filter(self):
+        """Vuelve a aplicar el filtro escrito (por ejemplo, sobre datos nuevos u ordenados)."""
+        if self.filter_var.get().strip():
+            self.apply_filter()
             
-    def update_table(self, dataframe):
+    def apply_filter(self):
+        """Muestra las filas que cumplen el filtro, o todas si está vacío."""
+        self.filter_job = None
+        text = self.filter_var.get().strip()
+        data = self.data_processor.data
+        if data is None:
+            return
+            
+        if not text:
+            self.update_table(self.data_processor.get_data())
+            self.update_graph()
+            self.filter_status_var.set(f"{len(data)} filas")
+            return
+            
+        try:
+            filtered = self.data_processor.filter_data(text)
+        except ValueError as e:
+            # El usuario puede estar a mitad de escribir: se informa sin interrumpir
+            self.filter_status_var.set(str(e))
+            return
+            
+        self.update_table(filtered)
+        self.update_graph()
+        self.filter_status_var.set(f"{len(filtered)} de {len(data)} filas")
+        
+    def start_task(self, channel, task, on_success, status):
         """
-        Actualiza la tabla con los datos proporcionados.
+        Envía una tarea al ejecutor en segundo plano y actualiza los indicadores de progreso.
         
         Args:
-            dataframe (pandas.DataFrame): Datos a mostrar en la tabla.
+            channel (str): Canal de la tarea; una tarea nueva reemplaza a la anterior del mismo canal.
+            task (callable): Función a ejecutar; recibe el contexto de la tarea.
+            on_success (callable): Se llama con el resultado en el hilo de la interfaz.
+            status (str): Mensaje a mostrar mientras la tarea se ejecuta.
         """
-        # Limpiar tabla existente
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.status_var.set(status)
+        self.progress_var.set(0)
+        self.progress_bar.configure(mode="determinate")
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.worker.submit(
+            channel, task, on_success,
+            on_error=self.on_task_error,
+            on_progress=self.on_task_progress
+        )
+        
+    def finish_task(self, status="Listo"):
+        """
+        Restablece los indicadores de progreso si no quedan tareas activas.
+        
+        Args:
+            status (str): Mensaje a mostrar.
+        """
+        if self.worker.is_busy():
+            return
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate")
+        self.progress_var.set(0)
+        self.status_var.set(status)
+        self.cancel_button.configure(state=tk.DISABLED)
+        
+    def on_task_progress(self, fraction, message):
+        """
+        Muestra el progreso informado por una tarea.
+        
+        Args:
+            fraction (float): Progreso entre 0 y 1, o None si no se conoce.
+            message (str): Descripción de la etapa actual.
+        """
+        if fraction is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.configure(mode="indeterminate")
+                self.progress_bar.start(10)
+        else:
+            self.progress_var.set(fraction)
+        if message:
+            self.status_var.set(message)
             
-        # Configurar columnas
-        self.tree["columns"] = list(dataframe.columns)
-        self.tree["show"] = "headings"
+    def on_task_error(self, error):
+        """
+        Informa un error ocurrido en una tarea en segundo plano.
         
-        for column in dataframe.columns:
-            self.tree.heading(column, text=column)
-            # Ajustar ancho de columna
-            col_width = max(50, len(str(column)) * 10)
-            self.tree.column(column, width=col_width)
+        Args:
+            error (Exception): Excepción lanzada por la tarea.
+        """
+        self.finish_task()
+        messagebox.showerror("Error", f"La operación falló: {error}")
+        
+    def cancel_tasks(self):
+        """Cancela las tareas en curso."""
+        self.worker.cancel()
+        self.finish_task("Operación cancelada")
             
-        # Insertar datos
-        for _, row in dataframe.head(50).iterrows():  # Mostrar solo las primeras 50 filas para mejorar rendimiento
-            self.tree.insert("", tk.END, values=list(row))
+    def update_table(self, dataframe, keep_position=False):
+        """
+        Actualiza la tabla con los datos proporcionados.
+        
+        Args:
+            dataframe (pandas.DataFrame): Datos a mostrar en la tabla.
+            keep_position (bool): True para conservar la posición de desplazamiento.
+        """
+        # La tabla y el gráfico muestran los mismos datos (vista previa u ordenamiento completo)
+        self.view_data = dataframe
+        
+        # La tabla virtualizada solo materializa las filas visibles
+        self.table.set_data(dataframe, keep_position=keep_position)
             
     def update_graph(self, event=None):
         """Actualiza el gráfico basado en la columna seleccionada."""
-        # Limpiar gráfico existente
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
-            
+        data = self.view_data if self.view_data is not None else self.data_processor.get_data()
         column = self.column_var.get()
-        if not column or self.data_processor.get_data() is None:
+        if not column or data is None:
+            if self.chart is not None:
+                self.chart.clear()
             return
             
-        data = self.data_processor.get_data()
-        
-        # Crear figura y agregar subgráfico
-        fig, ax = plt.subplots(figsize=(10, 5))
-        
-        # Limitar a los primeros 30 registros para mejor visualización
+        # Limitar a los primeros 20 registros para mejor visualización
         display_data = data.head(20)
         
-        # Determinar el tipo de gráfico según los datos
+        # Si hay una columna de nombres, usarla como etiqueta
         if "name" in data.columns:
-            # Si hay una columna de nombres, usarla como etiqueta
-            ax.bar(display_data["name"], display_data[column])
-            plt.xticks(rotation=45, ha="right")
+            labels = display_data["name"].tolist()
         else:
-            # Usar índices como etiquetas
-            ax.bar(range(len(display_data)), display_data[column])
-            ax.set_xticks(range(len(display_data)))
-            ax.set_xticklabels([f"Item {i+1}" for i in range(len(display_data))])
-            plt.xticks(rotation=45, ha="right")
+            labels = [f"Item {i+1}" for i in range(len(display_data))]
             
-        ax.set_title(f"Visualización de la columna '{column}'")
-        ax.set_ylabel(column)
-        plt.tight_layout()
-        
-        # Agregar gráfico a la interfaz
-        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.ensure_chart().update(
+            labels,
+            pd.to_numeric(display_data[column], errors="coerce").to_numpy(),
+            title=f"Visualización de la columna '{column}'",
+            ylabel=column
+        )
             
+    def close(self):
+        """Cancela las tareas pendientes y cierra la ventana."""
+        for job in (self.live_job, self.filter_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self.worker.shutdown()
+        self.data_processor.shutdown()
+        if self.chart is not None:
+            self.chart.close()
+        self.root.destroy()
+        
     def run(self):
         """Ejecuta el bucle principal de la aplicación."""
+        # Los módulos pesados se cargan después de que la ventana se dibuje
+        self.root.after_idle(self.load_deferred_modules)
         self.root.mainloop()
\ No newline at end of file
@@ -0,0 +1,244 @@
+import tkinter as tk
+from tkinter import ttk
+
+class VirtualTable:
+    """
+    Tabla virtualizada sobre un ttk.Treeview.
+    
+    Solo se materializan las filas visibles (más un pequeño margen) y, al
+    desplazarse, se reutilizan los mismos elementos del Treeview cambiando sus
+    valores, que se leen directamente de los arreglos de cada columna. El costo
+    de redibujar depende del alto de la ventana y no de la cantidad de filas.
+    """
+    
+    def __init__(self, parent, buffer_rows=5, on_reach_end=None):
+        """
+        Inicializa la tabla virtualizada.
+        
+        Args:
+            parent: Widget contenedor.
+            buffer_rows (int): Filas adicionales materializadas por debajo de las visibles.
+            on_reach_end (callable, optional): Se llama cuando el usuario intenta desplazarse
+                más allá de la última fila (por ejemplo, para cargar más datos).
+        """
+        self.buffer_rows = buffer_rows
+        self.on_reach_end = on_reach_end
+        
+        self.frame = ttk.Frame(parent)
+        
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree = ttk.Treeview(self.frame, show="headings")
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        
+        self._column_names = []
+        self._columns = []
+        self._row_count = 0
+        self._first_row = 0
+        self._visible_rows = 1
+        self._items = []
+        
+        # Todo desplazamiento pasa por la tabla virtual, nunca por el Treeview
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_by(3))
+        self.tree.bind("<Prior>", lambda event: self._scroll_by(-self._visible_rows))
+        self.tree.bind("<Next>", lambda event: self._scroll_by(self._visible_rows))
+        self.tree.bind("<Up>", lambda event: self._scroll_by(-1))
+        self.tree.bind("<Down>", lambda event: self._scroll_by(1))
+        
+    def pack(self, **kwargs):
+        """
+        Ubica la tabla en su contenedor.
+        
+        Args:
+            **kwargs: Opciones de pack.
+        """
+        self.frame.pack(**kwargs)
+        
+    @property
+    def row_count(self):
+        """
+        Cantidad total de filas de la tabla.
+        
+        Returns:
+            int: Cantidad de filas.
+        """
+        return self._row_count
+        
+    @property
+    def first_row(self):
+        """
+        Primera fila visible.
+        
+        Returns:
+            int: Posición de la primera fila visible.
+        """
+        return self._first_row
+        
+    def set_data(self, dataframe, keep_position=False):
+        """
+        Establece el dataset a mostrar.
+        
+        Args:
+            dataframe (pandas.DataFrame): Datos a mostrar.
+            keep_position (bool): True para conservar la posición de desplazamiento.
+        """
+        column_names = [str(column) for column in dataframe.columns]
+        
+        # Reconfigurar encabezados solo si cambiaron las columnas
+        if column_names != self._column_names:
+            self.tree["columns"] = column_names
+            for column in column_names:
+                self.tree.heading(column, text=column)
+                # Ajustar ancho de columna
+                col_width = max(50, len(column) * 10)
+                self.tree.column(column, width=col_width)
+            self._column_names = column_names
+            
+        self._columns = [dataframe[column].to_numpy() for column in dataframe.columns]
+        self._row_count = len(dataframe)
+        if not keep_position:
+            self._first_row = 0
+            
+        self._sync_items()
+        self.scroll_to(self._first_row)
+        
+    def replace_data(self, dataframe, rows):
+        """
+        Reemplaza el dataset redibujando solo las filas indicadas.
+        
+        Si cambió la cantidad de filas o las columnas se recarga la ventana
+        visible completa, conservando la posición de desplazamiento.
+        
+        Args:
+            dataframe (pandas.DataFrame): Nuevos datos a mostrar.
+            rows (iterable): Posiciones cuyos valores cambiaron.
+        """
+        column_names = [str(column) for column in dataframe.columns]
+        if column_names != self._column_names or len(dataframe) != self._row_count:
+            self.set_data(dataframe, keep_position=True)
+            return
+            
+        self._columns = [dataframe[column].to_numpy() for column in dataframe.columns]
+        self.refresh_rows(rows)
+        
+    def scroll_to(self, row):
+        """
+        Desplaza la tabla para que la fila indicada sea la primera visible.
+        
+        Args:
+            row (int): Posición de la fila.
+        """
+        last_first = max(self._row_count - self._visible_rows, 0)
+        self._first_row = min(max(int(row), 0), last_first)
+        self._redraw()
+        
+    def yview(self, *args):
+        """
+        Atiende los comandos de la barra de desplazamiento.
+        
+        Args:
+            *args: ("moveto", fracción) o ("scroll", cantidad, "units"|"pages").
+        """
+        if not args:
+            return
+        if args[0] == "moveto":
+            row = float(args[1]) * self._row_count
+            if row + self._visible_rows >= self._row_count and self.on_reach_end:
+                self.on_reach_end()
+            self.scroll_to(row)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._visible_rows
+            self._scroll_by(amount)
+            
+    def refresh_rows(self, rows=None):
+        """
+        Vuelve a leer los valores de las filas materializadas.
+        
+        Args:
+            rows (iterable, optional): Posiciones a refrescar. Por defecto todas las visibles.
+        """
+        if rows is None:
+            self._redraw()
+            return
+        for row in rows:
+            offset = row - self._first_row
+            if 0 <= offset < len(self._items) and row < self._row_count:
+                self.tree.item(self._items[offset], values=[column[row] for column in self._columns])
+                
+    def _scroll_by(self, amount):
+        """
+        Desplaza la tabla una cantidad de filas.
+        
+        Args:
+            amount (int): Filas a desplazar (negativo hacia arriba).
+            
+        Returns:
+            str: "break" para que el Treeview no procese el evento.
+        """
+        last_first = max(self._row_count - self._visible_rows, 0)
+        if amount > 0 and self._first_row + amount > last_first and self.on_reach_end:
+            self.on_reach_end()
+        self.scroll_to(self._first_row + amount)
+        return "break"
+        
+    def _on_mousewheel(self, event):
+        """
+        Desplaza la tabla con la rueda del mouse.
+        
+        Args:
+            event: Evento de Tk.
+            
+        Returns:
+            str: "break" para que el Treeview no procese el evento.
+        """
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+        
+    def _on_resize(self, event):
+        """
+        Recalcula la cantidad de filas visibles al cambiar el tamaño de la tabla.
+        
+        Args:
+            event: Evento de Tk.
+        """
+        style = ttk.Style(self.tree)
+        row_height = int(style.lookup("Treeview", "rowheight") or 20)
+        # Descontar el alto del encabezado
+        visible_rows = max((event.height - row_height) // row_height, 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._sync_items()
+            self.scroll_to(self._first_row)
+            
+    def _sync_items(self):
+        """Ajusta la cantidad de elementos del Treeview a las filas visibles más el margen."""
+        needed = min(self._visible_rows + self.buffer_rows, self._row_count)
+        
+        while len(self._items) < needed:
+            self._items.append(self.tree.insert("", tk.END, values=()))
+        while len(self._items) > needed:
+            self.tree.delete(self._items.pop())
+            
+    def _redraw(self):
+        """Carga en los elementos del Treeview los valores de la ventana visible."""
+        first = self._first_row
+        columns = self._columns
+        
+        for offset, item in enumerate(self._items):
+            row = first + offset
+            # Las filas de margen que pasan el final del dataset quedan vacías
+            values = [column[row] for column in columns] if row < self._row_count else ()
+            self.tree.item(item, values=values)
+            
+        # Mantener el Treeview siempre en su primer elemento
+        self.tree.yview_moveto(0)
+        
+        if self._row_count:
+            self.scrollbar.set(first / self._row_count, min((first + self._visible_rows) / self._row_count, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)